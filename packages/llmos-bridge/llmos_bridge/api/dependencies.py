@@ -14,7 +14,7 @@ from llmos_bridge.config import Settings, get_settings
 from llmos_bridge.modules.registry import ModuleRegistry
 from llmos_bridge.orchestration.approval import ApprovalGate
 from llmos_bridge.orchestration.executor import PlanExecutor
-from llmos_bridge.orchestration.state import PlanStateStore
+from llmos_bridge.orchestration.state import BaseStateStore
 from llmos_bridge.protocol.constants import HEADER_API_TOKEN
 from llmos_bridge.security.audit import AuditLogger
 from llmos_bridge.security.guard import PermissionGuard
@@ -24,7 +24,7 @@ def get_module_registry(request: Request) -> ModuleRegistry:
     return request.app.state.module_registry  # type: ignore[no-any-return]
 
 
-def get_state_store(request: Request) -> PlanStateStore:
+def get_state_store(request: Request) -> BaseStateStore:
     return request.app.state.state_store  # type: ignore[no-any-return]
 
 
@@ -80,7 +80,7 @@ async def verify_api_token(
 
 # Shorthand type aliases for route signatures.
 RegistryDep = Annotated[ModuleRegistry, Depends(get_module_registry)]
-StateStoreDep = Annotated[PlanStateStore, Depends(get_state_store)]
+StateStoreDep = Annotated[BaseStateStore, Depends(get_state_store)]
 GuardDep = Annotated[PermissionGuard, Depends(get_permission_guard)]
 AuditDep = Annotated[AuditLogger, Depends(get_audit_logger)]
 ExecutorDep = Annotated[PlanExecutor, Depends(get_plan_executor)]
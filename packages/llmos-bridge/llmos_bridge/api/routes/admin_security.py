@@ -311,11 +311,11 @@ async def clear_intent_verifier_cache(
     request: Request,
     _auth: AuthDep,
 ) -> dict[str, Any]:
-    """Clear the intent verifier LRU cache."""
+    """Clear the intent verifier LRU cache and its shared backend."""
     verifier = getattr(request.app.state, "intent_verifier", None)
     if verifier is None:
         raise HTTPException(status_code=404, detail="Intent verifier not configured")
-    verifier.clear_cache()
+    await verifier.clear_shared_cache()
     return {"cleared": True}
 
 
@@ -341,6 +341,11 @@ def _get_heuristic_scanner(request: Request):
     return heuristic
 
 
+def _invalidate_scan_cache(request: Request) -> None:
+    """Drop cached scan results — they were computed with the old rule set."""
+    request.app.state.scanner_pipeline.clear_cache()
+
+
 @router.get("/scanners/patterns")
 async def list_patterns(
     request: Request,
@@ -373,6 +378,7 @@ async def enable_pattern(
     found = heuristic.enable_pattern(pattern_id)
     if not found:
         raise HTTPException(status_code=404, detail=f"Pattern '{pattern_id}' not found")
+    _invalidate_scan_cache(request)
     return {"id": pattern_id, "enabled": True}
 
 
@@ -387,6 +393,7 @@ async def disable_pattern(
     found = heuristic.disable_pattern(pattern_id)
     if not found:
         raise HTTPException(status_code=404, detail=f"Pattern '{pattern_id}' not found")
+    _invalidate_scan_cache(request)
     return {"id": pattern_id, "enabled": False}
 
 
@@ -426,4 +433,5 @@ async def add_pattern(
         description=body.description,
     )
     heuristic.add_pattern(rule)
+    _invalidate_scan_cache(request)
     return {"id": body.id, "added": True}
@@ -79,6 +79,31 @@ async def get_events(
     return {"events": recent, "count": len(recent)}
 
 
+@router.get("/system/events/listeners")
+async def get_event_listeners(
+    _auth: AuthDep,
+    request: Request,
+) -> dict[str, Any]:
+    """Per-listener queue depth, drops and lag (queued dispatch mode)."""
+    bus = getattr(request.app.state, "event_bus", None)
+    if bus is None:
+        return {"listeners": [], "count": 0}
+    stats = bus.listener_stats()
+    return {"listeners": stats, "count": len(stats)}
+
+
+@router.get("/system/events/redis")
+async def get_redis_publisher_status(
+    _auth: AuthDep,
+    request: Request,
+) -> dict[str, Any]:
+    """Redis Streams publisher counters, batch sizes and flush latency."""
+    redis_bus = getattr(request.app.state, "redis_bus", None)
+    if redis_bus is None:
+        return {"enabled": False}
+    return {"enabled": True, **redis_bus.status()}
+
+
 @router.get("/system/policies")
 async def get_policies(
     _auth: AuthDep,
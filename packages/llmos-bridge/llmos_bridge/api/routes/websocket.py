@@ -70,6 +70,12 @@ class ConnectionManager:
             connections.remove(websocket)
         log.debug("ws_disconnected", plan_id=plan_id)
 
+    def has_subscribers(self, plan_id: str | None = None) -> bool:
+        """True when :meth:`broadcast` for *plan_id* would reach any connection."""
+        if plan_id and self._connections.get(plan_id):
+            return True
+        return bool(self._connections.get("__all__"))
+
     async def broadcast(self, message: WSMessage, plan_id: str | None = None) -> None:
         """Send *message* to all connections subscribed to *plan_id*."""
         targets: list[WebSocket] = []
@@ -116,11 +122,13 @@ class WebSocketEventBus(EventBus):
 
     async def emit(self, topic: str, event: dict[str, Any]) -> None:
         """Broadcast *event* to WebSocket subscribers for the relevant plan."""
-        self._stamp(topic, event)
-        event_type = event.get("event", topic)
-        plan_id = event.get("plan_id")  # None → broadcast to __all__
+        frozen = self._stamp(topic, event)
+        plan_id = frozen.get("plan_id")  # None → broadcast to __all__
+        if not self._manager.has_subscribers(plan_id):
+            return
+        event_type = frozen.get("event", topic)
 
-        msg = WSMessage(type=str(event_type), payload=dict(event))
+        msg = WSMessage(type=str(event_type), payload=frozen)
         try:
             await self._manager.broadcast(msg, plan_id=plan_id)
         except Exception as exc:
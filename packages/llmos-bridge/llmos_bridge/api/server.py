@@ -60,7 +60,11 @@ from llmos_bridge.modules.memory import MemoryModule
 from llmos_bridge.modules.context_manager import ContextManagerModule
 from llmos_bridge.orchestration.executor import PlanExecutor
 from llmos_bridge.orchestration.resource_manager import ResourceManager
-from llmos_bridge.orchestration.state import PlanStateStore
+from llmos_bridge.orchestration.state import (
+    BaseStateStore,
+    InMemoryStateStore,
+    PlanStateStore,
+)
 from llmos_bridge.security.audit import AuditLogger
 from llmos_bridge.security.guard import PermissionGuard
 from llmos_bridge.security.profiles import get_profile_config
@@ -140,7 +144,16 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         _register_builtin_modules(registry, settings)
 
         # Initialise state store.
-        state_store = PlanStateStore(settings.memory.state_db_path)
+        state_store: BaseStateStore
+        if settings.memory.state_backend == "memory":
+            state_store = InMemoryStateStore(max_plans=settings.memory.state_memory_max_plans)
+        else:
+            state_store = PlanStateStore(
+                settings.memory.state_db_path,
+                write_behind=settings.memory.state_write_behind,
+                flush_interval=settings.memory.state_flush_interval_ms / 1000,
+                flush_max_records=settings.memory.state_flush_max_records,
+            )
         await state_store.init()
 
         # Initialise key-value memory store.
@@ -169,7 +182,21 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         from llmos_bridge.events.bus import EventBus as _EventBusABC
 
         ws_bus = WebSocketEventBus(ws_manager)
-        log_bus = LogEventBus(settings.logging.audit_file) if settings.logging.audit_file else None
+        log_bus = (
+            LogEventBus(
+                settings.logging.audit_file,
+                buffered=settings.logging.audit_buffered,
+                flush_interval=settings.logging.audit_flush_interval_ms / 1000,
+                flush_max_events=settings.logging.audit_flush_max_events,
+                max_pending=settings.logging.audit_max_pending,
+                overflow=settings.logging.audit_overflow,
+                fsync=settings.logging.audit_fsync,
+                max_bytes=settings.logging.audit_max_bytes,
+                backup_count=settings.logging.audit_backup_count,
+            )
+            if settings.logging.audit_file
+            else None
+        )
         local_backends: list[_EventBusABC] = [b for b in [log_bus, ws_bus] if b is not None]
         local_bus: _EventBusABC = (
             FanoutEventBus(local_backends) if len(local_backends) > 1 else local_backends[0]
@@ -184,6 +211,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             node_name = settings.redis.node_name or settings.node.node_id
             redis_bus = RedisStreamsBus(
                 settings.redis.url, node_name, settings.redis.max_stream_length,
+                batch=settings.redis.publish_batching,
+                flush_interval=settings.redis.publish_flush_interval_ms / 1000,
+                batch_max_events=settings.redis.publish_batch_max_events,
             )
             await redis_bus.connect()
             event_bus: _EventBusABC = FanoutEventBus([local_bus, redis_bus])
@@ -201,6 +231,14 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         else:
             event_bus = local_bus
 
+        if settings.events.listener_dispatch == "queued":
+            for bus in {id(local_bus): local_bus, id(event_bus): event_bus}.values():
+                bus.configure_listener_dispatch(
+                    "queued",
+                    queue_size=settings.events.listener_queue_size,
+                    overflow=settings.events.listener_overflow,
+                )
+
         audit_logger = AuditLogger(bus=event_bus)
         sanitizer = OutputSanitizer()
 
@@ -585,6 +623,12 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         if settings.node.mode != "standalone":
             routing_config = settings.routing
 
+        result_store = None
+        if settings.server.result_spill_enabled:
+            from llmos_bridge.orchestration.result_store import ResultBlobStore
+
+            result_store = ResultBlobStore(settings.server.result_spill_dir)
+
         executor = PlanExecutor(
             module_registry=registry,
             guard=guard,
@@ -603,6 +647,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             node_registry=node_registry,
             routing_config=routing_config,
             authorization=authorization_guard,
+            scheduling_mode=settings.resources.scheduling_mode,
+            max_parallel_actions=settings.resources.max_parallel_actions,
+            critical_path_scheduling=settings.resources.critical_path_scheduling,
+            result_store=result_store,
         )
 
         # Initialise TriggerDaemon (optional subsystem — disabled by default).
@@ -676,6 +724,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                     purged = await state_store.purge_old_plans(retention_secs)
                     if purged > 0:
                         log.info("auto_purge_completed", plans_purged=purged)
+                    if result_store is not None:
+                        blobs = await _aio.to_thread(result_store.purge, retention_secs)
+                        if blobs > 0:
+                            log.info("auto_purge_blobs", blobs_purged=blobs)
                 except Exception as exc:
                     log.warning("auto_purge_failed", error=str(exc))
 
@@ -723,6 +775,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         app.state.discovery = discovery  # None if standalone
         app.state.node_health_monitor = node_health_monitor  # None if standalone
         app.state.redis_bus = redis_bus  # None if redis.enabled=False
+        app.state.log_bus = log_bus
         app.state.rebroadcaster = rebroadcaster  # None if redis.enabled=False
         app.state.permission_proxy = permission_proxy  # None unless mode="node" + redis
         app.state.load_tracker = executor._load_tracker  # None if standalone
@@ -869,6 +922,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             await app.state.rebroadcaster.stop()
         if hasattr(app.state, "redis_bus") and app.state.redis_bus is not None:
             await app.state.redis_bus.close()
+        if hasattr(app.state, "event_bus"):
+            app.state.event_bus.close_listeners()
+        if hasattr(app.state, "log_bus") and app.state.log_bus is not None:
+            await app.state.log_bus.close()
         if hasattr(app.state, "permission_proxy") and app.state.permission_proxy is not None:
             await app.state.permission_proxy.stop()
         if hasattr(app.state, "identity_store") and app.state.identity_store is not None:
@@ -892,6 +949,12 @@ def _build_intent_verifier(cfg: Any, audit_logger: AuditLogger) -> Any:
     if not cfg.enabled:
         return None
 
+    from llmos_bridge.security.intent_cache import (
+        IntentCacheBackend,
+        RedisIntentCache,
+        ShapeReusePolicy,
+        SQLiteIntentCache,
+    )
     from llmos_bridge.security.intent_verifier import IntentVerifier, ThreatType
     from llmos_bridge.security.prompt_composer import PromptComposer
     from llmos_bridge.security.providers import build_provider
@@ -932,6 +995,21 @@ def _build_intent_verifier(cfg: Any, audit_logger: AuditLogger) -> Any:
     # Build LLM client.
     llm_client = build_provider(cfg)
 
+    # Build shared cache backend and plan-shape reuse policy.
+    cache_backend: IntentCacheBackend | None = None
+    if cfg.cache_backend == "sqlite":
+        cache_backend = SQLiteIntentCache(cfg.cache_db_path)
+    elif cfg.cache_backend == "redis":
+        cache_backend = RedisIntentCache()
+    shape_policy = None
+    if cfg.shape_cache_enabled:
+        shape_policy = ShapeReusePolicy(
+            template_literals=cfg.shape_template_literals,
+            literal_modules=frozenset(cfg.shape_literal_modules),
+            verdicts=frozenset(cfg.shape_reuse_verdicts),
+            max_risk=cfg.shape_reuse_max_risk,
+        )
+
     # Support custom IntentVerifier subclass.
     verifier_cls = IntentVerifier
     if cfg.custom_verifier_class:
@@ -960,6 +1038,8 @@ def _build_intent_verifier(cfg: Any, audit_logger: AuditLogger) -> Any:
         cache_ttl=cfg.cache_ttl_seconds,
         timeout=cfg.timeout_seconds,
         model=cfg.model,
+        cache_backend=cache_backend,
+        shape_policy=shape_policy,
     )
 
     log.info(
@@ -969,6 +1049,8 @@ def _build_intent_verifier(cfg: Any, audit_logger: AuditLogger) -> Any:
         strict=cfg.strict,
         categories_enabled=len(registry.list_enabled()),
         custom_categories=len(cfg.custom_threat_categories),
+        cache_backend=cfg.cache_backend,
+        shape_cache=cfg.shape_cache_enabled,
     )
 
     return verifier
@@ -1219,6 +1301,10 @@ def _build_scanner_pipeline(
         reject_threshold=cfg.reject_threshold,
         warn_threshold=cfg.warn_threshold,
         enabled=True,
+        cache_size=cfg.scan_cache_size,
+        cache_ttl_seconds=cfg.scan_cache_ttl_seconds,
+        parallel=cfg.parallel,
+        scanner_timeout=cfg.scanner_timeout_seconds,
     )
 
     log.info(
@@ -1227,6 +1313,7 @@ def _build_scanner_pipeline(
         scanners=[s.scanner_id for s in registry.list_all()],
         fail_fast=cfg.fail_fast,
         reject_threshold=cfg.reject_threshold,
+        parallel=cfg.parallel,
     )
 
     return pipeline
@@ -77,6 +77,11 @@ _FILESYSTEM_WRITE_ACTIONS: frozenset[tuple[str, str]] = frozenset(
 )
 
 
+def is_read_action(module_id: str, action_name: str) -> bool:
+    """Return True for pure read actions (safe to cache or run speculatively)."""
+    return (module_id, action_name) in _READ_ACTIONS
+
+
 # ---------------------------------------------------------------------------
 # Cache entry
 # ---------------------------------------------------------------------------
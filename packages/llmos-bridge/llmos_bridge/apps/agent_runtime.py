@@ -20,9 +20,9 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Callable, Awaitable
 
-from .action_cache import ActionSessionCache
+from .action_cache import ActionSessionCache, is_read_action
 from .builtins import BuiltinToolExecutor
-from .context_manager import ContextManager, Message, estimate_tokens
+from .context_manager import ContextManager, Message, Tokenizer, estimate_tokens
 from .expression import ExpressionContext, ExpressionEngine
 from .models import AgentConfig, BrainConfig, LoopConfig, LoopType, OnToolError
 from .tool_registry import AppToolRegistry, ResolvedTool
@@ -119,6 +119,40 @@ class LLMProvider:
         """
         raise NotImplementedError
 
+    async def chat_stream(
+        self,
+        *,
+        system: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        max_tokens: int = 4096,
+        temperature: float | None = None,
+        top_p: float | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a chat request as events.
+
+        Yields, in order:
+            {"type": "text", "text": str}          # text delta
+            {"type": "tool_call", "id": str, "name": str, "arguments": dict}
+                                                   # once the call is complete
+            {"type": "stop", "done": bool}         # last event
+
+        The default wraps ``chat()``; providers that can stream override it.
+        """
+        kwargs: dict[str, Any] = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if top_p is not None:
+            kwargs["top_p"] = top_p
+        response = await self.chat(
+            system=system, messages=messages, tools=tools, max_tokens=max_tokens, **kwargs,
+        )
+        if response.get("text"):
+            yield {"type": "text", "text": response["text"]}
+        for tc in response.get("tool_calls", []):
+            yield {"type": "tool_call", **tc}
+        yield {"type": "stop", "done": response.get("done", False)}
+
     async def close(self) -> None:
         """Release resources."""
         pass
@@ -153,6 +187,7 @@ class AgentRuntime:
         event_callback: Callable[[StreamEvent], Awaitable[None]] | None = None,
         max_actions_per_turn: int = 50,
         max_turns_per_run: int = 0,
+        tokenizer: Tokenizer | None = None,
     ):
         self._config = agent_config
         self._llm = llm
@@ -167,7 +202,10 @@ class AgentRuntime:
         self._max_actions_per_turn = max_actions_per_turn
         self._max_turns_per_run = max_turns_per_run  # 0 = use loop.max_turns only
 
-        self._context_manager = ContextManager(agent_config.loop.context)
+        self._count_tokens: Tokenizer = tokenizer or estimate_tokens
+        self._context_manager = ContextManager(agent_config.loop.context, tokenizer)
+        # (tool defs, their JSON, token cost) for the last tool set sent.
+        self._tools_cost: tuple[list[dict[str, Any]], str, int] | None = None
         self._turns: list[AgentTurn] = []
         self._stopped = False
         self._stream_queue: asyncio.Queue[StreamEvent] | None = None
@@ -195,6 +233,12 @@ class AgentRuntime:
         """
         self._context_module = module
 
+    def set_tokenizer(self, tokenizer: Tokenizer) -> None:
+        """Count tokens with *tokenizer* instead of the ``estimate_tokens`` heuristic."""
+        self._count_tokens = tokenizer
+        self._context_manager.set_tokenizer(tokenizer)
+        self._tools_cost = None
+
     @property
     def turns(self) -> list[AgentTurn]:
         """All completed turns."""
@@ -277,27 +321,41 @@ class AgentRuntime:
         # Build tools in OpenAI format for LLM
         tool_defs = self._build_tool_defs()
 
+        # Read-only tool calls started while the response is still streaming
+        # (loop.pipeline_tools), keyed by tool call id.
+        speculative: dict[str, asyncio.Task[ToolCallResult]] = {}
+
         try:
             for turn_num in range(1, max_turns + 1):
                 if self._stopped:
                     stop_reason = "stopped"
                     break
 
+                on_tool_call = (
+                    self._speculator(speculative) if loop_config.pipeline_tools else None
+                )
+
                 # Call LLM
                 try:
-                    response = await self._call_llm(system_prompt, tool_defs)
+                    response = await self._call_llm(system_prompt, tool_defs, on_tool_call)
                 except Exception as e:
                     logger.error("LLM call failed: %s", e)
+                    await self._cancel_speculative(speculative)
                     if loop_config.on_llm_error.value == "retry":
                         retry_config = loop_config.retry
                         retried = False
                         for attempt in range(retry_config.max_attempts):
                             await asyncio.sleep(2 ** attempt)
                             try:
-                                response = await self._call_llm(system_prompt, tool_defs)
+                                if on_tool_call is not None:
+                                    on_tool_call = self._speculator(speculative)
+                                response = await self._call_llm(
+                                    system_prompt, tool_defs, on_tool_call,
+                                )
                                 retried = True
                                 break
                             except Exception:
+                                await self._cancel_speculative(speculative)
                                 continue
                         if not retried:
                             error_msg = str(e)
@@ -353,11 +411,21 @@ class AgentRuntime:
 
                     if len(tool_calls) == 1:
                         # Single tool call — execute directly
-                        result = await self._execute_tool_call(tool_calls[0])
+                        started = speculative.pop(tool_calls[0].id, None)
+                        if started is not None:
+                            result = await started
+                        else:
+                            result = await self._execute_tool_call(tool_calls[0])
                         tool_results.append(result)
                     else:
-                        # Multiple tool calls — execute concurrently
-                        coros = [self._execute_tool_call(tc) for tc in tool_calls]
+                        # Multiple tool calls — execute concurrently, reusing
+                        # any read already started during streaming
+                        coros: list[Awaitable[ToolCallResult]] = []
+                        for tc in tool_calls:
+                            started = speculative.pop(tc.id, None)
+                            coros.append(
+                                started if started is not None else self._execute_tool_call(tc)
+                            )
                         raw_results = await asyncio.gather(*coros, return_exceptions=True)
                         for i, r in enumerate(raw_results):
                             tc = tool_calls[i]
@@ -382,6 +450,8 @@ class AgentRuntime:
                             tc.id, tr.name, tr.output
                         )
 
+                await self._cancel_speculative(speculative)
+
                 # Record turn
                 turn = AgentTurn(
                     turn_number=turn_num,
@@ -415,6 +485,7 @@ class AgentRuntime:
             logger.exception("Agent runtime error")
             error_msg = str(e)
             stop_reason = "error"
+            await self._cancel_speculative(speculative)
 
         duration_ms = (time.monotonic() - start_time) * 1000
 
@@ -514,11 +585,27 @@ class AgentRuntime:
             })
         return result
 
+    def _tool_defs_cost(self, tools: list[dict[str, Any]]) -> tuple[str, int]:
+        """Return the JSON and token cost of *tools*, cached per tool set."""
+        cached = self._tools_cost
+        if cached is not None and cached[0] is tools:
+            return cached[1], cached[2]
+        tools_json = json.dumps(tools) if tools else ""
+        tools_tokens = self._count_tokens(tools_json)
+        self._tools_cost = (tools, tools_json, tools_tokens)
+        return tools_json, tools_tokens
+
     async def _call_llm(
-        self, system: str, tools: list[dict[str, Any]]
+        self,
+        system: str,
+        tools: list[dict[str, Any]],
+        on_tool_call: Callable[[dict[str, Any]], None] | None = None,
     ) -> dict[str, Any]:
         """Call the LLM with current context.
 
+        With *on_tool_call*, the response is streamed and the hook is called
+        with each tool call as soon as it is complete.
+
         Cognitive context is auto-injected before EVERY call, giving the
         LLM real-time awareness of its objectives and state.
 
@@ -548,13 +635,15 @@ class AgentRuntime:
 
         # Pre-flight token budget check: estimate total and warn if too large.
         # This prevents sending requests that will definitely be rejected.
-        tools_json = json.dumps(tools) if tools else ""
-        system_tokens = estimate_tokens(effective_system)
-        tools_tokens = estimate_tokens(tools_json)
-        messages_tokens = sum(
-            estimate_tokens(json.dumps(m) if isinstance(m, dict) else str(m))
-            for m in messages
-        )
+        # Message costs are cached per message by the ContextManager and the
+        # tool cost per tool set, so this is O(1) per turn.
+        tools_json, tools_tokens = self._tool_defs_cost(tools)
+        if effective_system is system:
+            system_tokens = self._context_manager.system_tokens
+        else:
+            system_tokens = self._count_tokens(effective_system)
+        messages_tokens = self._context_manager.request_tokens
+        history_tokens = self._context_manager.total_tokens
         total_estimated = system_tokens + tools_tokens + messages_tokens
         model_limit = self._config.loop.context.model_context_window
         if total_estimated > model_limit * 0.95:
@@ -567,20 +656,22 @@ class AgentRuntime:
             available_for_messages = int(model_limit * 0.7) - system_tokens - tools_tokens
             if available_for_messages < 0:
                 available_for_messages = int(model_limit * 0.3)
-            trimmed = []
+            history = self._context_manager.messages
+            keep = 0
             running = 0
-            for m in reversed(messages):
-                m_tokens = estimate_tokens(json.dumps(m) if isinstance(m, dict) else str(m))
-                if running + m_tokens > available_for_messages:
+            history_tokens = 0
+            for msg in reversed(history):
+                if running + msg.request_tokens > available_for_messages:
                     break
-                trimmed.insert(0, m)
-                running += m_tokens
-            if len(trimmed) < len(messages):
+                keep += 1
+                running += msg.request_tokens
+                history_tokens += msg.token_estimate
+            if keep < len(messages):
                 logger.info(
                     "Trimmed messages: %d → %d (saved ~%d tokens)",
-                    len(messages), len(trimmed), messages_tokens - running,
+                    len(messages), keep, messages_tokens - running,
                 )
-                messages = trimmed
+                messages = messages[len(messages) - keep:]
 
         # Update context module state and auto-compress if needed
         if self._context_module is not None:
@@ -590,6 +681,7 @@ class AgentRuntime:
                     tools_json=tools_json,
                     cognitive_text=cognitive_text,
                     messages=messages,
+                    history_tokens=history_tokens,
                 )
                 budget = self._context_module.compute_budget()
                 if budget.compression_needed and len(messages) > self._context_module._config.min_recent_messages:
@@ -624,17 +716,85 @@ class AgentRuntime:
             from .providers import filter_params_for_provider
             kwargs = filter_params_for_provider(self._config.brain.provider, kwargs)
 
-        coro = self._llm.chat(
-            system=effective_system,
-            messages=messages,
-            tools=tools,
-            max_tokens=self._config.brain.max_tokens,
+        request: dict[str, Any] = {
+            "system": effective_system,
+            "messages": messages,
+            "tools": tools,
+            "max_tokens": self._config.brain.max_tokens,
             **kwargs,
-        )
+        }
+        if on_tool_call is not None:
+            coro = self._collect_stream(request, on_tool_call)
+        else:
+            coro = self._llm.chat(**request)
         if timeout and timeout > 0:
             return await asyncio.wait_for(coro, timeout=timeout)
         return await coro
 
+    async def _collect_stream(
+        self,
+        request: dict[str, Any],
+        on_tool_call: Callable[[dict[str, Any]], None],
+    ) -> dict[str, Any]:
+        """Drain ``chat_stream()`` into a ``chat()``-shaped response."""
+        text_parts: list[str] = []
+        tool_calls: list[dict[str, Any]] = []
+        done = False
+        async for event in self._llm.chat_stream(**request):
+            kind = event.get("type")
+            if kind == "text":
+                text_parts.append(event.get("text", ""))
+            elif kind == "tool_call":
+                call = {
+                    "id": event.get("id") or str(uuid.uuid4())[:8],
+                    "name": event.get("name", ""),
+                    "arguments": event.get("arguments") or {},
+                }
+                tool_calls.append(call)
+                on_tool_call(call)
+            elif kind == "stop":
+                done = bool(event.get("done", False))
+        return {"text": "".join(text_parts), "tool_calls": tool_calls, "done": done}
+
+    def _speculator(
+        self, started: dict[str, asyncio.Task[ToolCallResult]]
+    ) -> Callable[[dict[str, Any]], None]:
+        """Return an on_tool_call hook that starts read-only calls early.
+
+        Only pure reads (the ActionSessionCache classification) are started
+        before the response is complete, so a response that fails mid-stream
+        and is retried leaves no side effects.  A read is only started while
+        every call before it in the response is a read too, so it never
+        overtakes a write the model issued first; everything else runs once
+        the response is complete, as before.
+        """
+        seen = 0
+        blocked = False
+
+        def on_tool_call(call: dict[str, Any]) -> None:
+            nonlocal seen, blocked
+            seen += 1
+            module_id, _, action_name = call["name"].replace("__", ".").partition(".")
+            if not is_read_action(module_id, action_name):
+                blocked = True
+            if blocked or call["id"] in started or 0 < self._max_actions_per_turn < seen:
+                return
+            tc = ToolCallRequest(id=call["id"], name=call["name"], arguments=call["arguments"])
+            started[tc.id] = asyncio.create_task(self._execute_tool_call(tc))
+
+        return on_tool_call
+
+    @staticmethod
+    async def _cancel_speculative(started: dict[str, asyncio.Task[ToolCallResult]]) -> None:
+        """Cancel started reads whose results will not be used."""
+        if not started:
+            return
+        tasks = list(started.values())
+        started.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _execute_tool_call(self, tc: ToolCallRequest) -> ToolCallResult:
         """Execute a single tool call (builtin or module action)."""
         # Restore original name (replace __ back to .)
@@ -12,6 +12,7 @@ The compiler performs:
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import re
 from pathlib import Path
@@ -20,6 +21,7 @@ from typing import Any
 import yaml
 from pydantic import ValidationError
 
+from .expression import compile_template
 from .models import (
     AgentConfig,
     AppDefinition,
@@ -1213,7 +1215,9 @@ class AppCompiler:
         brackets, and common mistakes.
 
         Emits warnings (via logger) rather than errors for most issues, since
-        expressions may contain dynamic content resolved at runtime.
+        expressions may contain dynamic content resolved at runtime.  Every
+        template string is also compiled here, warming the ExpressionEngine
+        cache so the runtime does not parse it again.
         """
         warnings: list[str] = []
 
@@ -1246,6 +1250,10 @@ class AppCompiler:
                             f"Known filters: {sorted(_KNOWN_FILTERS)}"
                         )
 
+            # Raised again when the expression is evaluated.
+            with contextlib.suppress(ValueError):
+                compile_template(expr)
+
         def _check_all_strings(obj: Any, path: str = "") -> None:
             """Recursively walk the AppDefinition, checking all string fields."""
             if isinstance(obj, str):
@@ -1363,6 +1371,8 @@ class AppCompiler:
             for step in steps:
                 if step.map:
                     names.add(step.map.as_var)
+                    if step.map.reduce is not None:
+                        names.add(step.map.reduce_as)
                     _walk(step.map.step)
                 if step.reduce:
                     names.add(step.reduce.as_var)
@@ -1,7 +1,7 @@
 """Context window manager for agent conversations.
 
 Manages the conversation history within the LLM's context window by:
-- Tracking token usage (estimated)
+- Tracking token usage (estimated once per message, kept as running totals)
 - Applying compression strategies (truncate, summarize, sliding window)
 - Preserving system prompt and recent messages
 - Injecting memory and context on start
@@ -9,12 +9,17 @@ Manages the conversation history within the LLM's context window by:
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable
 from dataclasses import dataclass, field
+import json
 from typing import Any
 
 from .models import ContextConfig, ContextStrategy
 
+# Token counter: text -> token count.  ``estimate_tokens`` unless a real
+# tokenizer is plugged in.
+Tokenizer = Callable[[str], int]
+
 
 @dataclass
 class Message:
@@ -25,6 +30,7 @@ class Message:
     tool_call_id: str = ""
     name: str = ""                # tool name for tool results
     token_estimate: int = 0       # estimated token count
+    request_tokens: int = 0       # estimated tokens of to_dict() as sent to the LLM
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict for LLM API calls."""
@@ -41,11 +47,14 @@ class Message:
 class ContextManager:
     """Manages conversation context window for an agent."""
 
-    def __init__(self, config: ContextConfig):
+    def __init__(self, config: ContextConfig, tokenizer: Tokenizer | None = None):
         self._config = config
+        self._count: Tokenizer = tokenizer or estimate_tokens
         self._system_prompt: str = ""
+        self._system_tokens: int = 0
         self._messages: list[Message] = []
         self._total_tokens: int = 0
+        self._request_tokens: int = 0
 
     @property
     def messages(self) -> list[Message]:
@@ -57,6 +66,16 @@ class ContextManager:
         """Estimated total tokens in context."""
         return self._total_tokens
 
+    @property
+    def request_tokens(self) -> int:
+        """Estimated tokens of the message list as sent to the LLM (excluding system)."""
+        return self._request_tokens
+
+    @property
+    def system_tokens(self) -> int:
+        """Estimated tokens of the system prompt."""
+        return self._system_tokens
+
     @property
     def message_count(self) -> int:
         """Number of messages (excluding system)."""
@@ -65,15 +84,35 @@ class ContextManager:
     def set_system_prompt(self, prompt: str) -> None:
         """Set the system prompt (always kept in context)."""
         self._system_prompt = prompt
+        self._system_tokens = self._count(prompt)
+
+    def set_tokenizer(self, tokenizer: Tokenizer) -> None:
+        """Switch to a different token counter and recount what is held."""
+        self._count = tokenizer
+        self._system_tokens = tokenizer(self._system_prompt)
+        for msg in self._messages:
+            msg.token_estimate = 0
+            msg.request_tokens = 0
+            self._count_message(msg)
+        self._recalculate_tokens()
 
     def add_message(self, message: Message) -> None:
-        """Add a message and apply context management if needed."""
-        if not message.token_estimate:
-            message.token_estimate = estimate_tokens(message.content)
+        """Add a message and apply context management if needed.
+
+        Token counts are computed here, once, and cached on the message.
+        """
+        self._count_message(message)
         self._messages.append(message)
         self._total_tokens += message.token_estimate
+        self._request_tokens += message.request_tokens
         self._maybe_compress()
 
+    def _count_message(self, message: Message) -> None:
+        if not message.token_estimate:
+            message.token_estimate = self._count(message.content)
+        if not message.request_tokens:
+            message.request_tokens = self._count(json.dumps(message.to_dict()))
+
     def add_user_message(self, content: str) -> None:
         """Convenience: add a user message."""
         self.add_message(Message(role="user", content=content))
@@ -122,13 +161,11 @@ class ContextManager:
 
     def needs_compression(self) -> bool:
         """Check if context needs compression."""
-        sys_tokens = estimate_tokens(self._system_prompt)
-        return (sys_tokens + self._total_tokens) > self._config.max_tokens * 0.8
+        return (self._system_tokens + self._total_tokens) > self._config.max_tokens * 0.8
 
     def _maybe_compress(self) -> None:
         """Apply compression if context exceeds threshold."""
-        sys_tokens = estimate_tokens(self._system_prompt)
-        total = sys_tokens + self._total_tokens
+        total = self._system_tokens + self._total_tokens
         if total <= self._config.max_tokens * 0.8:
             return
 
@@ -150,6 +187,7 @@ class ContextManager:
             dropped = self._messages[:-keep_n]
             self._messages = self._messages[-keep_n:]
             self._total_tokens -= sum(m.token_estimate for m in dropped)
+            self._request_tokens -= sum(m.request_tokens for m in dropped)
 
     def _compress_sliding_window(self) -> None:
         """Keep only the last N messages."""
@@ -173,20 +211,23 @@ class ContextManager:
         summary_msg = Message(
             role="user",
             content=summary_text,
-            token_estimate=estimate_tokens(summary_text),
+            token_estimate=self._count(summary_text),
         )
+        self._count_message(summary_msg)
 
         self._messages = [summary_msg] + self._messages[-keep_n:]
         self._recalculate_tokens()
 
     def _recalculate_tokens(self) -> None:
-        """Recalculate total token count."""
+        """Recalculate total token counts from the per-message cache."""
         self._total_tokens = sum(m.token_estimate for m in self._messages)
+        self._request_tokens = sum(m.request_tokens for m in self._messages)
 
     def clear(self) -> None:
         """Clear all messages (keeps system prompt)."""
         self._messages.clear()
         self._total_tokens = 0
+        self._request_tokens = 0
 
 
 def estimate_tokens(text: str) -> int:
@@ -7,13 +7,23 @@ Extends the base TemplateResolver with:
 - Null coalescing (??)
 - Comparison and logical operators
 - Access to: result.*, trigger.*, memory.*, env.*, secret.*, agent.*, run.*, app.*
+
+Templates and expressions are compiled once into closures and kept in bounded
+LRU caches keyed by their text (see ``compile_template`` and
+``compile_expression``); resolving a value only walks the compiled nodes.
+The compiler warms the caches while validating an app.
 """
 
 from __future__ import annotations
 
+import copy
+import functools
+import operator
 import os
 import re
-from collections.abc import Mapping
+import time
+from collections import ChainMap
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +36,20 @@ _SINGLE_TEMPLATE_RE = re.compile(r"\{\{([^}]+)\}\}")
 # Filter separator: value | filter_name(args)
 _FILTER_RE = re.compile(r"\s*\|\s*")
 
+_EXPRESSION_CACHE_SIZE = 4096
+_TEMPLATE_CACHE_SIZE = 4096
+# Longer strings are compiled on every call instead of being pinned in the cache.
+_MAX_CACHED_TEMPLATE_LEN = 4096
+
+# A compiled expression or template: evaluates against a context.
+_Node = Callable[["ExpressionContext"], Any]
+
+# Namespaces layered by ExpressionContext.child().
+_SCOPED_NAMESPACES = (
+    "variables", "results", "trigger", "memory", "secrets",
+    "agent", "run", "app", "loop", "extra",
+)
+
 
 class ExpressionContext:
     """Context for resolving expressions during app execution."""
@@ -55,26 +79,27 @@ class ExpressionContext:
         self.loop = loop or {}
         self.extra = extra or {}
 
+    def child(self, *, shared: Iterable[str] = ()) -> ExpressionContext:
+        """Return a copy-on-write child scope in O(1).
+
+        Each namespace becomes a ``ChainMap`` over this context's mapping:
+        reads fall through to the parent, writes land in the child and are
+        never seen by the parent or by sibling scopes.  Namespaces named in
+        *shared* keep pointing at the parent's mapping, so writes to them
+        stay visible (e.g. step results recorded inside a map item).
+        """
+        scope = copy.copy(self)
+        for name in _SCOPED_NAMESPACES:
+            if name not in shared:
+                setattr(scope, name, ChainMap({}, getattr(self, name)))
+        return scope
+
     def get_namespace(self, name: str) -> Any:
         """Get a top-level namespace value."""
-        namespaces = {
-            "result": self.results,
-            "trigger": self.trigger,
-            "memory": self.memory,
-            "secret": self.secrets,
-            "env": os.environ,
-            "agent": self.agent,
-            "run": self.run,
-            "app": self.app,
-            "loop": self.loop,
-            "context": self.extra,
-            "workspace": self.variables.get("workspace", ""),
-            "data_dir": self.variables.get("data_dir", ""),
-            "now": __import__("time").time(),
-        }
         # Check direct namespace
-        if name in namespaces:
-            return namespaces[name]
+        getter = _NAMESPACES.get(name)
+        if getter is not None:
+            return getter(self)
         # Check variables
         if name in self.variables:
             return self.variables[name]
@@ -84,6 +109,23 @@ class ExpressionContext:
         return None
 
 
+_NAMESPACES: dict[str, Callable[[ExpressionContext], Any]] = {
+    "result": operator.attrgetter("results"),
+    "trigger": operator.attrgetter("trigger"),
+    "memory": operator.attrgetter("memory"),
+    "secret": operator.attrgetter("secrets"),
+    "env": lambda _ctx: os.environ,
+    "agent": operator.attrgetter("agent"),
+    "run": operator.attrgetter("run"),
+    "app": operator.attrgetter("app"),
+    "loop": operator.attrgetter("loop"),
+    "context": operator.attrgetter("extra"),
+    "workspace": lambda ctx: ctx.variables.get("workspace", ""),
+    "data_dir": lambda ctx: ctx.variables.get("data_dir", ""),
+    "now": lambda _ctx: time.time(),
+}
+
+
 class ExpressionEngine:
     """Resolves {{expressions}} in strings and data structures."""
 
@@ -113,112 +155,192 @@ class ExpressionEngine:
 
     def _resolve_string(self, text: str, ctx: ExpressionContext) -> Any:
         """Resolve templates in a string."""
-        # Check if the entire string is a single template
-        match = _SINGLE_TEMPLATE_RE.fullmatch(text.strip())
-        if match:
-            # Single expression — preserve type
-            return self._evaluate_expression(match.group(1).strip(), ctx)
-
-        # Multiple templates — string interpolation
-        def _replace(m: re.Match) -> str:
-            result = self._evaluate_expression(m.group(1).strip(), ctx)
-            if result is None:
-                return ""
-            return str(result)
-
-        return _TEMPLATE_RE.sub(_replace, text)
+        if "{{" not in text:
+            return text
+        return compile_template(text)(ctx)
 
     def _evaluate_expression(self, expr: str, ctx: ExpressionContext) -> Any:
         """Evaluate a single expression (without {{ }})."""
-        # Handle null coalescing: a ?? b
-        if " ?? " in expr:
-            parts = expr.split(" ?? ", 1)
-            result = self._evaluate_expression(parts[0].strip(), ctx)
+        return compile_expression(expr)(ctx)
+
+    def _resolve_path(self, path: str, ctx: ExpressionContext) -> Any:
+        """Resolve a dotted path like 'result.step_id.field'."""
+        return _compile_path(path)(ctx)
+
+    def _apply_filter(self, value: Any, filter_expr: str, ctx: ExpressionContext) -> Any:
+        """Apply a filter to a value."""
+        # Parse filter name and args
+        name, args = _parse_filter(filter_expr)
+        return _FILTERS.get(name, _filter_identity)(value, args, ctx)
+
+
+# ─── Compilation ───────────────────────────────────────────────────────
+
+
+def compile_template(text: str) -> _Node:
+    """Return the compiled form of a string that may contain {{templates}}.
+
+    A string that is exactly one template evaluates to the expression's value
+    (type preserved); otherwise every template is interpolated as text.
+    """
+    if len(text) > _MAX_CACHED_TEMPLATE_LEN:
+        return _compile_template.__wrapped__(text)
+    return _compile_template(text)
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile_template(text: str) -> _Node:
+    # Check if the entire string is a single template
+    match = _SINGLE_TEMPLATE_RE.fullmatch(text.strip())
+    if match:
+        # Single expression — preserve type
+        return compile_expression(match.group(1).strip())
+
+    # Multiple templates — string interpolation.  split() alternates literal
+    # text and expression bodies: [text, expr, text, ..., text].
+    pieces = _TEMPLATE_RE.split(text)
+    if len(pieces) == 1:
+        return lambda _ctx: text
+    literals = pieces[0::2]
+    exprs = [compile_expression(e.strip()) for e in pieces[1::2]]
+
+    def interpolate(ctx: ExpressionContext) -> str:
+        out = [literals[0]]
+        for node, literal in zip(exprs, literals[1:], strict=True):
+            result = node(ctx)
+            out.append("" if result is None else str(result))
+            out.append(literal)
+        return "".join(out)
+
+    return interpolate
+
+
+_COMPARISONS: tuple[tuple[str, Callable[[Any, Any], Any]], ...] = (
+    (" == ", operator.eq),
+    (" != ", operator.ne),
+    (" >= ", lambda a, b: _compare(a, b, ">=")),
+    (" <= ", lambda a, b: _compare(a, b, "<=")),
+    (" > ", lambda a, b: _compare(a, b, ">")),
+    (" < ", lambda a, b: _compare(a, b, "<")),
+)
+
+
+@functools.lru_cache(maxsize=_EXPRESSION_CACHE_SIZE)
+def compile_expression(expr: str) -> _Node:
+    """Compile a single expression (without {{ }}) into a node.
+
+    Operators are recognised in the order below by splitting on their first
+    occurrence — the same precedence the engine has always used.
+    """
+    # Handle null coalescing: a ?? b
+    if " ?? " in expr:
+        left, right = (compile_expression(p.strip()) for p in expr.split(" ?? ", 1))
+
+        def coalesce(ctx: ExpressionContext) -> Any:
+            result = left(ctx)
             if result is None:
-                return self._evaluate_expression(parts[1].strip(), ctx)
+                return right(ctx)
             return result
 
-        # Handle comparisons: a == b, a != b, a > b, etc.
-        for op, func in [
-            (" == ", lambda a, b: a == b),
-            (" != ", lambda a, b: a != b),
-            (" >= ", lambda a, b: _compare(a, b, ">=")),
-            (" <= ", lambda a, b: _compare(a, b, "<=")),
-            (" > ", lambda a, b: _compare(a, b, ">")),
-            (" < ", lambda a, b: _compare(a, b, "<")),
-        ]:
-            if op in expr:
-                left, right = expr.split(op, 1)
-                left_val = self._evaluate_expression(left.strip(), ctx)
-                right_val = self._evaluate_expression(right.strip(), ctx)
-                return func(left_val, right_val)
-
-        # Handle logical operators
-        if " and " in expr:
-            parts = expr.split(" and ", 1)
-            return (
-                self._evaluate_expression(parts[0].strip(), ctx)
-                and self._evaluate_expression(parts[1].strip(), ctx)
-            )
-        if " or " in expr:
-            parts = expr.split(" or ", 1)
-            return (
-                self._evaluate_expression(parts[0].strip(), ctx)
-                or self._evaluate_expression(parts[1].strip(), ctx)
-            )
-        if expr.startswith("not "):
-            return not self._evaluate_expression(expr[4:].strip(), ctx)
-
-        # Split by filters
-        parts = _FILTER_RE.split(expr)
-        value = self._resolve_path(parts[0].strip(), ctx)
-
-        # Apply filters
-        for f in parts[1:]:
-            value = self._apply_filter(value, f.strip(), ctx)
-
+        return coalesce
+
+    # Handle comparisons: a == b, a != b, a > b, etc.
+    for op, func in _COMPARISONS:
+        if op in expr:
+            lhs, rhs = (compile_expression(p.strip()) for p in expr.split(op, 1))
+            return lambda ctx: func(lhs(ctx), rhs(ctx))
+
+    # Handle logical operators
+    if " and " in expr:
+        lhs, rhs = (compile_expression(p.strip()) for p in expr.split(" and ", 1))
+        return lambda ctx: lhs(ctx) and rhs(ctx)
+    if " or " in expr:
+        lhs, rhs = (compile_expression(p.strip()) for p in expr.split(" or ", 1))
+        return lambda ctx: lhs(ctx) or rhs(ctx)
+    if expr.startswith("not "):
+        operand = compile_expression(expr[4:].strip())
+        return lambda ctx: not operand(ctx)
+
+    # Split by filters
+    parts = _FILTER_RE.split(expr)
+    path = _compile_path(parts[0].strip())
+    filters = tuple(_compile_filter(f.strip()) for f in parts[1:])
+    if not filters:
+        return path
+
+    def apply_filters(ctx: ExpressionContext) -> Any:
+        value = path(ctx)
+        for f in filters:
+            value = f(value, ctx)
         return value
 
-    def _resolve_path(self, path: str, ctx: ExpressionContext) -> Any:
-        """Resolve a dotted path like 'result.step_id.field'."""
-        # Handle string/number literals
-        if path.startswith(("'", '"')) and path.endswith(("'", '"')):
-            return path[1:-1]
-        if path.isdigit():
-            return int(path)
-        try:
-            return float(path)
-        except ValueError:
-            pass
-        if path == "true":
-            return True
-        if path == "false":
-            return False
-        if path == "null" or path == "none":
-            return None
-
-        # Split by dots, handling optional chaining (?.)
-        segments = _split_path(path)
-        if not segments:
-            return None
+    return apply_filters
 
-        # First segment is the namespace
-        current = ctx.get_namespace(segments[0])
-        if current is None and len(segments) == 1:
-            return None
 
-        for segment in segments[1:]:
+def _compile_path(path: str) -> _Node:
+    """Compile a dotted path like 'result.step_id.field' or a literal."""
+    # Handle string/number literals
+    if path.startswith(("'", '"')) and path.endswith(("'", '"')):
+        return _constant(path[1:-1])
+    if path.isdigit():
+        return _constant(int(path))
+    try:
+        return _constant(float(path))
+    except ValueError:
+        pass
+    if path == "true":
+        return _constant(True)
+    if path == "false":
+        return _constant(False)
+    if path == "null" or path == "none":
+        return _constant(None)
+
+    # Split by dots, handling optional chaining (?.)
+    try:
+        segments = _split_path(path)
+    except ValueError:
+        # Malformed path (unclosed "["): fail when evaluated, as before, so
+        # an unreached branch of ?? / and / or does not break the expression.
+        return lambda _ctx: _split_path(path)
+    if not segments:
+        return _constant(None)
+
+    # First segment is the namespace
+    head = segments[0]
+    keys = tuple((seg, int(seg) if seg.isdigit() else None) for seg in segments[1:])
+
+    def resolve(ctx: ExpressionContext) -> Any:
+        current = ctx.get_namespace(head)
+        for key, idx in keys:
             if current is None:
                 return None
-            current = _access(current, segment)
-
+            if idx is not None:
+                if isinstance(current, (list, tuple)) and idx < len(current):
+                    current = current[idx]
+                else:
+                    current = None
+            elif current.__class__ is dict or isinstance(current, Mapping):
+                current = current.get(key)
+            else:
+                current = getattr(current, key, None)
         return current
 
-    def _apply_filter(self, value: Any, filter_expr: str, ctx: ExpressionContext) -> Any:
-        """Apply a filter to a value."""
-        # Parse filter name and args
+    return resolve
+
+
+def _compile_filter(filter_expr: str) -> Callable[[Any, ExpressionContext], Any]:
+    """Compile 'filter_name(args)' into a (value, ctx) -> value function."""
+    try:
         name, args = _parse_filter(filter_expr)
-        return _FILTERS.get(name, _filter_identity)(value, args, ctx)
+    except ValueError:
+        # Unclosed argument list: fail when applied, as before.
+        return lambda _value, _ctx: _parse_filter(filter_expr)
+    func = _FILTERS.get(name, _filter_identity)
+    return lambda value, ctx: func(value, args, ctx)
+
+
+def _constant(value: Any) -> _Node:
+    return lambda _ctx: value
 
 
 # ─── Path parsing ──────────────────────────────────────────────────────
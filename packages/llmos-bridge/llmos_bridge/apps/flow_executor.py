@@ -18,6 +18,7 @@ import json
 import logging
 import time
 import uuid
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any, Callable, Awaitable
 
@@ -39,6 +40,16 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Expression scope of the branch running in the current asyncio task.  Tasks
+# copy the context when created, so nested fan-out inherits its parent's scope.
+_active_scope: ContextVar[tuple[FlowExecutor, ExpressionContext] | None] = ContextVar(
+    "flow_scope", default=None
+)
+
+# Streaming map spill lines are sent to the filesystem module in chunks of
+# about this size, so a large map makes few append_file calls.
+_SPILL_CHUNK_BYTES = 1 << 20
+
 
 # ─── Result types ─────────────────────────────────────────────────────
 
@@ -150,7 +161,7 @@ class FlowExecutor:
         flow_id: str | None = None,
     ):
         self._expr = expr_engine or ExpressionEngine()
-        self._ctx = expr_context or ExpressionContext()
+        self._root_ctx = expr_context or ExpressionContext()
         self._execute_action = execute_action
         self._run_agent = run_agent
         self._emit_event = emit_event
@@ -164,6 +175,14 @@ class FlowExecutor:
         self._flow_id = flow_id or str(uuid.uuid4())[:12]
         self._checkpoint: FlowCheckpoint | None = None
 
+    @property
+    def _ctx(self) -> ExpressionContext:
+        """Expression context of the branch running in the current task."""
+        active = _active_scope.get()
+        if active is not None and active[0] is self:
+            return active[1]
+        return self._root_ctx
+
     @property
     def results(self) -> dict[str, StepResult]:
         return dict(self._results)
@@ -474,7 +493,7 @@ class FlowExecutor:
 
         async def run_with_sem(child: FlowStep) -> StepResult:
             async with semaphore:
-                return await self._execute_step(child)
+                return await self._execute_scoped(child)
 
         tasks = [asyncio.create_task(run_with_sem(child)) for child in config.steps]
 
@@ -597,8 +616,10 @@ class FlowExecutor:
         """Execute steps for each item in a collection.
 
         When max_concurrent > 1, items execute concurrently.  Each concurrent
-        task gets its own snapshot of ``variables`` and ``loop`` context to
-        prevent shared-state race conditions.
+        task runs in its own copy-on-write child scope, so items never see
+        each other's ``variables`` or ``loop``.  With ``stream: true`` the
+        items are processed by a fixed worker pool instead (see
+        ``_exec_map_stream``).
         """
         step_id = step.id or f"map_{id(step)}"
         config = step.map
@@ -606,6 +627,8 @@ class FlowExecutor:
             return StepResult(step_id=step_id, success=False, error="No map config")
 
         collection = self._resolve(config.over)
+        if config.stream:
+            return await self._exec_map_stream(step_id, config, collection)
         if not isinstance(collection, list):
             return StepResult(step_id=step_id, success=False, error=f"map.over did not resolve to a list: {type(collection)}")
 
@@ -646,29 +669,7 @@ class FlowExecutor:
 
         async def process_item(idx: int, item: Any) -> StepResult:
             async with semaphore:
-                # Create isolated context: snapshot current variables + set item
-                saved_vars = dict(self._ctx.variables)
-                saved_loop = self._ctx.loop
-                self._ctx.variables[var_name] = item
-                self._ctx.loop = {"iteration": idx, "index": idx, "item": item}
-
-                try:
-                    children: list[StepResult] = []
-                    for child in config.step:
-                        child_result = await self._execute_step(child)
-                        children.append(child_result)
-
-                    last_output = children[-1].output if children else None
-                    all_ok = all(c.success for c in children)
-                    return StepResult(
-                        step_id=f"{step_id}[{idx}]",
-                        success=all_ok,
-                        output=last_output,
-                        children=children,
-                    )
-                finally:
-                    self._ctx.variables = saved_vars
-                    self._ctx.loop = saved_loop
+                return await self._run_map_item(step_id, config, idx, item)
 
         tasks = [asyncio.create_task(process_item(i, item)) for i, item in enumerate(collection)]
         raw_results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -683,6 +684,171 @@ class FlowExecutor:
         all_ok = all(r.success for r in results)
         return StepResult(step_id=step_id, success=all_ok, output=outputs, children=list(results))
 
+    async def _run_map_item(
+        self, step_id: str, config: MapConfig, idx: int, item: Any
+    ) -> StepResult:
+        """Run the map body for one item in its own child scope."""
+        scope = self._ctx.child(shared=("results",))
+        scope.variables[config.as_var] = item
+        scope.loop = {"iteration": idx, "index": idx, "item": item}
+        token = _active_scope.set((self, scope))
+        try:
+            children: list[StepResult] = []
+            for child in config.step:
+                child_result = await self._execute_step(child)
+                children.append(child_result)
+
+            last_output = children[-1].output if children else None
+            all_ok = all(c.success for c in children)
+            return StepResult(
+                step_id=f"{step_id}[{idx}]",
+                success=all_ok,
+                output=last_output,
+                children=children,
+            )
+        finally:
+            _active_scope.reset(token)
+
+    async def _execute_scoped(self, step: FlowStep) -> StepResult:
+        """Execute a concurrent branch in a copy-on-write child scope.
+
+        Variable writes stay local to the branch; step results are shared so
+        later steps can still reference ``{{result.<id>}}``.
+        """
+        token = _active_scope.set((self, self._ctx.child(shared=("results",))))
+        try:
+            return await self._execute_step(step)
+        finally:
+            _active_scope.reset(token)
+
+    async def _exec_map_stream(
+        self, step_id: str, config: MapConfig, collection: Any
+    ) -> StepResult:
+        """Streaming map: a fixed worker pool pulls items from an iterator.
+
+        Memory stays flat in the collection size — there is one task per
+        worker, not per item, and only failed items keep their StepResult.
+        Each item's output is folded into ``config.reduce`` as it completes
+        (in completion order), appended to the ``config.spill_to`` NDJSON
+        file as ``{"index": i, "output": ...}``, or dropped.  The spill file
+        is written through the ``filesystem`` module (``write_file`` then
+        chunked ``append_file``), so the app's sandbox and permission checks
+        apply and no file I/O runs on the event loop.
+
+        Output is the accumulator when ``reduce`` is set, otherwise a
+        ``{"count", "succeeded", "failed"}`` summary (plus ``spill_path``).
+        """
+        if isinstance(collection, (str, bytes, dict)) or not hasattr(collection, "__iter__"):
+            return StepResult(
+                step_id=step_id, success=False,
+                error=f"map.over did not resolve to an iterable: {type(collection)}",
+            )
+
+        items = enumerate(collection)
+        failures: list[StepResult] = []
+        counts = {"count": 0, "succeeded": 0, "failed": 0}
+
+        reduce_step: FlowStep | None = None
+        if config.reduce is not None:
+            reduce_step = (
+                config.reduce if isinstance(config.reduce, FlowStep)
+                else FlowStep.model_validate(config.reduce)
+            )
+        accumulator: Any = dict(config.initial)
+        reduce_ok = True
+        # Reduce steps read and replace the accumulator — run them one at a time.
+        reduce_lock = asyncio.Lock()
+
+        spill_path = str(self._resolve(config.spill_to) or "") if config.spill_to else ""
+        spill_buf: list[str] = []
+        spill_size = 0
+        spill_error: str | None = None
+        # Chunks must reach the file in the order they were cut.
+        spill_lock = asyncio.Lock()
+
+        async def spill(action: str, params: dict[str, Any]) -> str | None:
+            """Run a filesystem action for the spill file; return its error."""
+            assert self._execute_action is not None
+            try:
+                result = await self._execute_action("filesystem", action, params)
+            except Exception as exc:
+                return str(exc)
+            if isinstance(result, dict) and result.get("error") is not None:
+                return str(result["error"])
+            return None
+
+        async def flush_spill() -> None:
+            nonlocal spill_size, spill_error
+            async with spill_lock:
+                if not spill_buf or spill_error is not None:
+                    return
+                chunk = "".join(spill_buf)
+                spill_buf.clear()
+                spill_size = 0
+                spill_error = await spill(
+                    "append_file", {"path": spill_path, "content": chunk, "newline": False}
+                )
+
+        if spill_path:
+            if not self._execute_action:
+                return StepResult(
+                    step_id=step_id, success=False,
+                    error="map.spill_to requires an action executor",
+                )
+            error = await spill("write_file", {"path": spill_path, "content": ""})
+            if error is not None:
+                return StepResult(step_id=step_id, success=False, error=f"map.spill_to: {error}")
+
+        async def worker() -> None:
+            nonlocal accumulator, reduce_ok, spill_size
+            # Single-threaded event loop: next() on the shared iterator needs no lock.
+            for idx, item in items:
+                if self._stopped or spill_error is not None:
+                    return
+                try:
+                    result = await self._run_map_item(step_id, config, idx, item)
+                except Exception as exc:
+                    result = StepResult(step_id=f"{step_id}[{idx}]", success=False, error=str(exc))
+                counts["count"] += 1
+                if not result.success:
+                    counts["failed"] += 1
+                    failures.append(result)
+                    continue
+                counts["succeeded"] += 1
+                if spill_path:
+                    line = json.dumps({"index": idx, "output": result.output}, default=str) + "\n"
+                    spill_buf.append(line)
+                    spill_size += len(line)
+                    if spill_size >= _SPILL_CHUNK_BYTES:
+                        await flush_spill()
+                if reduce_step is not None:
+                    async with reduce_lock:
+                        self._ctx.variables[config.reduce_as] = accumulator
+                        self._ctx.variables["reduce"] = {"item": result.output, "index": idx}
+                        reduce_result = await self._execute_step(reduce_step)
+                        if not reduce_result.success:
+                            reduce_ok = False
+                            failures.append(reduce_result)
+                        accumulator = _fold(accumulator, reduce_result.output)
+
+        await asyncio.gather(*(worker() for _ in range(config.max_concurrent)))
+        if spill_path:
+            await flush_spill()
+
+        if reduce_step is not None:
+            output: Any = accumulator
+        else:
+            output = dict(counts)
+            if spill_path:
+                output["spill_path"] = spill_path
+        return StepResult(
+            step_id=step_id,
+            success=counts["failed"] == 0 and reduce_ok and spill_error is None,
+            output=output,
+            error=f"map.spill_to: {spill_error}" if spill_error is not None else None,
+            children=failures,
+        )
+
     async def _exec_reduce(self, step: FlowStep) -> StepResult:
         """Execute a reduce/fold over a collection."""
         step_id = step.id or f"reduce_{id(step)}"
@@ -704,11 +870,7 @@ class FlowExecutor:
             if config.step:
                 child = config.step if isinstance(config.step, FlowStep) else FlowStep.model_validate(config.step)
                 child_result = await self._execute_step(child)
-                if child_result.output is not None:
-                    if isinstance(child_result.output, dict):
-                        accumulator.update(child_result.output)
-                    else:
-                        accumulator = child_result.output
+                accumulator = _fold(accumulator, child_result.output)
 
         return StepResult(step_id=step_id, success=True, output=accumulator)
 
@@ -719,7 +881,7 @@ class FlowExecutor:
         if not config or not config.steps:
             return StepResult(step_id=step_id, success=False, error="No race config")
 
-        tasks = [asyncio.create_task(self._execute_step(child)) for child in config.steps]
+        tasks = [asyncio.create_task(self._execute_scoped(child)) for child in config.steps]
 
         done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
 
@@ -997,6 +1159,20 @@ class FlowExecutor:
 # ─── Utilities ────────────────────────────────────────────────────────
 
 
+def _fold(accumulator: Any, output: Any) -> Any:
+    """Merge a reduce step's output into the accumulator.
+
+    Dict outputs update a dict accumulator in place; any other non-None
+    output replaces it.
+    """
+    if output is None:
+        return accumulator
+    if isinstance(output, dict) and isinstance(accumulator, dict):
+        accumulator.update(output)
+        return accumulator
+    return output
+
+
 def _parse_duration(s: str) -> float:
     """Parse a duration string like '30s', '5m', '1h' to seconds."""
     if not s:
@@ -302,6 +302,11 @@ class LoopConfig(BaseModel):
     retry: RetryConfig = Field(default_factory=RetryConfig)
     context: ContextConfig = Field(default_factory=ContextConfig)
     planning: PlanningConfig = Field(default_factory=PlanningConfig)
+    pipeline_tools: bool = Field(
+        default=False,
+        description="Stream LLM responses and start read-only tool calls as soon as "
+        "each one is complete, instead of after the whole response",
+    )
 
 
 # ─── Agent (single agent config) ────────────────────────────────────
@@ -749,6 +754,15 @@ class MapConfig(BaseModel):
     as_var: str = Field("item", alias="as")
     max_concurrent: int = Field(default=5, ge=1)
     step: list[FlowStep] = Field(default_factory=list)
+    # Streaming mode: max_concurrent workers pull items from the collection
+    # and only failed items keep a StepResult, so memory does not grow with
+    # the collection.  Item outputs are folded into `reduce`, written to
+    # `spill_to`, or dropped.
+    stream: bool = False
+    reduce: FlowStep | dict[str, Any] | None = None  # runs per item output
+    initial: dict[str, Any] = Field(default_factory=dict)
+    reduce_as: str = "acc"
+    spill_to: str = ""            # NDJSON file path (expression)
 
     model_config = {"populate_by_name": True}
 
@@ -341,21 +341,11 @@ class MultiAgentOrchestrator:
     def _isolated_context(self) -> ExpressionContext:
         """Create an isolated copy of the expression context for an agent.
 
-        Each agent gets its own results/variables dict so concurrent agents
-        (consensus strategy) don't corrupt each other's state.
+        Each agent gets its own copy-on-write child scope so concurrent agents
+        (consensus strategy) don't corrupt each other's state, without copying
+        large variables up front.
         """
-        return ExpressionContext(
-            variables=dict(self._ctx.variables),
-            results=dict(self._ctx.results),
-            trigger=dict(self._ctx.trigger),
-            memory=dict(self._ctx.memory),
-            secrets=dict(self._ctx.secrets),
-            agent=dict(self._ctx.agent),
-            run=dict(self._ctx.run),
-            app=dict(self._ctx.app),
-            loop=dict(self._ctx.loop),
-            extra=dict(self._ctx.extra),
-        )
+        return self._ctx.child()
 
     async def _run_single_agent(self, agent: AgentInstance, input_text: str) -> AgentRunResult:
         """Run a single agent with an isolated expression context."""
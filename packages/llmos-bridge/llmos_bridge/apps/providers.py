@@ -17,10 +17,13 @@ import json
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .agent_runtime import LLMProvider
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 logger = logging.getLogger(__name__)
 
 
@@ -160,6 +163,10 @@ def filter_params_for_provider(
     return filtered
 
 
+# 1 initial request + 3 rate-limit retries.
+_RATE_LIMIT_ATTEMPTS = 4
+
+
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider using the official SDK.
 
@@ -194,6 +201,109 @@ class AnthropicProvider(LLMProvider):
 
         Translates OpenAI-style tool format to Anthropic format and back.
         """
+        kwargs = self._request_kwargs(
+            system, messages, tools, max_tokens, temperature, top_p,
+        )
+
+        import anthropic
+
+        last_error = None
+        for attempt in range(_RATE_LIMIT_ATTEMPTS):
+            try:
+                response = await self._client.messages.create(**kwargs)
+                return self._parse_response(response)
+            except anthropic.RateLimitError as e:
+                last_error = e
+                await self._rate_limit_backoff(e, attempt)
+
+        raise last_error  # type: ignore[misc]
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def chat_stream(
+        self,
+        *,
+        system: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        max_tokens: int = 4096,
+        temperature: float | None = None,
+        top_p: float | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a chat request, yielding each tool_use block as soon as it closes.
+
+        Rate limits are retried like :meth:`chat` as long as nothing has been
+        yielded yet; a 429 arrives when the stream is opened, before any event.
+        """
+        import anthropic
+
+        kwargs = self._request_kwargs(
+            system, messages, tools, max_tokens, temperature, top_p,
+        )
+        yielded = False
+        for attempt in range(_RATE_LIMIT_ATTEMPTS):
+            try:
+                async with self._client.messages.stream(**kwargs) as stream:
+                    async for event in stream:
+                        if event.type == "text":
+                            yielded = True
+                            yield {"type": "text", "text": event.text}
+                        elif (
+                            event.type == "content_block_stop"
+                            and event.content_block.type == "tool_use"
+                        ):
+                            block = event.content_block
+                            yielded = True
+                            yield {
+                                "type": "tool_call",
+                                "id": block.id,
+                                "name": block.name,
+                                "arguments": block.input,
+                            }
+                    final = await stream.get_final_message()
+                break
+            except anthropic.RateLimitError as e:
+                if yielded or attempt == _RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                await self._rate_limit_backoff(e, attempt)
+
+        has_tool_calls = any(b.type == "tool_use" for b in final.content)
+        yield {"type": "stop", "done": final.stop_reason == "end_turn" and not has_tool_calls}
+
+    @staticmethod
+    async def _rate_limit_backoff(error: Any, attempt: int) -> None:
+        """Sleep before retrying a rate-limited request."""
+        import asyncio
+
+        # Parse retry-after header if available, else exponential backoff
+        retry_after = getattr(error, "response", None)
+        wait = None
+        if retry_after and hasattr(retry_after, "headers"):
+            ra = retry_after.headers.get("retry-after")
+            if ra:
+                try:
+                    wait = float(ra)
+                except ValueError:
+                    pass
+        if wait is None:
+            wait = min(2 ** attempt * 2, 60)  # 2s, 4s, 8s, capped at 60s
+        logger.warning(
+            "Rate limited (attempt %d/%d) — waiting %.1fs before retry",
+            attempt + 1, _RATE_LIMIT_ATTEMPTS, wait,
+        )
+        await asyncio.sleep(wait)
+
+    def _request_kwargs(
+        self,
+        system: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        max_tokens: int,
+        temperature: float | None,
+        top_p: float | None,
+    ) -> dict[str, Any]:
+        """Build Messages API arguments from an LLMProvider call."""
         # Convert messages to Anthropic format
         anthropic_messages = self._convert_messages(messages)
 
@@ -213,39 +323,7 @@ class AnthropicProvider(LLMProvider):
             kwargs["temperature"] = temperature
         if top_p is not None:
             kwargs["top_p"] = top_p
-
-        import asyncio
-        import anthropic
-
-        last_error = None
-        for attempt in range(4):  # 1 initial + 3 retries
-            try:
-                response = await self._client.messages.create(**kwargs)
-                return self._parse_response(response)
-            except anthropic.RateLimitError as e:
-                last_error = e
-                # Parse retry-after header if available, else exponential backoff
-                retry_after = getattr(e, "response", None)
-                wait = None
-                if retry_after and hasattr(retry_after, "headers"):
-                    ra = retry_after.headers.get("retry-after")
-                    if ra:
-                        try:
-                            wait = float(ra)
-                        except ValueError:
-                            pass
-                if wait is None:
-                    wait = min(2 ** attempt * 2, 60)  # 2s, 4s, 8s, capped at 60s
-                logger.warning(
-                    "Rate limited (attempt %d/4) — waiting %.1fs before retry",
-                    attempt + 1, wait,
-                )
-                await asyncio.sleep(wait)
-
-        raise last_error  # type: ignore[misc]
-
-    async def close(self) -> None:
-        await self._client.close()
+        return kwargs
 
     def _convert_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Convert OpenAI-style messages to Anthropic format."""
@@ -347,7 +425,8 @@ class AnthropicProvider(LLMProvider):
 
         for block in response.content:
             if block.type == "text":
-                text = block.text
+                # Concatenate like chat_stream() does with its text deltas.
+                text += block.text
             elif block.type == "tool_use":
                 tool_calls.append({
                     "id": block.id,
@@ -1244,7 +1244,10 @@ class AppRuntime:
         if self._context_manager_module is None:
             return
         try:
-            from llmos_bridge.modules.context_manager.module import ContextBudgetConfig
+            from llmos_bridge.modules.context_manager.module import (
+                ContextBudgetConfig,
+                count_tokens,
+            )
 
             loop_ctx = agent._config.loop.context
             # Values already capped by _cap_context_to_model()
@@ -1296,6 +1299,9 @@ class AppRuntime:
                 self._context_manager_module.set_summarizer(_summarize)
 
             agent.set_context_module(self._context_manager_module)
+            # Count history with the module's tokenizer (tiktoken when
+            # installed) so the cached per-message counts match its budget.
+            agent.set_tokenizer(count_tokens)
         except Exception:
             pass
 
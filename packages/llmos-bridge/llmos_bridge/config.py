@@ -49,6 +49,18 @@ class ServerConfig(BaseModel):
             "Prevents massive outputs from overflowing LLM context."
         ),
     )
+    result_spill_enabled: bool = Field(
+        default=False,
+        description=(
+            "Spill results larger than max_result_size to a content-addressed blob "
+            "store instead of discarding the tail. The LLM still sees the truncated "
+            "preview; {{result.<id>.<field>}} templates load the full field from disk."
+        ),
+    )
+    result_spill_dir: Path = Field(
+        default=Path("~/.llmos/results"),
+        description="Directory for spilled result blobs (purged with plan retention).",
+    )
     plan_retention_hours: Annotated[int, Field(ge=1, le=8760)] = Field(
         default=168,
         description="Hours to keep completed/failed plans before auto-purge (default 7 days).",
@@ -128,6 +140,37 @@ class MemoryConfig(BaseModel):
     vector_db_path: Path = Path("~/.llmos/vector")
     vector_enabled: bool = False
     max_history_entries: int = Field(default=1000, ge=100, le=100_000)
+    state_backend: Literal["sqlite", "memory"] = Field(
+        default="sqlite",
+        description=(
+            "Plan state backend. sqlite: durable, survives restarts (default). "
+            "memory: no disk I/O, bounded retention, lost on restart — for CI agents "
+            "and benchmark runs."
+        ),
+    )
+    state_memory_max_plans: Annotated[int, Field(ge=1, le=1_000_000)] = Field(
+        default=10_000,
+        description=(
+            "memory backend only: plans kept before the least recently updated "
+            "are evicted."
+        ),
+    )
+    state_write_behind: bool = Field(
+        default=False,
+        description=(
+            "Coalesce plan/action status updates and write them in periodic group "
+            "commits instead of one transaction per update. On a crash, at most the "
+            "updates buffered since the last flush are lost."
+        ),
+    )
+    state_flush_interval_ms: Annotated[int, Field(ge=1, le=10_000)] = Field(
+        default=50,
+        description="Write-behind group commit interval in milliseconds.",
+    )
+    state_flush_max_records: Annotated[int, Field(ge=1, le=100_000)] = Field(
+        default=256,
+        description="Flush early once this many coalesced rows are pending.",
+    )
 
 
 class PerceptionConfig(BaseModel):
@@ -238,6 +281,32 @@ class ResourceConfig(BaseModel):
         },
         description="Maximum concurrent actions per module.",
     )
+    scheduling_mode: Literal["wave", "dataflow"] = Field(
+        default="wave",
+        description=(
+            "How parallel plans are dispatched. "
+            "wave: run each DAG generation to completion before starting the next. "
+            "dataflow: start each action as soon as its own dependencies finish, "
+            "so a slow action only delays its descendants."
+        ),
+    )
+    max_parallel_actions: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description=(
+            "Global cap on concurrently running actions per plan in dataflow mode. "
+            "None = unbounded (per-module limits still apply)."
+        ),
+    )
+    critical_path_scheduling: bool = Field(
+        default=False,
+        description=(
+            "Dispatch ready actions by longest remaining path, weighted by historical "
+            "per-'module.action' durations, so critical-path work is not queued behind "
+            "leaf actions when module concurrency limits are saturated."
+        ),
+    )
 
 
 class DatabaseGatewayConfig(BaseModel):
@@ -269,6 +338,13 @@ class CustomThreatCategoryConfig(BaseModel):
     )
 
 
+_ShapeReuseVerdict = Literal["approve", "warn", "reject", "clarify"]
+
+
+def _default_shape_reuse_verdicts() -> list[_ShapeReuseVerdict]:
+    return ["approve"]
+
+
 class IntentVerifierConfig(BaseModel):
     """Configuration for the LLM-based intent verification layer (Couche 1).
 
@@ -320,6 +396,50 @@ class IntentVerifierConfig(BaseModel):
         default=300.0,
         description="TTL for cached verification results in seconds. 0 = no TTL.",
     )
+    cache_backend: Literal["memory", "sqlite", "redis"] = Field(
+        default="memory",
+        description=(
+            "Shared store behind the in-process LRU. memory: none (default). "
+            "sqlite: a file shared by every process on the host, survives restarts. "
+            "redis: the llmos_bridge.cache client (REDIS_URL, else embedded fakeredis)."
+        ),
+    )
+    cache_db_path: Path = Field(
+        default=Path("~/.llmos/intent_cache.db"),
+        description="sqlite cache backend only: database file path.",
+    )
+    shape_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Also key verdicts by the plan's normalised shape (ignoring plan/action ids, "
+            "timestamps and UUIDs) so repeated agent plans skip the LLM call."
+        ),
+    )
+    shape_template_literals: bool = Field(
+        default=False,
+        description=(
+            "Replace literal parameter values with type placeholders in the shape key, "
+            "so plans that differ only in values share a verdict."
+        ),
+    )
+    shape_literal_modules: list[str] = Field(
+        default_factory=lambda: [
+            "os_exec", "api_http", "browser", "database", "database_gateway",
+            "filesystem", "excel", "word", "powerpoint",
+        ],
+        description=(
+            "Modules whose parameter values (commands, URLs, queries, file paths) "
+            "are never templated in the shape key."
+        ),
+    )
+    shape_reuse_verdicts: list[_ShapeReuseVerdict] = Field(
+        default_factory=_default_shape_reuse_verdicts,
+        description="Verdicts that may be reused from a shape hit.",
+    )
+    shape_reuse_max_risk: Literal["low", "medium", "high", "critical"] = Field(
+        default="low",
+        description="Highest risk level that may be reused from a shape hit.",
+    )
     max_plan_actions_for_verification: Annotated[int, Field(ge=1, le=500)] = Field(
         default=50,
         description="Plans with more actions than this skip LLM verification (too large).",
@@ -431,6 +551,33 @@ class ScannerPipelineConfig(BaseModel):
         default=0.3,
         description="Risk score above which a warning is emitted.",
     )
+    parallel: bool = Field(
+        default=False,
+        description=(
+            "Run scanners concurrently instead of in priority order. With fail_fast, "
+            "the first REJECT cancels the scanners still running."
+        ),
+    )
+    scanner_timeout_seconds: float | None = Field(
+        default=None,
+        gt=0.0,
+        description=(
+            "Per-scanner deadline. A scanner that misses it yields a WARN result "
+            "instead of delaying plan admission. None = no deadline."
+        ),
+    )
+    scan_cache_size: Annotated[int, Field(ge=0)] = Field(
+        default=2048,
+        description=(
+            "Per-fragment scan result cache entries. Plans are scanned per action "
+            "(plus description) and unchanged fragments are served from the cache. "
+            "0 scans the whole plan as one document on every submission."
+        ),
+    )
+    scan_cache_ttl_seconds: Annotated[float, Field(ge=0.0)] = Field(
+        default=600.0,
+        description="Time-to-live of cached fragment scan results (0 = no expiry).",
+    )
     heuristic_enabled: bool = Field(
         default=True,
         description="Enable the built-in HeuristicScanner (Layer 1, zero deps).",
@@ -606,11 +753,76 @@ class VisionConfig(BaseModel):
     )
 
 
+class EventsConfig(BaseModel):
+    """EventBus listener dispatch settings."""
+
+    listener_dispatch: Literal["inline", "queued"] = Field(
+        default="inline",
+        description=(
+            "inline: emit() awaits each listener in turn (default). "
+            "queued: each listener gets a bounded queue and worker task so a slow "
+            "listener never adds latency to the producer."
+        ),
+    )
+    listener_queue_size: Annotated[int, Field(ge=1, le=1_000_000)] = Field(
+        default=1024,
+        description="queued mode: per-listener queue bound.",
+    )
+    listener_overflow: Literal["drop_oldest", "block", "coalesce"] = Field(
+        default="drop_oldest",
+        description=(
+            "queued mode: what to do when a listener queue is full. "
+            "drop_oldest: discard the oldest pending event. "
+            "block: make the producer wait. "
+            "coalesce: keep only the newest pending event per (event, plan_id, action_id)."
+        ),
+    )
+
+
 class LoggingConfig(BaseModel):
     level: Literal["debug", "info", "warning", "error", "critical"] = "info"
     format: Literal["json", "console"] = "console"
     file: Path | None = None
     audit_file: Path | None = Path("~/.llmos/audit.log")
+    audit_buffered: bool = Field(
+        default=False,
+        description=(
+            "Write audit events from a background task in batches instead of one "
+            "open/append/close per event on the event loop."
+        ),
+    )
+    audit_flush_interval_ms: Annotated[int, Field(ge=1, le=60_000)] = Field(
+        default=50,
+        description="audit_buffered only: maximum delay before buffered lines are written.",
+    )
+    audit_flush_max_events: Annotated[int, Field(ge=1, le=100_000)] = Field(
+        default=256,
+        description="audit_buffered only: write as soon as this many lines are buffered.",
+    )
+    audit_max_pending: Annotated[int, Field(ge=1, le=1_000_000)] = Field(
+        default=10_000,
+        description="audit_buffered only: buffer bound before the overflow policy applies.",
+    )
+    audit_overflow: Literal["block", "drop_oldest"] = Field(
+        default="block",
+        description=(
+            "audit_buffered only: block makes producers wait for the writer (lossless); "
+            "drop_oldest discards the oldest buffered line."
+        ),
+    )
+    audit_fsync: bool = Field(
+        default=False,
+        description="fsync the audit file after every write (each batch when buffered).",
+    )
+    audit_max_bytes: int | None = Field(
+        default=None,
+        ge=1024,
+        description="Rotate the audit file before it grows past this size. None disables rotation.",
+    )
+    audit_backup_count: Annotated[int, Field(ge=0, le=100)] = Field(
+        default=5,
+        description="Rotated audit files to keep (audit.log.1 … audit.log.N).",
+    )
 
 
 class ModuleManagerConfig(BaseModel):
@@ -757,6 +969,21 @@ class RedisConfig(BaseModel):
             "Auto-set from node.node_id if left empty."
         ),
     )
+    publish_batching: bool = Field(
+        default=False,
+        description=(
+            "Buffer published events per stream and XADD them in one pipeline per "
+            "flush instead of one round trip per event."
+        ),
+    )
+    publish_flush_interval_ms: Annotated[int, Field(ge=1, le=1000)] = Field(
+        default=5,
+        description="publish_batching only: maximum delay before buffered events are sent.",
+    )
+    publish_batch_max_events: Annotated[int, Field(ge=1, le=10_000)] = Field(
+        default=128,
+        description="publish_batching only: flush as soon as this many events are pending.",
+    )
 
 
 class RoutingConfig(BaseModel):
@@ -825,6 +1052,7 @@ class Settings(BaseSettings):
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     perception: PerceptionConfig = Field(default_factory=PerceptionConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    events: EventsConfig = Field(default_factory=EventsConfig)
     triggers: TriggerConfig = Field(default_factory=TriggerConfig)
     recording: RecordingConfig = Field(default_factory=RecordingConfig)
     resources: ResourceConfig = Field(default_factory=ResourceConfig)
@@ -22,6 +22,26 @@ Swap the backend by injecting a different EventBus implementation:
 
 This means the executor and all modules never change when the backend changes.
 
+Event sharing:
+  ``_stamp`` freezes each emitted dict into a :class:`FrozenEvent` — a
+  read-only dict created once per emit (a shallow copy; payload values are
+  shared, never duplicated).  Nested backends (FanoutEventBus), listeners
+  and every recent-events ring receive that same object, and its JSON
+  encoding is computed at most once via :meth:`FrozenEvent.json`.  Copy it
+  with ``dict(event)`` to modify.
+
+Listener dispatch:
+  By default ``emit`` awaits every registered listener in turn ("inline"),
+  so a slow ``on_event`` adds directly to the producer's latency.  In
+  "queued" mode each listener gets its own bounded queue drained by a
+  dedicated worker task; ``emit`` only enqueues.  When a queue is full the
+  listener's overflow policy decides what happens:
+    drop_oldest → discard the oldest pending event (default)
+    block       → the producer waits for space (lossless backpressure)
+    coalesce    → pending events with the same (event, plan_id, action_id)
+                  are replaced by the newest one; otherwise drop oldest
+  Per-listener depth, drops and lag are reported by ``listener_stats()``.
+
 Standard topic names (use the constants below for consistency):
   TOPIC_PLANS     = "llmos.plans"      — plan lifecycle events
   TOPIC_ACTIONS   = "llmos.actions"    — action execution events
@@ -35,13 +55,15 @@ Standard topic names (use the constants below for consistency):
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import asyncio
+from collections import OrderedDict, deque
+import contextlib
 import json
-import time
-from abc import ABC, abstractmethod
-from collections import deque
+import os
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable
+import time
+from typing import Any, AsyncIterator, Callable, Literal
 
 from llmos_bridge.logging import get_logger
 
@@ -66,6 +88,186 @@ TOPIC_ACTION_PROGRESS = "llmos.actions.progress"
 TOPIC_ACTION_RESULTS = "llmos.actions.results"
 
 
+# ---------------------------------------------------------------------------
+# Frozen, shareable event record
+# ---------------------------------------------------------------------------
+
+
+class FrozenEvent(dict):  # type: ignore[type-arg]
+    """Read-only event dict shared by every backend, listener and ring buffer.
+
+    Behaves like a plain ``dict`` for reading (``json.dumps``, ``.get``,
+    ``dict(event)``, ``{**event}``) but rejects mutation with ``TypeError``.
+    Copies (``copy``, ``deepcopy``, pickle, ``.copy()``) are plain dicts.
+    """
+
+    __slots__ = ("_json",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._json: str | None = None
+
+    def json(self) -> str:
+        """Return ``json.dumps(self, default=str)``, computed once and cached."""
+        if self._json is None:
+            self._json = json.dumps(self, default=str)
+        return self._json
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("FrozenEvent is read-only — copy it with dict(event) first.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+DispatchMode = Literal["inline", "queued"]
+OverflowPolicy = Literal["drop_oldest", "block", "coalesce"]
+
+
+# ---------------------------------------------------------------------------
+# Per-listener queue (queued dispatch mode)
+# ---------------------------------------------------------------------------
+
+
+class _ListenerQueue:
+    """Bounded event queue + worker task feeding a single listener callback."""
+
+    def __init__(
+        self,
+        topic: str,
+        callback: Callable[..., Any],
+        maxsize: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        self.topic = topic
+        self.callback = callback
+        self.maxsize = maxsize
+        self.overflow = overflow
+        # Items are (enqueued_at, event).  Coalescing needs keyed replacement.
+        self._items: deque[tuple[float, dict[str, Any]]] = deque()
+        self._keyed: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+
+    def __len__(self) -> int:
+        return len(self._keyed) if self.overflow == "coalesce" else len(self._items)
+
+    async def put(self, event: dict[str, Any]) -> None:
+        if self._closed:
+            return
+        item = (time.monotonic(), event)
+        if self.overflow == "coalesce":
+            key = (event.get("event"), event.get("plan_id"), event.get("action_id"))
+            if key in self._keyed:
+                # Keep the original position and enqueue time, newest payload.
+                self._keyed[key] = (self._keyed[key][0], event)
+                self.coalesced += 1
+            else:
+                if len(self._keyed) >= self.maxsize:
+                    self._keyed.popitem(last=False)
+                    self.dropped += 1
+                self._keyed[key] = item
+        elif self.overflow == "block":
+            while len(self._items) >= self.maxsize:
+                self._not_full.clear()
+                await self._not_full.wait()
+                if self._closed:
+                    return
+            self._items.append(item)
+        else:
+            if len(self._items) >= self.maxsize:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+        self.max_depth = max(self.max_depth, len(self))
+        self._idle.clear()
+        self._not_empty.set()
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _pop(self) -> tuple[float, dict[str, Any]]:
+        if self.overflow == "coalesce":
+            return self._keyed.popitem(last=False)[1]
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+    async def _run(self) -> None:
+        while True:
+            if not len(self):
+                self._not_empty.clear()
+                self._idle.set()
+                await self._not_empty.wait()
+                continue
+            enqueued_at, event = self._pop()
+            self.last_lag = time.monotonic() - enqueued_at
+            try:
+                await self.callback(self.topic, event)
+            except Exception as exc:
+                log.warning(
+                    "event_listener_error",
+                    topic=self.topic,
+                    listener=getattr(self.callback, "__qualname__", str(self.callback)),
+                    error=str(exc),
+                )
+            self.delivered += 1
+
+    async def join(self) -> None:
+        """Wait until every queued event has been delivered."""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the worker.  Pending events are discarded and later puts ignored."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._items.clear()
+        self._keyed.clear()
+        self._not_full.set()
+        self._idle.set()
+
+    def stats(self) -> dict[str, Any]:
+        if self.overflow == "coalesce":
+            head = next(iter(self._keyed.values()), None)
+        else:
+            head = self._items[0] if self._items else None
+        return {
+            "topic": self.topic,
+            "listener": getattr(self.callback, "__qualname__", str(self.callback)),
+            "overflow": self.overflow,
+            "queue_size": self.maxsize,
+            "depth": len(self),
+            "max_depth": self.max_depth,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            # Age of the oldest undelivered event, and queueing delay of the
+            # most recently delivered one.
+            "lag_seconds": time.monotonic() - head[0] if head else 0.0,
+            "last_lag_seconds": self.last_lag,
+        }
+
+
 # ---------------------------------------------------------------------------
 # Abstract interface
 # ---------------------------------------------------------------------------
@@ -83,6 +285,11 @@ class EventBus(ABC):
         # Callback-based listeners: topic → list of async callables.
         self._listeners: dict[str, list[Callable[..., Any]]] = {}
         self._recent_events: deque[dict[str, Any]] = deque(maxlen=500)
+        # Queued dispatch: (topic, callback) → dedicated queue + worker.
+        self._listener_queues: dict[tuple[str, Callable[..., Any]], _ListenerQueue] = {}
+        self._dispatch_mode: DispatchMode = "inline"
+        self._listener_queue_size = 1024
+        self._listener_overflow: OverflowPolicy = "drop_oldest"
 
     @abstractmethod
     async def emit(self, topic: str, event: dict[str, Any]) -> None:
@@ -111,19 +318,57 @@ class EventBus(ABC):
     # Callback-based listener registration (Module Spec v3)
     # ------------------------------------------------------------------
 
+    def configure_listener_dispatch(
+        self,
+        mode: DispatchMode,
+        queue_size: int = 1024,
+        overflow: OverflowPolicy = "drop_oldest",
+    ) -> None:
+        """Set the dispatch mode used for listeners registered from now on.
+
+        Args:
+            mode:       "inline" awaits listeners inside ``emit``; "queued"
+                        gives each listener its own queue and worker task.
+            queue_size: Default per-listener queue bound (queued mode).
+            overflow:   Default overflow policy (queued mode).
+        """
+        self._dispatch_mode = mode
+        self._listener_queue_size = queue_size
+        self._listener_overflow = overflow
+
     def register_listener(
-        self, topic: str, callback: Callable[..., Any]
+        self,
+        topic: str,
+        callback: Callable[..., Any],
+        *,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy | None = None,
     ) -> None:
         """Register a callback that is invoked whenever an event is emitted to *topic*.
 
         The callback must be an async callable with signature::
 
             async def callback(topic: str, event: dict[str, Any]) -> None
+
+        Passing *queue_size* or *overflow* puts this listener on its own
+        queue even when the bus dispatches inline by default.
         """
         if topic not in self._listeners:
             self._listeners[topic] = []
         if callback not in self._listeners[topic]:
             self._listeners[topic].append(callback)
+            queued = (
+                self._dispatch_mode == "queued"
+                or queue_size is not None
+                or overflow is not None
+            )
+            if queued:
+                self._listener_queues[(topic, callback)] = _ListenerQueue(
+                    topic,
+                    callback,
+                    maxsize=queue_size or self._listener_queue_size,
+                    overflow=overflow or self._listener_overflow,
+                )
 
     def unregister_listener(
         self, topic: str, callback: Callable[..., Any]
@@ -136,6 +381,9 @@ class EventBus(ABC):
                 pass
             if not self._listeners[topic]:
                 del self._listeners[topic]
+        queue = self._listener_queues.pop((topic, callback), None)
+        if queue is not None:
+            queue.close()
 
     def unregister_all_listeners(self, callback: Callable[..., Any]) -> None:
         """Remove a listener from ALL topics it is registered on."""
@@ -148,6 +396,10 @@ class EventBus(ABC):
         if not listeners:
             return
         for cb in listeners:
+            queue = self._listener_queues.get((topic, cb))
+            if queue is not None:
+                await queue.put(event)
+                continue
             try:
                 await cb(topic, event)
             except Exception as exc:
@@ -158,12 +410,33 @@ class EventBus(ABC):
                     error=str(exc),
                 )
 
-    def _stamp(self, topic: str, event: dict[str, Any]) -> dict[str, Any]:
-        """Add metadata fields to *event* in-place and return it."""
-        event.setdefault("_topic", topic)
-        event.setdefault("_timestamp", time.time())
-        self._recent_events.append(dict(event))  # Add copy to ring buffer
-        return event
+    def listener_stats(self) -> list[dict[str, Any]]:
+        """Queue depth, drop/coalesce counters and lag for each queued listener."""
+        return [q.stats() for q in self._listener_queues.values()]
+
+    async def drain_listeners(self) -> None:
+        """Wait until every queued listener has processed its pending events."""
+        for queue in list(self._listener_queues.values()):
+            await queue.join()
+
+    def close_listeners(self) -> None:
+        """Stop all listener worker tasks, discarding undelivered events."""
+        for queue in self._listener_queues.values():
+            queue.close()
+
+    def _stamp(self, topic: str, event: dict[str, Any]) -> FrozenEvent:
+        """Add metadata fields to *event* in-place and return its frozen form.
+
+        An already-frozen event (forwarded by an outer bus) is shared as-is.
+        """
+        if isinstance(event, FrozenEvent):
+            frozen = event
+        else:
+            event.setdefault("_topic", topic)
+            event.setdefault("_timestamp", time.time())
+            frozen = FrozenEvent(event)
+        self._recent_events.append(frozen)
+        return frozen
 
 
 # ---------------------------------------------------------------------------
@@ -181,8 +454,8 @@ class NullEventBus(EventBus):
     async def emit(self, topic: str, event: dict[str, Any]) -> None:
         # Still dispatch to listeners even though storage is a no-op.
         if self._listeners:
-            self._stamp(topic, event)
-            await self._dispatch_to_listeners(topic, event)
+            frozen = self._stamp(topic, event)
+            await self._dispatch_to_listeners(topic, frozen)
 
 
 # ---------------------------------------------------------------------------
@@ -197,44 +470,263 @@ class LogEventBus(EventBus):
     writing in ``AuditLogger`` and allows the same log file to receive events
     from any producer (not just the audit system).
 
+    By default every ``emit`` appends its line before returning.  With
+    ``buffered=True`` lines are serialised into an in-memory buffer and a
+    background writer task appends them in batches — every
+    *flush_interval* seconds or as soon as *flush_max_events* lines are
+    pending — using a file handle kept open between batches, off the event
+    loop.  At most *max_pending* lines are buffered; beyond that *overflow*
+    decides whether ``emit`` waits for the writer ("block", lossless) or
+    the oldest buffered line is discarded ("drop_oldest").  Call
+    :meth:`close` on shutdown to flush the tail.
+
+    When *max_bytes* is set, the file is rotated before a write would grow
+    it past that size: ``events.ndjson`` → ``events.ndjson.1`` → … up to
+    *backup_count* files.
+
     Usage::
 
         bus = LogEventBus(Path("~/.llmos/events.ndjson"))
         await bus.emit(TOPIC_ACTIONS, {"event": "action_started", "action_id": "a1"})
     """
 
-    def __init__(self, log_file: Path | None = None) -> None:
+    def __init__(
+        self,
+        log_file: Path | None = None,
+        *,
+        buffered: bool = False,
+        flush_interval: float = 0.05,
+        flush_max_events: int = 256,
+        max_pending: int = 10_000,
+        overflow: Literal["block", "drop_oldest"] = "block",
+        fsync: bool = False,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+    ) -> None:
         super().__init__()
         self._file = log_file.expanduser() if log_file else None
         self._lock = asyncio.Lock()
+        self._dir_ready = False
+        self._buffered = buffered and self._file is not None
+        self._flush_interval = flush_interval
+        self._flush_max_events = flush_max_events
+        self._max_pending = max_pending
+        self._overflow = overflow
+        self._fsync = fsync
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        # Buffered mode state.
+        self._pending: deque[str] = deque()
+        self._wakeup = asyncio.Event()
+        # Set whenever the writer takes a batch (producers blocked on a full
+        # buffer) and whenever a batch is done (``flush`` waiters).
+        self._space = asyncio.Event()
+        self._progress = asyncio.Event()
+        self._enqueued = 0  # lines accepted into the buffer
+        self._settled = 0  # lines written, failed or dropped
+        self._closing = False
+        self._writer_task: asyncio.Task[None] | None = None
+        self._handle: Any = None
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
 
     async def emit(self, topic: str, event: dict[str, Any]) -> None:
-        self._stamp(topic, event)
-        log.debug("event_bus_emit", topic=topic, event_type=event.get("event"))
+        frozen = self._stamp(topic, event)
+        log.debug("event_bus_emit", topic=topic, event_type=frozen.get("event"))
         if self._file is not None:
-            line = json.dumps(event, default=str) + "\n"
-            async with self._lock:
-                try:
-                    self._file.parent.mkdir(parents=True, exist_ok=True)
-                    with self._file.open("a", encoding="utf-8") as f:
-                        f.write(line)
-                except OSError as exc:
-                    log.error("event_bus_write_failed", topic=topic, error=str(exc))
-        await self._dispatch_to_listeners(topic, event)
+            line = frozen.json() + "\n"
+            if self._buffered:
+                await self._enqueue(line)
+            else:
+                async with self._lock:
+                    try:
+                        self._append(line)
+                    except OSError as exc:
+                        log.error("event_bus_write_failed", topic=topic, error=str(exc))
+        await self._dispatch_to_listeners(topic, frozen)
 
     def emit_sync(self, topic: str, event: dict[str, Any]) -> None:
-        """Synchronous variant for use outside async contexts (e.g. module __init__)."""
-        self._stamp(topic, event)
+        """Synchronous variant for use outside async contexts (e.g. module __init__).
+
+        In buffered mode the line joins the writer's buffer (never blocking,
+        even when full) so it keeps its place in the stream and never races
+        the writer thread on the file.
+        """
+        frozen = self._stamp(topic, event)
         if self._file is None:
             return
-        line = json.dumps(event, default=str) + "\n"
+        line = frozen.json() + "\n"
+        if self._buffered:
+            if len(self._pending) >= self._max_pending and self._overflow == "drop_oldest":
+                self._pending.popleft()
+                self._dropped += 1
+                self._settled += 1
+            self._pending.append(line)
+            self._enqueued += 1
+            with contextlib.suppress(RuntimeError):
+                # Outside a running loop the line waits for the next
+                # emit / flush / close to start the writer.
+                self._ensure_writer()
+            return
         try:
-            self._file.parent.mkdir(parents=True, exist_ok=True)
-            with self._file.open("a", encoding="utf-8") as f:
-                f.write(line)
+            self._append(line)
         except OSError as exc:
             log.error("event_bus_sync_write_failed", topic=topic, error=str(exc))
 
+    async def flush(self) -> None:
+        """Wait until every line buffered before this call has been written.
+
+        Lines emitted while waiting are not waited for, so a steady stream
+        of producers cannot keep ``flush`` from returning.
+        """
+        if not self._buffered:
+            return
+        target = self._enqueued
+        if self._settled >= target:
+            return
+        self._ensure_writer()
+        while self._settled < target:
+            self._progress.clear()
+            self._wakeup.set()
+            await self._progress.wait()
+
+    async def close(self) -> None:
+        """Flush buffered lines, stop the writer task and close the file."""
+        if self._pending:
+            self._ensure_writer()
+        if self._writer_task is not None:
+            # Let the writer drain the buffer and finish its in-flight batch
+            # itself: cancelling it would not stop the worker thread, which
+            # could still be using the handle closed below.
+            self._closing = True
+            self._wakeup.set()
+            await self._writer_task
+            self._writer_task = None
+            self._closing = False
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def stats(self) -> dict[str, Any]:
+        """Writer counters (buffered mode)."""
+        return {
+            "buffered": self._buffered,
+            "pending": len(self._pending),
+            "written": self._written,
+            "dropped": self._dropped,
+            "batches": self._batches,
+        }
+
+    # ------------------------------------------------------------------
+    # Private
+    # ------------------------------------------------------------------
+
+    def _ensure_writer(self) -> None:
+        if self._writer_task is None:
+            self._writer_task = asyncio.get_running_loop().create_task(self._writer_loop())
+
+    async def _enqueue(self, line: str) -> None:
+        self._ensure_writer()
+        while len(self._pending) >= self._max_pending:
+            if self._overflow == "drop_oldest":
+                self._pending.popleft()
+                self._dropped += 1
+                self._settled += 1
+                break
+            self._space.clear()
+            self._wakeup.set()
+            await self._space.wait()
+        self._pending.append(line)
+        self._enqueued += 1
+        if len(self._pending) >= self._flush_max_events:
+            self._wakeup.set()
+
+    async def _writer_loop(self) -> None:
+        while True:
+            if not self._closing:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            self._wakeup.clear()
+            if not self._pending:
+                if self._closing:
+                    return
+                continue
+            batch = list(self._pending)
+            self._pending.clear()
+            self._space.set()
+            try:
+                await asyncio.to_thread(self._write_batch, "".join(batch))
+                self._written += len(batch)
+                self._batches += 1
+            except Exception as exc:
+                # Never let the writer die — producers may be blocked on it.
+                log.error("event_bus_write_failed", lines=len(batch), error=str(exc))
+            self._settled += len(batch)
+            self._progress.set()
+
+    def _write_batch(self, data: str) -> None:
+        """Append *data* through the persistent handle (writer thread)."""
+        assert self._file is not None
+        if self._handle is None:
+            self._prepare_dir()
+            self._handle = self._file.open("a", encoding="utf-8")
+        if self._needs_rotation(len(data)):
+            self._handle.close()
+            self._handle = None
+            self._rotate()
+            self._handle = self._file.open("a", encoding="utf-8")
+        self._handle.write(data)
+        self._handle.flush()
+        if self._fsync:
+            os.fsync(self._handle.fileno())
+
+    def _append(self, line: str) -> None:
+        """Open, append one line and close (unbuffered mode)."""
+        assert self._file is not None
+        self._prepare_dir()
+        if self._needs_rotation(len(line)):
+            self._rotate()
+        try:
+            f = self._file.open("a", encoding="utf-8")
+        except FileNotFoundError:
+            # Directory removed since the first write — recreate it once.
+            self._dir_ready = False
+            self._prepare_dir()
+            f = self._file.open("a", encoding="utf-8")
+        with f:
+            f.write(line)
+            if self._fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _prepare_dir(self) -> None:
+        if not self._dir_ready:
+            assert self._file is not None
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+    def _needs_rotation(self, incoming: int) -> bool:
+        if self._max_bytes is None:
+            return False
+        assert self._file is not None
+        try:
+            size = self._file.stat().st_size
+        except FileNotFoundError:
+            return False
+        return size > 0 and size + incoming > self._max_bytes
+
+    def _rotate(self) -> None:
+        assert self._file is not None
+        if self._backup_count <= 0:
+            self._file.unlink(missing_ok=True)
+            return
+        for i in range(self._backup_count - 1, 0, -1):
+            src = self._file.with_name(f"{self._file.name}.{i}")
+            if src.exists():
+                os.replace(src, self._file.with_name(f"{self._file.name}.{i + 1}"))
+        os.replace(self._file, self._file.with_name(f"{self._file.name}.1"))
+
 
 # ---------------------------------------------------------------------------
 # FanoutEventBus — broadcast to multiple backends simultaneously
@@ -261,10 +753,16 @@ class FanoutEventBus(EventBus):
         super().__init__()
         self._backends = backends
 
+    def close_listeners(self) -> None:
+        """Stop listener workers here and on every backend (e.g. a nested local bus)."""
+        super().close_listeners()
+        for backend in self._backends:
+            backend.close_listeners()
+
     async def emit(self, topic: str, event: dict[str, Any]) -> None:
-        self._stamp(topic, event)
+        frozen = self._stamp(topic, event)
         await asyncio.gather(
-            *(b.emit(topic, dict(event)) for b in self._backends),
+            *(b.emit(topic, frozen) for b in self._backends),
             return_exceptions=True,
         )
-        await self._dispatch_to_listeners(topic, event)
+        await self._dispatch_to_listeners(topic, frozen)
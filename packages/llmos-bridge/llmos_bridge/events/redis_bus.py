@@ -11,11 +11,23 @@ a stub that raises ``RuntimeError`` on instantiation.
 Install the extra with::
 
     pip install llmos-bridge[redis]
+
+Batching:
+    With ``batch=True`` ``emit`` only serialises the event and appends it to
+    a per-stream buffer.  A background task flushes all buffers in one
+    non-transactional pipeline — one network round trip for the whole
+    batch — every *flush_interval* seconds, or as soon as
+    *batch_max_events* events are pending.  ``status()`` reports the
+    batch-size histogram and flush latency.
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+import contextlib
 import json
+import time
 from typing import Any
 
 from llmos_bridge.logging import get_logger
@@ -30,7 +42,7 @@ except ImportError:
     _REDIS_AVAILABLE = False
 
 if _REDIS_AVAILABLE:
-    from llmos_bridge.events.bus import EventBus
+    from llmos_bridge.events.bus import EventBus, FrozenEvent
 
     class RedisStreamsBus(EventBus):
         """Publish events to Redis Streams (XADD).
@@ -47,27 +59,58 @@ if _REDIS_AVAILABLE:
             redis_url: str,
             node_name: str,
             max_length: int = 10_000,
+            *,
+            batch: bool = False,
+            flush_interval: float = 0.005,
+            batch_max_events: int = 128,
         ) -> None:
             super().__init__()
             self._redis_url = redis_url
             self._node_name = node_name
             self._max_length = max_length
             self._redis: aioredis.Redis | None = None  # type: ignore[name-defined]
+            # Batching state: stream key → serialised payloads, in emit order.
+            self._batch = batch
+            self._flush_interval = flush_interval
+            self._batch_max_events = batch_max_events
+            self._pending: dict[str, list[str]] = {}
+            self._pending_count = 0
+            self._wakeup = asyncio.Event()
+            self._flush_task: asyncio.Task[None] | None = None
+            self._flush_lock = asyncio.Lock()
+            self._closing = False
+            # Metrics.
+            self._published = 0
+            self._failed = 0
+            self._flushes = 0
+            self._batch_sizes: dict[int, int] = {}
+            self._flush_latencies: deque[float] = deque(maxlen=1024)
 
         # -- Lifecycle -------------------------------------------------------
 
         async def connect(self) -> None:
             """Create the async Redis connection."""
+            self._closing = False
             self._redis = aioredis.from_url(  # type: ignore[attr-defined]
                 self._redis_url, decode_responses=True,
             )
             log.info("redis_bus_connected", url=self._redis_url, node=self._node_name)
 
         async def close(self) -> None:
-            """Close the Redis connection."""
+            """Flush pending batches and close the Redis connection.
+
+            The flush loop is asked to stop rather than cancelled, so a batch
+            already taken off the buffers is published before the final flush.
+            """
+            self._closing = True
+            if self._flush_task is not None:
+                self._wakeup.set()
+                await self._flush_task
+                self._flush_task = None
+            await self.flush()
             if self._redis is not None:
-                await self._redis.aclose()
-                self._redis = None
+                redis, self._redis = self._redis, None
+                await redis.aclose()
                 log.info("redis_bus_closed")
 
         @property
@@ -81,22 +124,113 @@ if _REDIS_AVAILABLE:
             if self._redis is None:
                 return
 
-            self._stamp(topic, event)
-            event["_source_node"] = self._node_name
+            if not isinstance(event, FrozenEvent):
+                event["_source_node"] = self._node_name
+            frozen = self._stamp(topic, event)
 
             stream_key = f"llmos:{topic}"
             try:
-                payload = json.dumps(event, default=str)
-                await self._redis.xadd(
-                    stream_key,
-                    {"data": payload},
-                    maxlen=self._max_length,
-                    approximate=True,
-                )
+                payload = self._payload(frozen)
+                if self._batch:
+                    self._enqueue(stream_key, payload)
+                else:
+                    await self._redis.xadd(
+                        stream_key,
+                        {"data": payload},
+                        maxlen=self._max_length,
+                        approximate=True,
+                    )
+                    self._published += 1
             except Exception as exc:
+                self._failed += 1
                 log.warning("redis_emit_failed", topic=topic, error=str(exc))
 
-            await self._dispatch_to_listeners(topic, event)
+            await self._dispatch_to_listeners(topic, frozen)
+
+        def _payload(self, event: FrozenEvent) -> str:
+            """Serialised *event* tagged with ``_source_node``.
+
+            Reuses the event's cached JSON; a shared event forwarded by an
+            outer bus gets the tag spliced in instead of being re-encoded.
+            """
+            base = event.json()
+            if "_source_node" in event:
+                return base
+            tag = '"_source_node": ' + json.dumps(self._node_name)
+            return base[:-1] + ", " + tag + "}" if len(event) else "{" + tag + "}"
+
+        # -- Batching --------------------------------------------------------
+
+        async def flush(self) -> None:
+            """Publish every pending event in a single pipeline.  Never raises."""
+            async with self._flush_lock:
+                if not self._pending_count or self._redis is None:
+                    return
+                pending, count = self._pending, self._pending_count
+                self._pending, self._pending_count = {}, 0
+                start = time.perf_counter()
+                try:
+                    pipe = self._redis.pipeline(transaction=False)
+                    for stream_key, payloads in pending.items():
+                        for payload in payloads:
+                            pipe.xadd(
+                                stream_key,
+                                {"data": payload},
+                                maxlen=self._max_length,
+                                approximate=True,
+                            )
+                    await pipe.execute()
+                except Exception as exc:
+                    self._failed += count
+                    log.warning("redis_batch_flush_failed", events=count, error=str(exc))
+                    return
+                self._flush_latencies.append(time.perf_counter() - start)
+                self._published += count
+                self._flushes += 1
+                bucket = 1 << (count - 1).bit_length()
+                self._batch_sizes[bucket] = self._batch_sizes.get(bucket, 0) + 1
+
+        def status(self) -> dict[str, Any]:
+            """Publication counters, batch-size histogram and flush latency."""
+            latencies = sorted(self._flush_latencies)
+
+            def pct(q: float) -> float:
+                if not latencies:
+                    return 0.0
+                return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+            return {
+                "connected": self.is_connected,
+                "mode": "batch" if self._batch else "per_event",
+                "published": self._published,
+                "failed": self._failed,
+                "pending": self._pending_count,
+                "flushes": self._flushes,
+                # Histogram buckets are upper bounds: "4" counts batches of 3-4 events.
+                "batch_size_histogram": {
+                    str(k): v for k, v in sorted(self._batch_sizes.items())
+                },
+                "flush_latency_ms": {
+                    "p50": pct(0.50),
+                    "p95": pct(0.95),
+                    "max": latencies[-1] * 1000 if latencies else 0.0,
+                },
+            }
+
+        def _enqueue(self, stream_key: str, payload: str) -> None:
+            self._pending.setdefault(stream_key, []).append(payload)
+            self._pending_count += 1
+            if self._flush_task is None and not self._closing:
+                self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+            if self._pending_count >= self._batch_max_events:
+                self._wakeup.set()
+
+        async def _flush_loop(self) -> None:
+            while not self._closing:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+                self._wakeup.clear()
+                await self.flush()
 
 else:
     # redis package not installed — provide a stub so imports never crash.
@@ -35,6 +35,16 @@ Usage::
     # Inject as event_bus everywhere
     executor = PlanExecutor(..., event_bus_unused_param=router)
 
+Matching cost
+-------------
+Routes are indexed in a segment trie (literal / ``*`` / trailing ``#``
+children per node), so resolving a topic walks at most one path per
+wildcard branch — cost grows with topic depth, not route count.  The
+matched route list is then memoised per topic until the next
+``add_route`` / ``remove_route``.  Patterns the trie cannot represent
+(partial-segment wildcards such as ``llmos.file*`` or a non-trailing
+``#``) are checked with a compiled regex cached per pattern.
+
 Note: the fallback receives events with NO matching route only.
 Handlers registered via add_route receive events in addition to the
 fallback (not instead of it).  To suppress fallback for certain topics,
@@ -43,8 +53,12 @@ do not set a fallback and register explicit routes for everything.
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import functools
 import re
-from typing import Any, Awaitable, Callable, Union
+from re import Pattern
+from typing import Any, Union
 
 from llmos_bridge.events.bus import EventBus
 from llmos_bridge.logging import get_logger
@@ -75,29 +89,170 @@ def topic_matches(pattern: str, topic: str) -> bool:
         topic_matches("llmos.iot.#", "llmos.iot.sensors.temp")          → True
         topic_matches("#", "any.topic.ever")                            → True
     """
-    if "#" not in pattern and "*" not in pattern:
+    regex = _compile_pattern(pattern)
+    if regex is None:
         return pattern == topic
+    return regex.fullmatch(topic) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str) -> Pattern[str] | None:
+    """Compile an MQTT-style *pattern* to a regex (None for literal patterns)."""
+    if "#" not in pattern and "*" not in pattern:
+        return None
 
-    # Build a regex from the MQTT-style pattern.
     # Special case: "parent.#" should match "parent" (no sub-topic) AND
     # "parent.sub1" AND "parent.sub1.sub2" — i.e. the separator before # is optional.
     # Strategy: first collapse trailing ".#" into "(\..+)?" before parsing.
-    normalized = pattern
-    if normalized.endswith(".#"):
+    if pattern.endswith(".#"):
         # "a.b.#" → match "a.b" or "a.b.<anything>"
-        prefix = re.escape(normalized[:-2])  # escape "a.b"
-        return bool(re.fullmatch(prefix + r"(\..+)?", topic))
+        prefix = re.escape(pattern[:-2])  # escape "a.b"
+        return re.compile(prefix + r"(\..+)?")
 
     regex_parts: list[str] = []
-    for segment in re.split(r"(\*|#)", normalized):
+    for segment in re.split(r"(\*|#)", pattern):
         if segment == "#":
             regex_parts.append(".*")
         elif segment == "*":
             regex_parts.append(r"[^.]+")
         else:
             regex_parts.append(re.escape(segment))
-    regex = "".join(regex_parts)
-    return bool(re.fullmatch(regex, topic))
+    return re.compile("".join(regex_parts))
+
+
+# ---------------------------------------------------------------------------
+# Route index
+# ---------------------------------------------------------------------------
+
+
+@dataclass(eq=False)
+class _Route:
+    seq: int
+    pattern: str
+    handler: EventHandler
+
+
+@dataclass(eq=False)
+class _TrieNode:
+    literal: dict[str, _TrieNode] = field(default_factory=dict)
+    star: _TrieNode | None = None
+    # Routes whose pattern ends at this node.
+    exact: list[_Route] = field(default_factory=list)
+    # Routes whose pattern is "<path to this node>.#".
+    subtree: list[_Route] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.literal or self.star or self.exact or self.subtree)
+
+
+def _trie_path(pattern: str) -> tuple[list[str], bool] | None:
+    """Split *pattern* into trie segments, or None if it needs a regex.
+
+    Returns ``(segments, subtree)`` where *subtree* is True for a trailing
+    ``.#``.  Semantics mirror :func:`topic_matches` exactly: ``*`` only as
+    a whole segment, and in a ``.#`` pattern the prefix is literal.
+    """
+    if pattern.endswith(".#"):
+        prefix = pattern[:-2]
+        if "*" in prefix or "#" in prefix:
+            return None
+        return prefix.split("."), True
+    if "#" in pattern:
+        return None
+    segments = pattern.split(".")
+    if any("*" in seg and seg != "*" for seg in segments):
+        return None
+    return segments, False
+
+
+class _RouteIndex:
+    """Segment trie over route patterns with a per-topic match cache."""
+
+    _CACHE_LIMIT = 4096
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        # "#" matches everything (including the empty topic).
+        self._catch_all: list[_Route] = []
+        # Patterns the trie cannot express — matched with cached regexes.
+        self._irregular: list[_Route] = []
+        self._cache: dict[str, tuple[_Route, ...]] = {}
+
+    def add(self, route: _Route) -> None:
+        self._cache.clear()
+        if route.pattern == "#":
+            self._catch_all.append(route)
+            return
+        path = _trie_path(route.pattern)
+        if path is None:
+            self._irregular.append(route)
+            return
+        segments, subtree = path
+        node = self._root
+        for seg in segments:
+            if seg == "*":
+                if node.star is None:
+                    node.star = _TrieNode()
+                node = node.star
+            else:
+                node = node.literal.setdefault(seg, _TrieNode())
+        (node.subtree if subtree else node.exact).append(route)
+
+    def remove(self, route: _Route) -> None:
+        self._cache.clear()
+        if route.pattern == "#":
+            self._catch_all.remove(route)
+            return
+        path = _trie_path(route.pattern)
+        if path is None:
+            self._irregular.remove(route)
+            return
+        segments, subtree = path
+        trail: list[tuple[_TrieNode, str]] = []
+        node = self._root
+        for seg in segments:
+            trail.append((node, seg))
+            node = node.star if seg == "*" else node.literal[seg]  # type: ignore[assignment]
+        (node.subtree if subtree else node.exact).remove(route)
+        # Prune now-empty branches.
+        for parent, seg in reversed(trail):
+            if not node.is_empty():
+                break
+            if seg == "*":
+                parent.star = None
+            else:
+                del parent.literal[seg]
+            node = parent
+
+    def match(self, topic: str) -> tuple[_Route, ...]:
+        """Routes matching *topic*, in registration order."""
+        cached = self._cache.get(topic)
+        if cached is not None:
+            return cached
+        found: list[_Route] = list(self._catch_all)
+        self._walk(self._root, topic.split("."), 0, found)
+        found.extend(r for r in self._irregular if topic_matches(r.pattern, topic))
+        found.sort(key=lambda r: r.seq)
+        result = tuple(found)
+        if len(self._cache) >= self._CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[topic] = result
+        return result
+
+    def _walk(self, node: _TrieNode, segments: list[str], i: int, out: list[_Route]) -> None:
+        remaining = len(segments) - i
+        # "prefix.#" matches the prefix itself or any non-empty continuation.
+        if node.subtree and not (remaining == 1 and segments[i] == ""):
+            out.extend(node.subtree)
+        if remaining == 0:
+            out.extend(node.exact)
+            return
+        seg = segments[i]
+        child = node.literal.get(seg)
+        if child is not None:
+            self._walk(child, segments, i + 1, out)
+        if node.star is not None and seg:
+            self._walk(node.star, segments, i + 1, out)
 
 
 # ---------------------------------------------------------------------------
@@ -127,8 +282,10 @@ class EventRouter(EventBus):
                       Typically ``NullEventBus()`` or ``LogEventBus(path)``.
         """
         super().__init__()
-        # List of (pattern, handler) pairs — checked in registration order
-        self._routes: list[tuple[str, EventHandler]] = []
+        # Routes in registration order; _index answers "which routes match".
+        self._routes: list[_Route] = []
+        self._index = _RouteIndex()
+        self._next_seq = 0
         self._fallback = fallback
 
     # ---------------------------------------------------------------------------
@@ -142,7 +299,10 @@ class EventRouter(EventBus):
         The same (pattern, handler) pair may be registered multiple times
         without deduplication — it will be called multiple times per event.
         """
-        self._routes.append((pattern, handler))
+        route = _Route(self._next_seq, pattern, handler)
+        self._next_seq += 1
+        self._routes.append(route)
+        self._index.add(route)
         log.debug("event_route_added", pattern=pattern, handler=getattr(handler, "__qualname__", repr(handler)))
 
     def remove_route(self, pattern: str, handler: EventHandler) -> None:
@@ -151,9 +311,10 @@ class EventRouter(EventBus):
         If the pair was registered multiple times, only the first occurrence
         is removed.
         """
-        for i, (p, h) in enumerate(self._routes):
-            if p == pattern and h is handler:
+        for i, route in enumerate(self._routes):
+            if route.pattern == pattern and route.handler is handler:
                 self._routes.pop(i)
+                self._index.remove(route)
                 log.debug("event_route_removed", pattern=pattern)
                 return
 
@@ -172,25 +333,23 @@ class EventRouter(EventBus):
         Errors in individual handlers are caught and logged — they never
         propagate to the caller (EventBus contract: ``emit`` must not raise).
         """
-        self._stamp(topic, event)
-
-        matched = False
-        for pattern, handler in self._routes:
-            if topic_matches(pattern, topic):
-                matched = True
-                try:
-                    result = handler(topic, event)
-                    if hasattr(result, "__await__"):
-                        await result  # type: ignore[misc]
-                except Exception as exc:
-                    log.error(
-                        "event_route_handler_error",
-                        pattern=pattern,
-                        topic=topic,
-                        error=str(exc),
-                    )
-
-        if not matched and self._fallback is not None:
+        event = self._stamp(topic, event)
+
+        routes = self._index.match(topic)
+        for route in routes:
+            try:
+                result = route.handler(topic, event)
+                if hasattr(result, "__await__"):
+                    await result  # type: ignore[misc]
+            except Exception as exc:
+                log.error(
+                    "event_route_handler_error",
+                    pattern=route.pattern,
+                    topic=topic,
+                    error=str(exc),
+                )
+
+        if not routes and self._fallback is not None:
             try:
                 await self._fallback.emit(topic, event)
             except Exception as exc:
@@ -197,8 +197,14 @@ class ContextManagerModule(BaseModule):
         cognitive_text: str = "",
         memory_text: str = "",
         messages: list[dict[str, Any]] | None = None,
+        history_tokens: int | None = None,
     ) -> None:
-        """Update current context state. Called by the runtime before each LLM call."""
+        """Update current context state. Called by the runtime before each LLM call.
+
+        ``history_tokens`` is the content token count of *messages* when the
+        caller already tracks it (counted with ``count_tokens``); otherwise the
+        messages are recounted.
+        """
         if system_prompt:
             self._current_system_prompt = system_prompt
         if tools_json:
@@ -209,9 +215,12 @@ class ContextManagerModule(BaseModule):
             self._current_memory_text = memory_text
         if messages is not None:
             self._current_messages = messages
-            self._current_history_tokens = sum(
-                count_tokens(m.get("content", "")) for m in messages
-            )
+            if history_tokens is not None:
+                self._current_history_tokens = history_tokens
+            else:
+                self._current_history_tokens = sum(
+                    count_tokens(m.get("content", "")) for m in messages
+                )
 
     # ─── Budget Computation ───────────────────────────────────────
 
@@ -3,14 +3,23 @@
 from llmos_bridge.orchestration.dag import DAGScheduler
 from llmos_bridge.orchestration.executor import PlanExecutor
 from llmos_bridge.orchestration.resource_manager import ResourceManager
+from llmos_bridge.orchestration.result_store import ResultBlobStore
 from llmos_bridge.orchestration.rollback import RollbackEngine
-from llmos_bridge.orchestration.state import ExecutionState, PlanStateStore
+from llmos_bridge.orchestration.state import (
+    BaseStateStore,
+    ExecutionState,
+    InMemoryStateStore,
+    PlanStateStore,
+)
 
 __all__ = [
     "DAGScheduler",
+    "BaseStateStore",
     "PlanStateStore",
+    "InMemoryStateStore",
     "ExecutionState",
     "PlanExecutor",
     "ResourceManager",
+    "ResultBlobStore",
     "RollbackEngine",
 ]
@@ -5,6 +5,16 @@ waves for both sequential and parallel execution modes.
 
 A "wave" is a batch of actions whose dependencies are all satisfied and
 that can be dispatched concurrently.
+
+For dataflow scheduling, :meth:`DAGScheduler.dataflow` returns a
+:class:`DataflowTracker` that releases each action the moment its last
+dependency finishes, instead of waiting for the whole wave to drain.
+
+With ``critical_path=True`` every action is given a priority equal to its
+longest remaining path to a sink, weighted by (historical) per
+``module.action`` durations.  Ready actions are then ordered by descending
+priority instead of alphabetically, so work on the critical path is
+dispatched before leaf actions nobody is waiting on.
 """
 
 from __future__ import annotations
@@ -27,6 +37,55 @@ class ExecutionWave:
     is_final: bool = False
 
 
+class DataflowTracker:
+    """Incremental in-degree bookkeeping for ready-queue (dataflow) dispatch.
+
+    Unlike :meth:`DAGScheduler.waves`, no barrier is placed between
+    generations: :meth:`complete` decrements the in-degree of each direct
+    successor and returns those that just became ready.
+
+    Usage::
+
+        tracker = scheduler.dataflow()
+        ready = tracker.initial_ready()
+        # ... when an action finishes:
+        ready.extend(tracker.complete(action_id))
+    """
+
+    def __init__(self, graph: nx.DiGraph, priorities: dict[str, float] | None = None) -> None:
+        self._graph = graph
+        self._priorities = priorities or {}
+        self._in_degree: dict[str, int] = {n: graph.in_degree(n) for n in graph.nodes}
+        self._completed: set[str] = set()
+
+    def _order(self, action_ids: list[str]) -> list[str]:
+        return sorted(action_ids, key=lambda n: (-self._priorities.get(n, 0.0), n))
+
+    def initial_ready(self) -> list[str]:
+        """Return the actions with no dependencies, highest priority first."""
+        return self._order([n for n, deg in self._in_degree.items() if deg == 0])
+
+    def complete(self, action_id: str) -> list[str]:
+        """Mark *action_id* as finished and return newly-ready successors.
+
+        Completing the same action twice is a no-op (returns an empty list).
+        """
+        if action_id in self._completed:
+            return []
+        self._completed.add(action_id)
+        newly_ready: list[str] = []
+        for succ in self._graph.successors(action_id):
+            self._in_degree[succ] -= 1
+            if self._in_degree[succ] == 0:
+                newly_ready.append(succ)
+        return self._order(newly_ready)
+
+    @property
+    def remaining(self) -> int:
+        """Number of actions that have not been marked complete."""
+        return len(self._in_degree) - len(self._completed)
+
+
 class DAGScheduler:
     """Builds and queries the execution graph for a plan.
 
@@ -35,11 +94,28 @@ class DAGScheduler:
         scheduler = DAGScheduler(plan)
         for wave in scheduler.waves():
             # dispatch all actions in `wave.action_ids` concurrently
+
+    Pass ``critical_path=True`` with ``action_durations`` (expected seconds
+    per ``"module.action"``, e.g. from
+    :meth:`PlanStateStore.action_duration_stats`) to order ready actions by
+    longest remaining path.  Actions without history weigh
+    ``default_duration``.
     """
 
-    def __init__(self, plan: IMLPlan) -> None:
+    def __init__(
+        self,
+        plan: IMLPlan,
+        critical_path: bool = False,
+        action_durations: dict[str, float] | None = None,
+        default_duration: float = 1.0,
+    ) -> None:
         self._plan = plan
         self._graph = self._build_graph(plan)
+        self._priorities: dict[str, float] = (
+            self._critical_path_lengths(plan, action_durations or {}, default_duration)
+            if critical_path
+            else {}
+        )
 
     @staticmethod
     def _build_graph(plan: IMLPlan) -> nx.DiGraph:
@@ -60,6 +136,27 @@ class DAGScheduler:
 
         return graph
 
+    def _critical_path_lengths(
+        self,
+        plan: IMLPlan,
+        durations: dict[str, float],
+        default_duration: float,
+    ) -> dict[str, float]:
+        """Longest weighted path from each action to any sink (inclusive)."""
+        weights = {
+            action.id: durations.get(f"{action.module}.{action.action}", default_duration)
+            for action in plan.actions
+        }
+        lengths: dict[str, float] = {}
+        for node in reversed(list(nx.topological_sort(self._graph))):
+            tail = max((lengths[s] for s in self._graph.successors(node)), default=0.0)
+            lengths[node] = weights.get(node, default_duration) + tail
+        return lengths
+
+    def priority(self, action_id: str) -> float:
+        """Return the critical-path priority of *action_id* (0.0 when disabled)."""
+        return self._priorities.get(action_id, 0.0)
+
     def waves(self) -> Iterator[ExecutionWave]:
         """Yield :class:`ExecutionWave` instances in topological order.
 
@@ -95,12 +192,16 @@ class DAGScheduler:
             remaining_after = len(graph.nodes) - len(ready)
             yield ExecutionWave(
                 wave_index=wave_index,
-                action_ids=sorted(ready),
+                action_ids=sorted(ready, key=lambda n: (-self.priority(n), n)),
                 is_final=(remaining_after == 0),
             )
             graph.remove_nodes_from(ready)
             wave_index += 1
 
+    def dataflow(self) -> DataflowTracker:
+        """Return a fresh :class:`DataflowTracker` over this plan's graph."""
+        return DataflowTracker(self._graph, self._priorities)
+
     def topological_order(self) -> list[str]:
         """Return all action IDs in a valid topological order."""
         return list(nx.topological_sort(self._graph))
@@ -4,7 +4,8 @@ The PlanExecutor drives the full lifecycle of a plan:
   1. Module version compatibility check (module_requirements)
   2. Build execution graph (DAGScheduler)
   3. Security pre-flight (PermissionGuard.check_plan)
-  4. For each wave of ready actions:
+  4. For each wave of ready actions (or, in dataflow mode, for each action
+     as soon as its dependencies have finished):
      a. Skip actions whose dependencies failed (cascade failure)
      b. Resolve {{result.X.Y}} templates in params
      c. Run per-action security check (PermissionGuard.check_action)
@@ -36,8 +37,11 @@ Perception re-injection:
 from __future__ import annotations
 
 import asyncio
+import heapq
+import json
 import time
-from typing import Any
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Any, Literal
 
 from llmos_bridge.exceptions import (
     ActionExecutionError,
@@ -60,10 +64,11 @@ from llmos_bridge.orchestration.approval import (
 from llmos_bridge.orchestration.dag import DAGScheduler
 from llmos_bridge.orchestration.nodes import LocalNode, NodeRegistry
 from llmos_bridge.orchestration.rollback import RollbackEngine
-from llmos_bridge.orchestration.state import ActionState, ExecutionState, PlanStateStore
+from llmos_bridge.orchestration.state import ActionState, BaseStateStore, ExecutionState
 from llmos_bridge.protocol.compat import ModuleVersionChecker
 from llmos_bridge.protocol.models import (
     ActionStatus,
+    ExecutionMode,
     IMLAction,
     IMLPlan,
     OnErrorBehavior,
@@ -75,12 +80,19 @@ from llmos_bridge.security.audit import AuditEvent, AuditLogger
 from llmos_bridge.security.guard import PermissionGuard
 from llmos_bridge.security.sanitizer import OutputSanitizer
 
+if TYPE_CHECKING:
+    from llmos_bridge.orchestration.result_store import ResultBlobStore
+
 log = get_logger(__name__)
 
 # Key under which perception data is stored inside an action's execution result.
 # Templates can access it as {{result.<action_id>._perception.after_text}}.
 _PERCEPTION_KEY = "_perception"
 
+# How long historical per-action durations are reused for critical-path
+# priorities before re-querying the state store.
+_DURATION_STATS_TTL = 60.0
+
 # Default max result size (512 KB) — overridden by ServerConfig.max_result_size.
 _DEFAULT_MAX_RESULT_SIZE = 524_288
 
@@ -91,17 +103,107 @@ _BINARY_RESULT_KEYS = frozenset({
 })
 
 
+_json_encoder = json.JSONEncoder(default=str)
+
+
+def _json_key_size(key: Any) -> int:
+    """Serialised length of a dict key, including quotes (mirrors json.dumps)."""
+    if isinstance(key, str):
+        return len(encode_basestring_ascii(key))
+    if key is True or key is False or key is None:
+        return len(json.dumps(key)) + 2
+    if isinstance(key, (int, float)):
+        return len(json.dumps(key)) + 2
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _json_leaf_size(value: Any) -> int:
+    """Serialised length of a non-container value (mirrors json.dumps)."""
+    if isinstance(value, str):
+        return len(encode_basestring_ascii(value))
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, int):
+        return len(int.__repr__(value))
+    return len(json.dumps(value, default=str))
+
+
+def _json_size(value: Any, limit: int) -> int:
+    """Return ``len(json.dumps(value, default=str))``, stopping early past *limit*.
+
+    Dicts are walked one item at a time, so a small envelope such as
+    ``{"rows": [...]}`` never hides its payload from the limit.  Lists are
+    measured with the C encoder in batches of doubling size after their
+    first item: a result that fits costs about one ``json.dumps``, and an
+    oversized list is abandoned after roughly twice the limit of output
+    instead of being serialised in full.  Once the running total exceeds
+    *limit* the partial total (already > *limit*) is returned.  The output
+    of ``json.dumps`` is ASCII, so this is also its UTF-8 size.
+    """
+    if isinstance(value, dict):
+        if not value:
+            return 2
+        total = 0  # braces + ", " separators net out to 2 per item
+        for k, v in value.items():
+            total += 2 + _json_key_size(k) + 2 + _json_size(v, limit - total)
+            if total > limit:
+                return total
+        return total
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        # Brackets + ", " separators net out to 2 per item, so an encoded
+        # batch of k items contributes exactly its own length.
+        total = 2 + _json_size(value[0], limit)
+        start, step = 1, 1
+        while start < len(value) and total <= limit:
+            step *= 2
+            total += len(_json_encoder.encode(value[start:start + step]))
+            start += step
+        return total
+    return _json_leaf_size(value)
+
+
+def _json_prefix(value: Any, length: int) -> str:
+    """Return the first *length* characters of ``json.dumps(value, default=str)``.
+
+    Encodes incrementally and stops once enough output has been produced.
+    """
+    parts: list[str] = []
+    produced = 0
+    for chunk in _json_encoder.iterencode(value):
+        parts.append(chunk)
+        produced += len(chunk)
+        if produced >= length:
+            break
+    return "".join(parts)[:length]
+
+
+class _TruncatedSummary(dict[str, Any]):
+    """Summary built by :func:`_truncate_result`.
+
+    A distinct type rather than the ``_truncated`` key marks summaries, so
+    module output echoing ``{"_truncated": true}`` cannot skip the limit.
+    """
+
+
 def _truncate_result(result: Any, max_bytes: int = _DEFAULT_MAX_RESULT_SIZE) -> Any:
     """Truncate oversized action results to prevent LLM context overflow.
 
-    Serialises to JSON to measure size. If oversized, the result is replaced
-    with a summary dict containing the truncated JSON and a warning.
+    Measures the JSON size with :func:`_json_size`, which stops as soon as
+    the limit is exceeded.  If oversized, the result is replaced with a
+    summary dict containing the first *max_bytes* of the JSON and a
+    warning; ``_original_size`` is then a lower bound.  Summaries produced
+    by this function are returned as-is, so calling it again is free.
 
     Binary keys (e.g. ``screenshot_b64``) are excluded from the size check
     and preserved intact — they are passed directly to the LLM as images
     and should not be truncated (which would corrupt the encoding).
     """
-    import json as _json
+    if type(result) is _TruncatedSummary:
+        return result
 
     # Separate binary fields from the rest so they don't inflate the size.
     binary_fields: dict[str, str] = {}
@@ -118,24 +220,30 @@ def _truncate_result(result: Any, max_bytes: int = _DEFAULT_MAX_RESULT_SIZE) ->
     else:
         result_without_binary = result
 
+    fallback: str | None = None
     try:
-        serialised = _json.dumps(result_without_binary, default=str)
-    except (TypeError, ValueError):
-        serialised = str(result_without_binary)
+        size = _json_size(result_without_binary, max_bytes)
+    except (TypeError, ValueError, RecursionError):
+        fallback = str(result_without_binary)
+        size = len(fallback.encode("utf-8", errors="replace"))
 
-    if len(serialised.encode("utf-8", errors="replace")) <= max_bytes:
+    if size <= max_bytes:
         # Under limit — return original (with binary fields intact).
         return result
 
     # Truncate to max_bytes and wrap in a summary.
-    truncated = serialised[:max_bytes]
-    truncated_result = {
+    truncated = (
+        fallback[:max_bytes]
+        if fallback is not None
+        else _json_prefix(result_without_binary, max_bytes)
+    )
+    truncated_result = _TruncatedSummary({
         "_truncated": True,
-        "_original_size": len(serialised),
+        "_original_size": size,
         "_max_size": max_bytes,
         "data": truncated,
-        "warning": f"Result truncated from {len(serialised)} to {max_bytes} bytes.",
-    }
+        "warning": f"Result truncated from at least {size} to {max_bytes} bytes.",
+    })
     # Re-attach binary fields so the LLM still gets the image.
     truncated_result.update(binary_fields)
     return truncated_result
@@ -159,7 +267,7 @@ class PlanExecutor:
         self,
         module_registry: ModuleRegistry,
         guard: PermissionGuard,
-        state_store: PlanStateStore,
+        state_store: BaseStateStore,
         audit_logger: AuditLogger,
         sanitizer: OutputSanitizer | None = None,
         approval_gate: ApprovalGate | None = None,
@@ -174,6 +282,10 @@ class PlanExecutor:
         policy_enforcer: Any | None = None,  # PolicyEnforcer (optional)
         routing_config: Any | None = None,  # RoutingConfig (optional, Phase 4)
         authorization: Any | None = None,  # AuthorizationGuard (optional, Phase 6)
+        scheduling_mode: Literal["wave", "dataflow"] = "wave",
+        max_parallel_actions: int | None = None,
+        critical_path_scheduling: bool = False,
+        result_store: ResultBlobStore | None = None,
     ) -> None:
         self._registry = module_registry
         self._nodes = node_registry or NodeRegistry(LocalNode(module_registry))
@@ -187,10 +299,24 @@ class PlanExecutor:
         self._resource_manager = resource_manager
         self._fallback_chains = fallback_chains or {}
         self._max_result_size = max_result_size
+        # When set, oversized results are spilled to disk instead of being
+        # truncated; execution_results then holds a handle that
+        # TemplateResolver dereferences lazily.
+        self._result_store = result_store
         self._intent_verifier = intent_verifier
         self._scanner_pipeline = scanner_pipeline
         self._policy_enforcer = policy_enforcer
         self._authorization = authorization
+        # "wave": barrier between DAG generations (default).
+        # "dataflow": start each action as soon as its dependencies finish.
+        self._scheduling_mode = scheduling_mode
+        self._max_parallel_actions = max_parallel_actions
+        # Prioritise ready actions by longest remaining path (weighted by
+        # historical durations) both in the ready queue and at the
+        # ResourceManager semaphores.
+        self._critical_path_scheduling = critical_path_scheduling
+        self._duration_stats: dict[str, float] = {}
+        self._duration_stats_at = 0.0
         self._rollback = RollbackEngine(module_registry=module_registry)
         # plan_id → asyncio.Task for background execution tracking
         self._running_tasks: dict[str, asyncio.Task[ExecutionState]] = {}
@@ -418,7 +544,7 @@ class PlanExecutor:
             return state
 
         # ---- Step 3: DAG construction (concurrent with verification) ----
-        scheduler = DAGScheduler(plan)
+        scheduler = await self._build_scheduler(plan)
 
         # ---- Step 3.5: Await intent verification before dispatching actions ----
         if _verification_task is not None:
@@ -500,6 +626,63 @@ class PlanExecutor:
         # Track action IDs that must be skipped due to cascade failure.
         cascade_skipped: set[str] = set()
 
+        if (
+            self._scheduling_mode == "dataflow"
+            and plan.execution_mode == ExecutionMode.PARALLEL
+        ):
+            await self._run_dataflow(
+                plan, scheduler, state, execution_results, cascade_skipped, auth_app,
+            )
+        else:
+            await self._run_waves(
+                plan, scheduler, state, execution_results, cascade_skipped, auth_app,
+            )
+
+        final_status = (
+            PlanStatus.COMPLETED if state.all_completed() else PlanStatus.FAILED
+        )
+        state.plan_status = final_status
+        await self._store.update_plan_status(plan.plan_id, final_status)
+
+        event = (
+            AuditEvent.PLAN_COMPLETED
+            if final_status == PlanStatus.COMPLETED
+            else AuditEvent.PLAN_FAILED
+        )
+        await self._audit.log(event, plan_id=plan.plan_id)
+        log.info("plan_finished", plan_id=plan.plan_id, status=final_status.value)
+
+        return state
+
+    # ------------------------------------------------------------------
+    # Scheduling loops
+    # ------------------------------------------------------------------
+
+    async def _build_scheduler(self, plan: IMLPlan) -> DAGScheduler:
+        """Build the DAG, with critical-path priorities when enabled."""
+        if not self._critical_path_scheduling:
+            return DAGScheduler(plan)
+        now = time.monotonic()
+        if now - self._duration_stats_at > _DURATION_STATS_TTL:
+            try:
+                self._duration_stats = await self._store.action_duration_stats()
+                self._duration_stats_at = now
+            except Exception as exc:
+                log.warning("action_duration_stats_failed", error=str(exc))
+        return DAGScheduler(
+            plan, critical_path=True, action_durations=self._duration_stats
+        )
+
+    async def _run_waves(
+        self,
+        plan: IMLPlan,
+        scheduler: DAGScheduler,
+        state: ExecutionState,
+        execution_results: dict[str, Any],
+        cascade_skipped: set[str],
+        auth_app: Any | None,
+    ) -> None:
+        """Dispatch actions wave by wave, with a barrier between waves."""
         for wave in scheduler.waves():
             # Mark actions in this wave that were already cascade-skipped.
             for aid in wave.action_ids:
@@ -520,6 +703,7 @@ class PlanExecutor:
                     execution_results=execution_results,
                     cascade_skipped=cascade_skipped,
                     auth_app=auth_app,
+                    priority=scheduler.priority(aid),
                 )
                 for aid in runnable
                 if plan.get_action(aid) is not None
@@ -558,21 +742,108 @@ class PlanExecutor:
                 log.warning("plan_aborted_on_failure", plan_id=plan.plan_id)
                 break
 
-        final_status = (
-            PlanStatus.COMPLETED if state.all_completed() else PlanStatus.FAILED
-        )
-        state.plan_status = final_status
-        await self._store.update_plan_status(plan.plan_id, final_status)
+    async def _run_dataflow(
+        self,
+        plan: IMLPlan,
+        scheduler: DAGScheduler,
+        state: ExecutionState,
+        execution_results: dict[str, Any],
+        cascade_skipped: set[str],
+        auth_app: Any | None,
+    ) -> None:
+        """Dispatch each action as soon as all of its dependencies have finished.
+
+        There is no barrier between generations: a slow action only delays
+        its own descendants.  At most ``max_parallel_actions`` actions are in
+        flight at once (unbounded when None).  Ready actions are dispatched
+        highest critical-path priority first (alphabetically when priorities
+        are disabled).
+
+        Cascade semantics match :meth:`_run_waves`: when an action fails with
+        ``on_error=abort``, its descendants are marked SKIPPED, no further
+        actions are dispatched, and actions already in flight run to
+        completion.
+        """
+        tracker = scheduler.dataflow()
+        # Min-heap of (-priority, action_id).
+        ready: list[tuple[float, str]] = [
+            (-scheduler.priority(aid), aid) for aid in tracker.initial_ready()
+        ]
+        heapq.heapify(ready)
+        in_flight: dict[asyncio.Task[None], str] = {}
+        limit = self._max_parallel_actions
+        abort_triggered = False
 
-        event = (
-            AuditEvent.PLAN_COMPLETED
-            if final_status == PlanStatus.COMPLETED
-            else AuditEvent.PLAN_FAILED
-        )
-        await self._audit.log(event, plan_id=plan.plan_id)
-        log.info("plan_finished", plan_id=plan.plan_id, status=final_status.value)
+        try:
+            while ready or in_flight:
+                while (
+                    ready
+                    and not abort_triggered
+                    and (limit is None or len(in_flight) < limit)
+                ):
+                    _, aid = heapq.heappop(ready)
+                    action = plan.get_action(aid)
+                    if action is None:
+                        continue
+                    task = asyncio.create_task(
+                        self._run_action(
+                            plan=plan,
+                            action=action,
+                            state=state,
+                            execution_results=execution_results,
+                            cascade_skipped=cascade_skipped,
+                            auth_app=auth_app,
+                            priority=scheduler.priority(aid),
+                        ),
+                        name=f"action_{plan.plan_id}_{aid}",
+                    )
+                    in_flight[task] = aid
 
-        return state
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    aid = in_flight.pop(task)
+                    if not task.cancelled() and task.exception() is not None:
+                        log.error(
+                            "action_task_crashed", action_id=aid, error=str(task.exception())
+                        )
+                    action = plan.get_action(aid)
+                    if (
+                        action is not None
+                        and state.get_action(aid).status == ActionStatus.FAILED
+                        and action.on_error == OnErrorBehavior.ABORT
+                    ):
+                        new_skips = scheduler.descendants(aid) - cascade_skipped
+                        cascade_skipped.update(new_skips)
+                        if new_skips:
+                            log.warning(
+                                "cascade_skip",
+                                failed_action=aid,
+                                skipped_count=len(new_skips),
+                            )
+                        abort_triggered = True
+                    else:
+                        for succ in tracker.complete(aid):
+                            heapq.heappush(ready, (-scheduler.priority(succ), succ))
+        finally:
+            # Plan cancelled or crashed — do not leave orphaned action tasks.
+            for task in in_flight:
+                task.cancel()
+
+        if abort_triggered:
+            # Same guard as wave mode: actions already skipped (or finished)
+            # while the last tasks drained are not skipped again.
+            for aid in cascade_skipped:
+                if state.get_action(aid).status == ActionStatus.PENDING:
+                    await self._skip_action(
+                        plan.plan_id,
+                        aid,
+                        state,
+                        "Skipped: upstream action failed with abort.",
+                    )
+            log.warning("plan_aborted_on_failure", plan_id=plan.plan_id)
 
     # ------------------------------------------------------------------
     # Action execution
@@ -586,6 +857,7 @@ class PlanExecutor:
         execution_results: dict[str, Any],
         cascade_skipped: set[str],
         auth_app: Any | None = None,
+        priority: float = 0.0,
     ) -> None:
         bind_plan_context(plan_id=plan.plan_id, action_id=action.id)
         action_state = state.get_action(action.id)
@@ -615,8 +887,11 @@ class PlanExecutor:
                 execution_results=execution_results,
                 memory_store=memory_context,
                 allow_env=True,
+                result_store=self._result_store,
             )
-            resolved_params = resolver.resolve(action.params)
+            compiled_params = action.compiled_params()
+            await resolver.preload(compiled_params)
+            resolved_params = resolver.resolve(action.params, compiled_params)
         except LLMOSError as exc:
             await self._fail_action(
                 plan.plan_id, action.id, action_state, str(exc),
@@ -717,7 +992,7 @@ class PlanExecutor:
 
             try:
                 raw_result, fallback_used = await asyncio.wait_for(
-                    self._dispatch_with_resource_limit(action, resolved_params),
+                    self._dispatch_with_resource_limit(action, resolved_params, priority),
                     timeout=action.timeout,
                 )
                 if fallback_used:
@@ -792,7 +1067,8 @@ class PlanExecutor:
                         else perception_report
                     )
                     if isinstance(clean_result, dict):
-                        clean_result[_PERCEPTION_KEY] = perception_dict
+                        # sanitize() may hand back the module's own dict — never mutate it.
+                        clean_result = {**clean_result, _PERCEPTION_KEY: perception_dict}
                     else:
                         clean_result = {"value": clean_result, _PERCEPTION_KEY: perception_dict}
                 except Exception as perc_exc:
@@ -803,7 +1079,19 @@ class PlanExecutor:
                     )
 
             # Truncate oversized results to prevent LLM context overflow.
-            clean_result = _truncate_result(clean_result, self._max_result_size)
+            summary = _truncate_result(clean_result, self._max_result_size)
+            if summary is not clean_result and self._result_store is not None:
+                try:
+                    summary = await self._result_store.spill(
+                        clean_result, summary, exclude=_BINARY_RESULT_KEYS
+                    )
+                except (OSError, TypeError, ValueError) as spill_exc:
+                    log.warning(
+                        "result_spill_failed",
+                        action_id=action.id,
+                        error=str(spill_exc),
+                    )
+            clean_result = summary
 
             execution_results[action.id] = clean_result
             action_state.status = ActionStatus.COMPLETED
@@ -845,7 +1133,8 @@ class PlanExecutor:
                 "module_id": action.module,
                 "action": action.action,
                 "status": "completed",
-                "result": _truncate_result(clean_result, self._max_result_size),
+                # Already size-checked above — no second serialisation.
+                "result": clean_result,
             })
             log.info("action_completed", action=f"{action.module}.{action.action}")
             return
@@ -862,15 +1151,18 @@ class PlanExecutor:
         )
 
     async def _dispatch_with_resource_limit(
-        self, action: IMLAction, resolved_params: dict[str, Any]
+        self, action: IMLAction, resolved_params: dict[str, Any], priority: float = 0.0
     ) -> tuple[Any, str | None]:
         """Dispatch action, optionally throttled by ResourceManager.
 
+        When the module is saturated, *priority* decides which waiting action
+        gets the next free slot.
+
         Returns:
             Tuple of (result, fallback_module_used_or_None).
         """
         if self._resource_manager:
-            async with self._resource_manager.acquire(action.module):
+            async with self._resource_manager.acquire(action.module, priority=priority):
                 return await self._dispatch_with_fallback(action, resolved_params)
         return await self._dispatch_with_fallback(action, resolved_params)
 
@@ -4,10 +4,14 @@ Controls how many concurrent actions can run against each module
 (e.g., max 3 Excel operations at a time to avoid overwhelming
 single-threaded office libraries).
 
+When a module is saturated, waiters are woken highest ``priority`` first
+(FIFO among equal priorities), so the executor can let critical-path
+actions jump ahead of leaf actions nobody is waiting on.
+
 Usage::
 
     rm = ResourceManager({"excel": 3, "word": 3, "api_http": 10})
-    async with rm.acquire("excel"):
+    async with rm.acquire("excel", priority=12.5):
         result = await module.execute(action)
 """
 
@@ -15,11 +19,52 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
+import heapq
+import itertools
 from typing import AsyncIterator
 
 
+class _PrioritySemaphore:
+    """Counting semaphore whose waiters are released by descending priority.
+
+    Exposes ``_value`` like :class:`asyncio.Semaphore` so monitoring code can
+    read the number of free slots.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+
+    async def acquire(self, priority: float = 0.0) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._seq), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation.
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._value += 1
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+
 class ResourceManager:
-    """Per-module asyncio.Semaphore pool for concurrency control."""
+    """Per-module priority semaphore pool for concurrency control."""
 
     def __init__(
         self,
@@ -28,20 +73,24 @@ class ResourceManager:
     ) -> None:
         self._limits = limits or {}
         self._default = default_limit
-        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._semaphores: dict[str, _PrioritySemaphore] = {}
 
-    def _get_semaphore(self, module_id: str) -> asyncio.Semaphore:
+    def _get_semaphore(self, module_id: str) -> _PrioritySemaphore:
         """Return (or lazily create) the semaphore for *module_id*."""
         if module_id not in self._semaphores:
             limit = self._limits.get(module_id, self._default)
-            self._semaphores[module_id] = asyncio.Semaphore(limit)
+            self._semaphores[module_id] = _PrioritySemaphore(limit)
         return self._semaphores[module_id]
 
     @asynccontextmanager
-    async def acquire(self, module_id: str) -> AsyncIterator[None]:
-        """Async context manager that blocks if the module is at capacity."""
+    async def acquire(self, module_id: str, priority: float = 0.0) -> AsyncIterator[None]:
+        """Async context manager that blocks if the module is at capacity.
+
+        When several callers are blocked, the one with the highest
+        *priority* gets the next free slot.
+        """
         sem = self._get_semaphore(module_id)
-        await sem.acquire()
+        await sem.acquire(priority)
         try:
             yield
         finally:
@@ -56,5 +105,6 @@ class ResourceManager:
                 "limit": limit,
                 "available": sem._value,
                 "in_use": limit - sem._value,
+                "waiting": sem.waiting,
             }
         return result
@@ -0,0 +1,220 @@
+"""Orchestration layer — Spill store for oversized action results.
+
+When an action result exceeds ``max_result_size`` the executor normally
+replaces it with a truncated summary and the tail is lost.  With a
+:class:`ResultBlobStore` configured, the full result is written to a
+content-addressed blob directory instead and the summary becomes a
+*handle*: it keeps the usual ``_truncated`` preview for the LLM and adds a
+``_spilled`` entry that maps each top-level field to its blob.
+
+Handle layout::
+
+    {
+        "_truncated": True, "_original_size": ..., "_max_size": ...,
+        "data": "<json prefix>", "warning": "...",
+        "_spilled": {"fields": {"rows": "<sha256>", ...}},   # dict results
+        # or  "_spilled": {"blob": "<sha256>"}                # anything else
+    }
+
+Each field is a separate blob, so ``{{result.a1.rows}}`` only reads the
+``rows`` file when the next action is dispatched — the multi-MB value is
+never held in ``execution_results`` nor written to ``actions.result``.
+
+Blobs are immutable and named by the SHA-256 of their JSON encoding, so
+identical outputs are stored once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+from llmos_bridge.logging import get_logger
+
+log = get_logger(__name__)
+
+_HANDLE_KEY = "_spilled"
+_WRITE_CHUNK = 64 * 1024
+# Keys of the truncation summary that are not fields of the original result.
+_SUMMARY_KEYS = frozenset(
+    {"_truncated", "_original_size", "_max_size", "data", "warning", _HANDLE_KEY}
+)
+
+
+class ResultBlobStore:
+    """Content-addressed JSON blob store for spilled action results.
+
+    Usage::
+
+        store = ResultBlobStore(Path("~/.llmos/results"))
+        handle = await store.spill(full_result, truncated_summary)
+        value = await store.aload(handle, "rows")
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = Path(root).expanduser()
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._encoder = json.JSONEncoder(default=str)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    # ------------------------------------------------------------------
+    # Handles
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def is_handle(value: Any) -> bool:
+        """True when *value* is a handle produced by :meth:`spill`."""
+        return isinstance(value, dict) and isinstance(value.get(_HANDLE_KEY), dict)
+
+    async def spill(
+        self,
+        result: Any,
+        summary: dict[str, Any],
+        exclude: frozenset[str] | set[str] = frozenset(),
+    ) -> dict[str, Any]:
+        """Write *result* to blobs and return *summary* extended into a handle.
+
+        Args:
+            result:  The full (untruncated) action result.
+            summary: The truncated summary built by the executor.  Keys in
+                     it are preserved; only ``_spilled`` is added.
+            exclude: Top-level keys kept inline in *summary* (e.g. binary
+                     screenshot fields) that must not be spilled.
+        """
+        refs = await asyncio.to_thread(self._write_result, result, exclude)
+        handle = dict(summary)
+        handle[_HANDLE_KEY] = refs
+        log.debug("result_spilled", blobs=len(refs.get("fields", {})) or 1)
+        return handle
+
+    def load(self, handle: dict[str, Any], field: str | None = None) -> Any:
+        """Dereference *handle* — the whole result, or one top-level *field*.
+
+        Raises:
+            KeyError: *field* is not a field of the spilled result.
+            FileNotFoundError: The blob was purged.
+        """
+        refs = handle[_HANDLE_KEY]
+        if "blob" in refs:
+            value = self.get(refs["blob"])
+            return value if field is None else value[field]
+        fields: dict[str, str] = refs["fields"]
+        if field is not None:
+            if field in fields:
+                return self.get(fields[field])
+            if field in handle and not field.startswith("_"):
+                # Inline field kept in the handle (binary payloads).
+                return handle[field]
+            raise KeyError(field)
+        value = {name: self.get(digest) for name, digest in fields.items()}
+        for key in handle:
+            if key not in _SUMMARY_KEYS:
+                value[key] = handle[key]
+        return value
+
+    async def aload(self, handle: dict[str, Any], field: str | None = None) -> Any:
+        """:meth:`load` in a worker thread, so the blob read and JSON decode
+        do not block the event loop."""
+        return await asyncio.to_thread(self.load, handle, field)
+
+    def fields(self, handle: dict[str, Any]) -> list[str]:
+        """Names of the top-level fields reachable through *handle*."""
+        refs = handle[_HANDLE_KEY]
+        names = set(refs.get("fields", {}))
+        names.update(k for k in handle if k not in _SUMMARY_KEYS)
+        return sorted(names)
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def put(self, value: Any) -> str:
+        """Stream *value* as JSON into the store and return its digest."""
+        digest = hashlib.sha256()
+        fd, tmp_name = tempfile.mkstemp(dir=self._root, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="ascii") as fh:
+                buf: list[str] = []
+                pending = 0
+                for chunk in self._encoder.iterencode(value):
+                    buf.append(chunk)
+                    pending += len(chunk)
+                    if pending >= _WRITE_CHUNK:
+                        self._write_chunk(fh, digest, buf)
+                        buf.clear()
+                        pending = 0
+                if buf:
+                    self._write_chunk(fh, digest, buf)
+            key = digest.hexdigest()
+            path = self._path(key)
+            if path.exists():
+                # Same content already stored — refresh its age for purge().
+                os.unlink(tmp_name)
+                os.utime(path)
+            else:
+                path.parent.mkdir(exist_ok=True)
+                os.replace(tmp_name, path)
+            return key
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def get(self, digest: str) -> Any:
+        """Load and decode the blob named *digest*."""
+        with open(self._path(digest), encoding="ascii") as fh:
+            return json.load(fh)
+
+    def purge(self, max_age_seconds: float) -> int:
+        """Delete blobs not written within *max_age_seconds*.  Returns the count.
+
+        Partial ``.tmp-*`` files left behind by a process killed in the
+        middle of a write are removed (and counted) by the same rule.
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in itertools.chain(self._root.glob("??/*"), self._root.glob(".tmp-*")):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+    # ------------------------------------------------------------------
+    # Private
+    # ------------------------------------------------------------------
+
+    def _write_result(self, result: Any, exclude: frozenset[str] | set[str]) -> dict[str, Any]:
+        if isinstance(result, dict) and all(isinstance(k, str) for k in result):
+            return {
+                "fields": {
+                    name: self.put(value)
+                    for name, value in result.items()
+                    if name not in exclude
+                }
+            }
+        return {"blob": self.put(result)}
+
+    def _path(self, digest: str) -> Path:
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return self._root / digest[:2] / digest[2:]
+
+    @staticmethod
+    def _write_chunk(fh: Any, digest: Any, buf: list[str]) -> None:
+        text = "".join(buf)
+        digest.update(text.encode("ascii"))
+        fh.write(text)
+
@@ -1,21 +1,42 @@
 """Orchestration layer — Execution state machine.
 
 Tracks the live status of every plan and action.
-Persists to SQLite via aiosqlite for crash recovery.
+
+Storage is pluggable behind :class:`BaseStateStore`:
+    - :class:`PlanStateStore` persists to SQLite via aiosqlite for crash
+      recovery (default).
+    - :class:`InMemoryStateStore` keeps everything in process memory with
+      bounded retention — for ephemeral workloads (CI agents, benchmarks)
+      where zero disk I/O on the executor hot path matters more than
+      durability.
 
 State transitions:
     Plan:   pending -> running -> completed | failed | cancelled
     Action: pending -> waiting -> running -> completed | failed | skipped
                                          -> awaiting_approval (if required)
                                          -> rolled_back (on rollback)
+
+Write-behind mode:
+    By default every ``update_action``/``update_plan_status`` is its own
+    transaction.  With ``write_behind=True`` those updates are coalesced in
+    memory (last write wins per row, with the same COALESCE semantics as the
+    SQL) and written in one group commit every ``flush_interval`` seconds or
+    as soon as ``flush_max_records`` rows are pending.  ``create()`` stays
+    synchronous, and ``get()`` overlays pending writes so callers always read
+    their own writes.  On a crash, at most the updates buffered since the
+    last flush are lost: the plan and its actions still exist on disk, in
+    the last flushed state.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import time
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -131,7 +152,127 @@ class ExecutionState:
         return d
 
 
-class PlanStateStore:
+# Plans deleted per transaction by purge_old_plans().
+_PURGE_CHUNK_SIZE = 500
+
+_TERMINAL_ACTION_STATUSES = (
+    ActionStatus.COMPLETED,
+    ActionStatus.FAILED,
+    ActionStatus.SKIPPED,
+    ActionStatus.ROLLED_BACK,
+)
+
+
+@dataclass
+class _PendingActionWrite:
+    """A coalesced, not-yet-flushed action UPDATE."""
+
+    status: ActionStatus
+    result_json: str | None
+    error: str | None
+    attempt: int | None
+    started_at: float | None
+    finished_at: float | None
+
+    def merge(self, newer: _PendingActionWrite) -> _PendingActionWrite:
+        """Fold *newer* on top of this write, mirroring the UPDATE's COALESCEs."""
+        return _PendingActionWrite(
+            status=newer.status,
+            result_json=newer.result_json,
+            error=newer.error,
+            attempt=newer.attempt if newer.attempt is not None else self.attempt,
+            started_at=newer.started_at if newer.started_at is not None else self.started_at,
+            finished_at=newer.finished_at if newer.finished_at is not None else self.finished_at,
+        )
+
+
+@dataclass
+class _PendingPlanWrite:
+    """A coalesced, not-yet-flushed plan status UPDATE."""
+
+    status: PlanStatus
+    updated_at: float
+    data_json: str | None  # None = leave the data column untouched
+
+    def merge(self, newer: _PendingPlanWrite) -> _PendingPlanWrite:
+        return _PendingPlanWrite(
+            status=newer.status,
+            updated_at=newer.updated_at,
+            data_json=newer.data_json if newer.data_json is not None else self.data_json,
+        )
+
+
+class BaseStateStore(ABC):
+    """Interface shared by all plan state backends.
+
+    Subclass this to add a backend; the executor and API only depend on
+    these methods.
+    """
+
+    @abstractmethod
+    async def init(self) -> None:
+        """Prepare the backend (open connections, create schema, ...)."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Flush pending writes and release resources."""
+
+    async def flush(self) -> None:  # noqa: B027
+        """Force buffered writes to storage.  No-op for unbuffered backends."""
+
+    @abstractmethod
+    async def create(self, state: ExecutionState, app_id: str = "default") -> None:
+        """Persist a new ExecutionState (plan + all actions)."""
+
+    @abstractmethod
+    async def update_plan_status(
+        self,
+        plan_id: str,
+        status: PlanStatus,
+        rejection_details: dict[str, Any] | None = None,
+    ) -> None:
+        """Set the plan status (and optionally its rejection details)."""
+
+    @abstractmethod
+    async def update_action(
+        self,
+        plan_id: str,
+        action_id: str,
+        status: ActionStatus,
+        result: Any = None,
+        error: str | None = None,
+        attempt: int | None = None,
+    ) -> None:
+        """Record an action status transition.
+
+        ``result`` and ``error`` are overwritten; ``attempt`` is only
+        updated when given.  ``started_at`` is stamped on RUNNING and
+        ``finished_at`` on any terminal status.
+        """
+
+    @abstractmethod
+    async def get(self, plan_id: str) -> ExecutionState | None:
+        """Return a snapshot of the plan, or None if unknown."""
+
+    @abstractmethod
+    async def list_plans(
+        self,
+        status: PlanStatus | None = None,
+        limit: int = 100,
+        app_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return plan summaries, newest first."""
+
+    @abstractmethod
+    async def purge_old_plans(self, retention_seconds: float) -> int:
+        """Delete terminal plans not updated for *retention_seconds*; return the count."""
+
+    @abstractmethod
+    async def action_duration_stats(self) -> dict[str, float]:
+        """Return mean execution seconds of completed actions per ``"module.action"``."""
+
+
+class PlanStateStore(BaseStateStore):
     """Async SQLite-backed store for plan execution states.
 
     Usage::
@@ -141,13 +282,34 @@ class PlanStateStore:
         await store.create(state)
         await store.update_plan_status(plan_id, PlanStatus.RUNNING)
         await store.update_action(plan_id, action_id, status=ActionStatus.COMPLETED, result={})
+
+    Pass ``write_behind=True`` to group-commit status updates (see module
+    docstring); call :meth:`flush` to force buffered updates to disk.
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        write_behind: bool = False,
+        flush_interval: float = 0.05,
+        flush_max_records: int = 256,
+    ) -> None:
         self._db_path = db_path.expanduser()
         self._conn: aiosqlite.Connection | None = None
         self._lock = asyncio.Lock()
 
+        self._write_behind = write_behind
+        self._flush_interval = flush_interval
+        self._flush_max_records = flush_max_records
+        self._pending_actions: dict[tuple[str, str], _PendingActionWrite] = {}
+        self._pending_plans: dict[str, _PendingPlanWrite] = {}
+        # Snapshot being written by an in-progress flush (still overlaid by get()).
+        self._flushing_actions: dict[tuple[str, str], _PendingActionWrite] = {}
+        self._flushing_plans: dict[str, _PendingPlanWrite] = {}
+        self._flush_requested = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+
     async def init(self) -> None:
         """Open the database and create tables if they do not exist."""
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -162,10 +324,13 @@ class PlanStateStore:
 
             await self._conn.executescript(_SCHEMA_SQL)
             await self._conn.commit()
-            log.info("state_store_ready", db=str(self._db_path))
+            log.info("state_store_ready", db=str(self._db_path), write_behind=self._write_behind)
         except Exception as exc:
             raise StateStoreError(f"Failed to initialise state store: {exc}") from exc
 
+        if self._write_behind:
+            self._flusher = asyncio.create_task(self._flush_loop(), name="state_store_flusher")
+
     async def _migrate_app_id(self) -> None:
         """Add app_id column to plans table if it doesn't exist (v1 → v2 migration).
 
@@ -190,25 +355,122 @@ class PlanStateStore:
             log.info("state_store_migrated", added_column="app_id")
 
     async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
         if self._conn:
+            await self.flush()
             await self._conn.close()
             self._conn = None
 
+    # ------------------------------------------------------------------
+    # Write-behind buffering
+    # ------------------------------------------------------------------
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of coalesced rows waiting for the next group commit."""
+        return len(self._pending_actions) + len(self._pending_plans)
+
+    def _buffer_changed(self) -> None:
+        if self.pending_writes >= self._flush_max_records:
+            self._flush_requested.set()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), self._flush_interval)
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except Exception as exc:
+                log.error("state_flush_failed", error=str(exc), pending=self.pending_writes)
+
+    async def flush(self) -> None:
+        """Write all buffered updates in a single transaction.
+
+        No-op when nothing is pending.  If the write fails, the buffered
+        updates are restored (under any newer ones) and the error is raised.
+        """
+        if not self._pending_actions and not self._pending_plans:
+            return
+        # Swap the buffers out under the lock so flushes run one at a time:
+        # a concurrent flush waits here instead of replacing the in-flight
+        # snapshot that get() still overlays.
+        async with self._lock:
+            actions, self._pending_actions = self._pending_actions, {}
+            plans, self._pending_plans = self._pending_plans, {}
+            if not actions and not plans:
+                return
+            self._flushing_actions, self._flushing_plans = actions, plans
+            try:
+                assert self._conn is not None
+                if plans:
+                    await self._conn.executemany(
+                        "UPDATE plans SET status=?, updated_at=?, data=COALESCE(?,data) "
+                        "WHERE plan_id=?",
+                        [
+                            (w.status.value, w.updated_at, w.data_json, plan_id)
+                            for plan_id, w in plans.items()
+                        ],
+                    )
+                if actions:
+                    await self._conn.executemany(
+                        """UPDATE actions
+                           SET status=?, result=?, error=?, attempt=COALESCE(?,attempt),
+                               started_at=COALESCE(?,started_at),
+                               finished_at=COALESCE(?,finished_at)
+                           WHERE plan_id=? AND action_id=?""",
+                        [
+                            (
+                                w.status.value, w.result_json, w.error, w.attempt,
+                                w.started_at, w.finished_at, key[0], key[1],
+                            )
+                            for key, w in actions.items()
+                        ],
+                    )
+                await self._conn.commit()
+            except BaseException:
+                # Discard UPDATEs that did run, or the next commit would
+                # persist a half-applied batch.
+                with contextlib.suppress(Exception):
+                    await self._conn.rollback()
+                for key, w in actions.items():
+                    newer = self._pending_actions.get(key)
+                    self._pending_actions[key] = w.merge(newer) if newer else w
+                for plan_id, pw in plans.items():
+                    newer_plan = self._pending_plans.get(plan_id)
+                    self._pending_plans[plan_id] = pw.merge(newer_plan) if newer_plan else pw
+                raise
+            finally:
+                self._flushing_actions, self._flushing_plans = {}, {}
+
     async def create(self, state: ExecutionState, app_id: str = "default") -> None:
-        """Persist a new ExecutionState (plan + all actions)."""
+        """Persist a new ExecutionState (plan + all actions).
+
+        Action rows are inserted with a single ``executemany`` so that plans
+        with hundreds of generated actions cost one round trip to the
+        database thread and one reused prepared statement.
+        """
         now = time.time()
         data = {"rejection_details": state.rejection_details} if state.rejection_details else {}
+        action_rows = [
+            (state.plan_id, action_id, action_state.status.value,
+             action_state.module, action_state.action)
+            for action_id, action_state in state.actions.items()
+        ]
         async with self._lock:
             assert self._conn is not None
             await self._conn.execute(
                 "INSERT INTO plans (plan_id, status, created_at, updated_at, data, app_id) VALUES (?,?,?,?,?,?)",
                 (state.plan_id, state.plan_status.value, now, now, json.dumps(data), app_id),
             )
-            for action_id, action_state in state.actions.items():
-                await self._conn.execute(
+            if action_rows:
+                await self._conn.executemany(
                     "INSERT INTO actions (plan_id, action_id, status, module, action) VALUES (?,?,?,?,?)",
-                    (state.plan_id, action_id, action_state.status.value,
-                     action_state.module, action_state.action),
+                    action_rows,
                 )
             await self._conn.commit()
 
@@ -218,6 +480,20 @@ class PlanStateStore:
         status: PlanStatus,
         rejection_details: dict[str, Any] | None = None,
     ) -> None:
+        if self._write_behind:
+            write = _PendingPlanWrite(
+                status=status,
+                updated_at=time.time(),
+                data_json=(
+                    json.dumps({"rejection_details": rejection_details})
+                    if rejection_details is not None
+                    else None
+                ),
+            )
+            prev = self._pending_plans.get(plan_id)
+            self._pending_plans[plan_id] = prev.merge(write) if prev else write
+            self._buffer_changed()
+            return
         async with self._lock:
             assert self._conn is not None
             now = time.time()
@@ -244,20 +520,24 @@ class PlanStateStore:
         attempt: int | None = None,
     ) -> None:
         now = time.time()
+        started_at = now if status == ActionStatus.RUNNING else None
+        finished_at = now if status in _TERMINAL_ACTION_STATUSES else None
+        if self._write_behind:
+            write = _PendingActionWrite(
+                status=status,
+                result_json=json.dumps(result) if result is not None else None,
+                error=error,
+                attempt=attempt,
+                started_at=started_at,
+                finished_at=finished_at,
+            )
+            key = (plan_id, action_id)
+            prev = self._pending_actions.get(key)
+            self._pending_actions[key] = prev.merge(write) if prev else write
+            self._buffer_changed()
+            return
         async with self._lock:
             assert self._conn is not None
-            started_at = now if status == ActionStatus.RUNNING else None
-            finished_at = (
-                now
-                if status
-                in (
-                    ActionStatus.COMPLETED,
-                    ActionStatus.FAILED,
-                    ActionStatus.SKIPPED,
-                    ActionStatus.ROLLED_BACK,
-                )
-                else None
-            )
             await self._conn.execute(
                 """UPDATE actions
                    SET status=?, result=?, error=?, attempt=COALESCE(?,attempt),
@@ -278,6 +558,12 @@ class PlanStateStore:
 
     async def get(self, plan_id: str) -> ExecutionState | None:
         assert self._conn is not None
+        # Snapshot the buffers before reading: a flush may commit and clear
+        # them between the two SELECTs, leaving the plan row stale.
+        buffered = [
+            (self._flushing_plans, self._flushing_actions),
+            (self._pending_plans, self._pending_actions),
+        ]
         async with self._conn.execute(
             "SELECT plan_id, status, created_at, updated_at, data FROM plans WHERE plan_id=?",
             (plan_id,),
@@ -312,8 +598,71 @@ class PlanStateStore:
                     module=arow[7],
                     action=arow[8],
                 )
+        if self._write_behind:
+            self._overlay_pending(state, buffered)
         return state
 
+    def _overlay_pending(
+        self,
+        state: ExecutionState,
+        snapshot: list[
+            tuple[dict[str, _PendingPlanWrite], dict[tuple[str, str], _PendingActionWrite]]
+        ],
+    ) -> None:
+        """Apply buffered writes for *state* so get() reads its own writes.
+
+        *snapshot* holds the buffers taken before the SELECTs (oldest first);
+        the current pending buffers are applied last for writes made while
+        reading.
+        """
+        for plans, actions in (*snapshot, (self._pending_plans, self._pending_actions)):
+            self._apply_writes(state, plans, actions)
+
+    @staticmethod
+    def _apply_writes(
+        state: ExecutionState,
+        plans: dict[str, _PendingPlanWrite],
+        actions: dict[tuple[str, str], _PendingActionWrite],
+    ) -> None:
+        plan_write = plans.get(state.plan_id)
+        if plan_write is not None:
+            state.plan_status = plan_write.status
+            state.updated_at = plan_write.updated_at
+            if plan_write.data_json is not None:
+                state.rejection_details = json.loads(plan_write.data_json).get(
+                    "rejection_details"
+                )
+        for action_id, action_state in state.actions.items():
+            w = actions.get((state.plan_id, action_id))
+            if w is None:
+                continue
+            action_state.status = w.status
+            action_state.result = json.loads(w.result_json) if w.result_json else None
+            action_state.error = w.error
+            if w.attempt is not None:
+                action_state.attempt = w.attempt
+            if w.started_at is not None:
+                action_state.started_at = w.started_at
+            if w.finished_at is not None:
+                action_state.finished_at = w.finished_at
+
+    async def action_duration_stats(self) -> dict[str, float]:
+        """Return mean execution seconds per ``"module.action"``.
+
+        Only completed actions with both timestamps recorded are counted.
+        Used by the executor for critical-path priority scheduling.
+        """
+        assert self._conn is not None
+        await self.flush()
+        async with self._conn.execute(
+            "SELECT module, action, AVG(finished_at - started_at) FROM actions "
+            "WHERE status=? AND started_at IS NOT NULL AND finished_at IS NOT NULL "
+            "AND module != '' GROUP BY module, action",
+            (ActionStatus.COMPLETED.value,),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return {f"{r[0]}.{r[1]}": max(float(r[2]), 0.0) for r in rows if r[2] is not None}
+
     async def list_plans(
         self,
         status: PlanStatus | None = None,
@@ -321,6 +670,7 @@ class PlanStateStore:
         app_id: str | None = None,
     ) -> list[dict[str, Any]]:
         assert self._conn is not None
+        await self.flush()
         conditions: list[str] = []
         values: list[Any] = []
 
@@ -342,40 +692,220 @@ class PlanStateStore:
             for r in rows
         ]
 
-    async def purge_old_plans(self, retention_seconds: float) -> int:
+    async def purge_old_plans(
+        self, retention_seconds: float, chunk_size: int = _PURGE_CHUNK_SIZE
+    ) -> int:
         """Delete completed/failed plans older than *retention_seconds*.
 
+        Plans are deleted in chunks of *chunk_size*, each in its own short
+        transaction, so the store lock is released between chunks and
+        concurrent plan updates are not stalled by a large sweep.
+
         Returns the number of plans purged.
         """
         assert self._conn is not None
+        await self.flush()
         cutoff = time.time() - retention_seconds
         terminal_statuses = (
             PlanStatus.COMPLETED.value,
             PlanStatus.FAILED.value,
             PlanStatus.CANCELLED.value,
         )
-        async with self._lock:
-            # Find plans to purge.
-            async with self._conn.execute(
-                "SELECT plan_id FROM plans WHERE status IN (?,?,?) AND updated_at < ?",
-                (*terminal_statuses, cutoff),
-            ) as cursor:
-                plan_ids = [row[0] for row in await cursor.fetchall()]
-
-            if not plan_ids:
-                return 0
-
-            # Delete actions first (FK constraint), then plans.
-            placeholders = ",".join("?" * len(plan_ids))
-            await self._conn.execute(
-                f"DELETE FROM actions WHERE plan_id IN ({placeholders})",
-                plan_ids,
-            )
-            await self._conn.execute(
-                f"DELETE FROM plans WHERE plan_id IN ({placeholders})",
-                plan_ids,
-            )
-            await self._conn.commit()
+        total = 0
+        while True:
+            async with self._lock:
+                async with self._conn.execute(
+                    "SELECT plan_id FROM plans WHERE status IN (?,?,?) AND updated_at < ? "
+                    "LIMIT ?",
+                    (*terminal_statuses, cutoff, chunk_size),
+                ) as cursor:
+                    plan_ids = [(row[0],) for row in await cursor.fetchall()]
+
+                if not plan_ids:
+                    break
+
+                # Delete actions first (FK constraint), then plans.
+                await self._conn.executemany("DELETE FROM actions WHERE plan_id=?", plan_ids)
+                await self._conn.executemany("DELETE FROM plans WHERE plan_id=?", plan_ids)
+                await self._conn.commit()
+
+            total += len(plan_ids)
+            if len(plan_ids) < chunk_size:
+                break
+            # Let queued writers in before the next chunk.
+            await asyncio.sleep(0)
+
+        if total:
+            log.info("plans_purged", count=total, cutoff_seconds=retention_seconds)
+        return total
+
+
+@dataclass
+class _MemoryPlanRecord:
+    state: ExecutionState
+    app_id: str
+
+
+class InMemoryStateStore(BaseStateStore):
+    """Process-local state backend with bounded, LRU-by-``updated_at`` retention.
+
+    Nothing touches the disk, so the executor hot path measures pure
+    orchestration overhead.  State is lost on restart.  Once more than
+    *max_plans* plans are held, the least recently updated plans are
+    evicted first; later updates to an evicted plan are ignored, just as
+    an UPDATE on a missing SQLite row would be.
+
+    Action results are stored by reference rather than JSON round-tripped;
+    callers must not mutate a result after recording it.
+
+    Usage::
+
+        store = InMemoryStateStore(max_plans=1000)
+        await store.init()
+    """
+
+    def __init__(self, max_plans: int = 10_000) -> None:
+        self._max_plans = max_plans
+        # Ordered by updated_at: every write moves the plan to the end.
+        self._plans: OrderedDict[str, _MemoryPlanRecord] = OrderedDict()
+
+    async def init(self) -> None:
+        log.info("state_store_ready", backend="memory", max_plans=self._max_plans)
+
+    async def close(self) -> None:
+        self._plans.clear()
+
+    def _touch(self, plan_id: str, now: float) -> _MemoryPlanRecord | None:
+        record = self._plans.get(plan_id)
+        if record is not None:
+            record.state.updated_at = now
+            self._plans.move_to_end(plan_id)
+        return record
+
+    async def create(self, state: ExecutionState, app_id: str = "default") -> None:
+        if state.plan_id in self._plans:
+            raise StateStoreError(f"Plan '{state.plan_id}' already exists")
+        now = time.time()
+        self._plans[state.plan_id] = _MemoryPlanRecord(
+            state=ExecutionState(
+                plan_id=state.plan_id,
+                plan_status=state.plan_status,
+                created_at=now,
+                updated_at=now,
+                actions={
+                    aid: ActionState(
+                        action_id=aid, status=a.status, module=a.module, action=a.action
+                    )
+                    for aid, a in state.actions.items()
+                },
+                rejection_details=state.rejection_details,
+            ),
+            app_id=app_id,
+        )
+        while len(self._plans) > self._max_plans:
+            evicted, _ = self._plans.popitem(last=False)
+            log.debug("state_plan_evicted", plan_id=evicted)
+
+    async def update_plan_status(
+        self,
+        plan_id: str,
+        status: PlanStatus,
+        rejection_details: dict[str, Any] | None = None,
+    ) -> None:
+        record = self._touch(plan_id, time.time())
+        if record is None:
+            return
+        record.state.plan_status = status
+        if rejection_details is not None:
+            record.state.rejection_details = rejection_details
+
+    async def update_action(
+        self,
+        plan_id: str,
+        action_id: str,
+        status: ActionStatus,
+        result: Any = None,
+        error: str | None = None,
+        attempt: int | None = None,
+    ) -> None:
+        now = time.time()
+        record = self._touch(plan_id, now)
+        if record is None:
+            return
+        action_state = record.state.actions.get(action_id)
+        if action_state is None:
+            return
+        action_state.status = status
+        action_state.result = result
+        action_state.error = error
+        if attempt is not None:
+            action_state.attempt = attempt
+        if status == ActionStatus.RUNNING:
+            action_state.started_at = now
+        if status in _TERMINAL_ACTION_STATUSES:
+            action_state.finished_at = now
+
+    async def get(self, plan_id: str) -> ExecutionState | None:
+        record = self._plans.get(plan_id)
+        if record is None:
+            return None
+        src = record.state
+        return ExecutionState(
+            plan_id=src.plan_id,
+            plan_status=src.plan_status,
+            created_at=src.created_at,
+            updated_at=src.updated_at,
+            actions={aid: replace(a) for aid, a in src.actions.items()},
+            rejection_details=src.rejection_details,
+        )
 
+    async def list_plans(
+        self,
+        status: PlanStatus | None = None,
+        limit: int = 100,
+        app_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        records = [
+            r for r in self._plans.values()
+            if (status is None or r.state.plan_status == status)
+            and (not app_id or r.app_id == app_id)
+        ]
+        records.sort(key=lambda r: r.state.created_at, reverse=True)
+        return [
+            {
+                "plan_id": r.state.plan_id,
+                "status": r.state.plan_status.value,
+                "created_at": r.state.created_at,
+                "updated_at": r.state.updated_at,
+                "app_id": r.app_id,
+            }
+            for r in records[:limit]
+        ]
+
+    async def purge_old_plans(self, retention_seconds: float) -> int:
+        cutoff = time.time() - retention_seconds
+        terminal = (PlanStatus.COMPLETED, PlanStatus.FAILED, PlanStatus.CANCELLED)
+        plan_ids = [
+            pid for pid, r in self._plans.items()
+            if r.state.plan_status in terminal and r.state.updated_at < cutoff
+        ]
+        for pid in plan_ids:
+            del self._plans[pid]
+        if plan_ids:
             log.info("plans_purged", count=len(plan_ids), cutoff_seconds=retention_seconds)
-            return len(plan_ids)
+        return len(plan_ids)
+
+    async def action_duration_stats(self) -> dict[str, float]:
+        totals: dict[str, list[float]] = {}
+        for record in self._plans.values():
+            for a in record.state.actions.values():
+                if (
+                    a.status == ActionStatus.COMPLETED
+                    and a.module
+                    and a.started_at is not None
+                    and a.finished_at is not None
+                ):
+                    acc = totals.setdefault(f"{a.module}.{a.action}", [0.0, 0.0])
+                    acc[0] += a.finished_at - a.started_at
+                    acc[1] += 1
+        return {key: max(total / count, 0.0) for key, (total, count) in totals.items()}
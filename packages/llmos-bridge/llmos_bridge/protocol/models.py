@@ -12,7 +12,7 @@ import uuid
 from enum import Enum
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from llmos_bridge.protocol.constants import (
     ACTION_ID_MAX_LEN,
@@ -347,6 +347,21 @@ class IMLAction(BaseModel):
         ),
     )
 
+    # Cached template.compile_template(params); filled at parse time.
+    _compiled_params: Any = PrivateAttr(default=None)
+
+    def compiled_params(self) -> Any:
+        """Return the :class:`~llmos_bridge.protocol.template.CompiledTemplate`
+        for ``params``, compiling it on first use.
+
+        ``params`` must not be mutated after this has been called.
+        """
+        if self._compiled_params is None:
+            from llmos_bridge.protocol.template import compile_template
+
+            self._compiled_params = compile_template(self.params)
+        return self._compiled_params
+
     @field_validator("id")
     @classmethod
     def validate_id(cls, v: str) -> str:
@@ -52,6 +52,9 @@ class IMLParser:
         data = self._deserialise(raw)
         plan = self._validate_plan(data)
         self._validate_all_params(plan)
+        # Pre-compile template slots so dispatch only touches templated values.
+        for action in plan.actions:
+            action.compiled_params()
         return plan
 
     # ------------------------------------------------------------------
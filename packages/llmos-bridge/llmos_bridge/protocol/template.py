@@ -8,13 +8,31 @@ Template syntax:
     {{result.<action_id>}}               Full output dict of a completed action
     {{memory.<key>}}                     Value from the key-value memory store
     {{env.<VAR_NAME>}}                   OS environment variable
+
+Compiled templates:
+    :func:`compile_template` walks an action's params once and records the
+    exact paths of the strings that contain expressions.
+    ``TemplateResolver.resolve(params, compiled)`` then substitutes only
+    those slots: containers on the path to a slot are shallow-copied and
+    every other subtree is shared with the original params instead of
+    being deep-copied.  The original params must therefore be treated as
+    immutable once compiled.
+
+Spilled results:
+    With a ``result_store`` (see
+    :class:`~llmos_bridge.orchestration.result_store.ResultBlobStore`),
+    ``{{result.<action_id>.<field>}}`` on a spilled-result handle loads
+    just that field from disk.  ``await resolver.preload(compiled)`` reads
+    every referenced field off the event loop first; ``resolve()`` only
+    falls back to a synchronous read for references it was not told about.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import os
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from llmos_bridge.exceptions import TemplateResolutionError
 from llmos_bridge.protocol.constants import (
@@ -25,11 +43,66 @@ from llmos_bridge.protocol.constants import (
     TEMPLATE_PREFIX_RESULT,
 )
 
+if TYPE_CHECKING:
+    from llmos_bridge.orchestration.result_store import ResultBlobStore
+
 _TEMPLATE_RE = re.compile(
     re.escape(TEMPLATE_OPEN) + r"(\w+)\.(\w+)(?:\.(\w+))?" + re.escape(TEMPLATE_CLOSE)
 )
 
 
+@dataclass(frozen=True)
+class _TemplateSlot:
+    """A params string that contains at least one template expression."""
+
+    path: tuple[str | int, ...]
+    source: str
+    # (prefix, ref, field, matched_text) for each expression, in order.
+    expressions: tuple[tuple[str, str, str | None, str], ...]
+
+    @property
+    def is_whole(self) -> bool:
+        """True when the string is exactly one expression (type-preserving)."""
+        return len(self.expressions) == 1 and self.expressions[0][3] == self.source
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Locations of every template expression in an action's params."""
+
+    slots: tuple[_TemplateSlot, ...] = ()
+
+    @property
+    def is_static(self) -> bool:
+        """True when the params contain no template expressions at all."""
+        return not self.slots
+
+
+def compile_template(params: dict[str, Any]) -> CompiledTemplate:
+    """Scan *params* once and return its :class:`CompiledTemplate`."""
+    slots: list[_TemplateSlot] = []
+
+    def walk(value: Any, path: tuple[str | int, ...]) -> None:
+        if isinstance(value, str):
+            if TEMPLATE_OPEN not in value:
+                return
+            matches = [
+                (m.group(1), m.group(2), m.group(3), m.group(0))
+                for m in _TEMPLATE_RE.finditer(value)
+            ]
+            if matches:
+                slots.append(_TemplateSlot(path=path, source=value, expressions=tuple(matches)))
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                walk(v, (*path, k))
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                walk(item, (*path, i))
+
+    walk(params, ())
+    return CompiledTemplate(slots=tuple(slots))
+
+
 class TemplateResolver:
     """Resolves template expressions in action params.
 
@@ -48,29 +121,92 @@ class TemplateResolver:
         execution_results: dict[str, Any] | None = None,
         memory_store: dict[str, Any] | None = None,
         allow_env: bool = True,
+        result_store: ResultBlobStore | None = None,
     ) -> None:
         self._results: dict[str, Any] = execution_results or {}
         self._memory: dict[str, Any] = memory_store or {}
         self._allow_env = allow_env
+        self._result_store = result_store
+        # (action_id, field) -> value fetched by preload().
+        self._spilled: dict[tuple[str, str | None], Any] = {}
 
-    def resolve(self, params: dict[str, Any]) -> dict[str, Any]:
+    async def preload(self, compiled: CompiledTemplate) -> None:
+        """Load the spilled results referenced by *compiled* in worker threads.
+
+        Call before :meth:`resolve` from async code.  Failed loads are not
+        cached, so ``resolve()`` reports them with the usual error.
+        """
+        if self._result_store is None:
+            return
+        for slot in compiled.slots:
+            for prefix, ref, field, _text in slot.expressions:
+                key = (ref, field)
+                if prefix != TEMPLATE_PREFIX_RESULT or key in self._spilled:
+                    continue
+                handle = self._results.get(ref)
+                if not isinstance(handle, dict) or not self._result_store.is_handle(handle):
+                    continue
+                try:
+                    self._spilled[key] = await self._result_store.aload(handle, field)
+                except (KeyError, TypeError, OSError):
+                    continue
+
+    def resolve(
+        self, params: dict[str, Any], compiled: CompiledTemplate | None = None
+    ) -> dict[str, Any]:
         """Return a new dict with all template expressions resolved.
 
         Args:
             params: Action params potentially containing template strings.
+            compiled: The result of :func:`compile_template` for *params*.
+                When given, only the recorded slots are substituted and
+                untouched subtrees are shared with *params*.
 
         Returns:
-            A deep copy of *params* with all templates substituted.
+            A copy of *params* with all templates substituted — a deep copy
+            without *compiled*, a copy-on-write copy with it.  The top-level
+            dict is always new.
 
         Raises:
             TemplateResolutionError: A template could not be resolved.
         """
-        return self._resolve_value(params)  # type: ignore[return-value]
+        if compiled is None:
+            return self._resolve_value(params)  # type: ignore[return-value]
+        return self._resolve_compiled(params, compiled)
 
     # ------------------------------------------------------------------
     # Private
     # ------------------------------------------------------------------
 
+    def _resolve_compiled(
+        self, params: dict[str, Any], compiled: CompiledTemplate
+    ) -> dict[str, Any]:
+        root: dict[str, Any] = dict(params)
+        copies: dict[tuple[str | int, ...], Any] = {(): root}
+        for slot in compiled.slots:
+            parent: Any = root
+            for depth in range(1, len(slot.path)):
+                prefix = slot.path[:depth]
+                child = copies.get(prefix)
+                if child is None:
+                    original = parent[slot.path[depth - 1]]
+                    child = dict(original) if isinstance(original, dict) else list(original)
+                    parent[slot.path[depth - 1]] = child
+                    copies[prefix] = child
+                parent = child
+            parent[slot.path[-1]] = self._resolve_slot(slot)
+        return root
+
+    def _resolve_slot(self, slot: _TemplateSlot) -> Any:
+        if slot.is_whole:
+            prefix, ref, field, text = slot.expressions[0]
+            return self._resolve_expression(prefix, ref, field, original=text)
+        result = slot.source
+        for prefix, ref, field, text in slot.expressions:
+            resolved = self._resolve_expression(prefix, ref, field, original=text)
+            result = result.replace(text, str(resolved))
+        return result
+
     def _resolve_value(self, value: Any) -> Any:
         if isinstance(value, str):
             return self._resolve_string(value)
@@ -130,6 +266,8 @@ class TemplateResolver:
                 "Check that it appears in 'depends_on'.",
             )
         action_result = self._results[action_id]
+        if self._result_store is not None and self._result_store.is_handle(action_result):
+            return self._load_spilled(action_id, action_result, field, original)
         if field is None:
             return action_result
         if not isinstance(action_result, dict):
@@ -145,6 +283,25 @@ class TemplateResolver:
             )
         return action_result[field]
 
+    def _load_spilled(
+        self, action_id: str, handle: dict[str, Any], field: str | None, original: str
+    ) -> Any:
+        assert self._result_store is not None
+        if (action_id, field) in self._spilled:
+            return self._spilled[(action_id, field)]
+        try:
+            return self._result_store.load(handle, field)
+        except (KeyError, TypeError):
+            raise TemplateResolutionError(
+                original,
+                f"Action '{action_id}' result has no field '{field}'. "
+                f"Available fields: {self._result_store.fields(handle)}",
+            ) from None
+        except OSError as exc:
+            raise TemplateResolutionError(
+                original, f"Spilled result of action '{action_id}' is unavailable: {exc}"
+            ) from exc
+
     def _resolve_memory(self, key: str, original: str) -> Any:
         if key not in self._memory:
             raise TemplateResolutionError(
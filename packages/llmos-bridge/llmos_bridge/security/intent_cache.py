@@ -0,0 +1,292 @@
+"""Security layer — shared cache backends for IntentVerifier results.
+
+The IntentVerifier always keeps a small in-process LRU.  A backend from this
+module sits behind it so verdicts survive daemon restarts and are shared
+between workers:
+
+  - ``SQLiteIntentCache``  — a single file, shared by every process on the host
+  - ``RedisIntentCache``   — the ``llmos_bridge.cache`` client (Redis or fakeredis)
+
+Besides the exact content hash, the verifier can look a plan up by its
+*shape*: a normalised form that drops volatile fields (plan and action ids,
+timestamps, UUIDs) and optionally replaces literal parameter values with
+type placeholders.  Whether a shape hit may stand in for a fresh LLM call is
+decided by a ``ShapeReusePolicy``.
+
+Usage::
+
+    cache = SQLiteIntentCache(Path("~/.llmos/intent_cache.db"))
+    verifier = IntentVerifier(
+        llm_client=client,
+        cache_backend=cache,
+        shape_policy=ShapeReusePolicy(template_literals=True),
+    )
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from dataclasses import dataclass, field
+import hashlib
+import json
+import math
+from pathlib import Path
+import re
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiosqlite
+
+from llmos_bridge.logging import get_logger
+
+if TYPE_CHECKING:
+    from llmos_bridge.cache.client import CacheClient
+    from llmos_bridge.protocol.models import IMLPlan
+
+log = get_logger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+
+class IntentCacheBackend(ABC):
+    """Shared store for serialised VerificationResult dicts.
+
+    Backends must never raise on a lookup or store failure — a broken cache
+    only costs an extra LLM call.
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored result, or ``None`` on miss or expiry."""
+
+    @abstractmethod
+    async def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        """Store *value* under *key*.  ``ttl`` is in seconds, 0 = no expiry."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry owned by this backend."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release backend resources."""
+
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS intent_cache (
+    key         TEXT PRIMARY KEY,
+    value       TEXT NOT NULL,
+    expires_at  REAL
+);
+"""
+
+
+class SQLiteIntentCache(IntentCacheBackend):
+    """File-backed cache shared by every process on the host.
+
+    The connection is opened lazily on first use so the backend can be
+    constructed from synchronous factory code.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Path | str) -> None:
+        self._db_path = Path(db_path).expanduser()
+        self._conn: aiosqlite.Connection | None = None
+        self._init_lock = asyncio.Lock()
+
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._conn is not None:
+            return self._conn
+        async with self._init_lock:
+            if self._conn is None:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = await aiosqlite.connect(str(self._db_path))
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.executescript(_SCHEMA_SQL)
+                await conn.execute(
+                    "DELETE FROM intent_cache WHERE expires_at IS NOT NULL AND expires_at < ?",
+                    (time.time(),),
+                )
+                await conn.commit()
+                self._conn = conn
+        return self._conn
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            conn = await self._connection()
+            async with conn.execute(
+                "SELECT value, expires_at FROM intent_cache WHERE key = ?", (key,)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                await conn.execute("DELETE FROM intent_cache WHERE key = ?", (key,))
+                await conn.commit()
+                return None
+            data = json.loads(value)
+            return data if isinstance(data, dict) else None
+        except Exception as exc:
+            log.debug("intent_cache_get_failed", backend=self.name, error=str(exc))
+            return None
+
+    async def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        expires_at = time.time() + ttl if ttl > 0 else None
+        try:
+            conn = await self._connection()
+            await conn.execute(
+                "INSERT OR REPLACE INTO intent_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), expires_at),
+            )
+            await conn.commit()
+        except Exception as exc:
+            log.debug("intent_cache_set_failed", backend=self.name, error=str(exc))
+
+    async def clear(self) -> None:
+        try:
+            conn = await self._connection()
+            await conn.execute("DELETE FROM intent_cache")
+            await conn.commit()
+        except Exception as exc:
+            log.debug("intent_cache_clear_failed", backend=self.name, error=str(exc))
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+
+class RedisIntentCache(IntentCacheBackend):
+    """Cache on the shared ``llmos_bridge.cache`` client.
+
+    Uses real Redis when ``REDIS_URL`` is set (shared across hosts) and the
+    embedded fakeredis otherwise.  The client is resolved on first use unless
+    one is passed in.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: CacheClient | None = None,
+        *,
+        prefix: str = "llmos:intent:",
+    ) -> None:
+        self._client = client
+        self._prefix = prefix
+
+    async def _get_client(self) -> CacheClient:
+        if self._client is None:
+            from llmos_bridge.cache.client import get_cache_client
+
+            self._client = await get_cache_client()
+        return self._client
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        client = await self._get_client()
+        return await client.get(self._prefix + key)
+
+    async def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        client = await self._get_client()
+        # Redis expiries are whole seconds; round up so sub-second TTLs still expire.
+        await client.set(self._prefix + key, value, ttl=math.ceil(ttl) if ttl > 0 else None)
+
+    async def clear(self) -> None:
+        client = await self._get_client()
+        await client.delete_pattern(self._prefix + "*")
+
+
+# ---------------------------------------------------------------------------
+# Plan shape normalisation
+# ---------------------------------------------------------------------------
+
+_RISK_ORDER = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+# Parameter keys whose values change on every run and say nothing about intent.
+_VOLATILE_KEYS = frozenset({
+    "timestamp", "created_at", "updated_at", "started_at", "finished_at",
+    "request_id", "trace_id", "session_id", "nonce",
+})
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+_TIMESTAMP_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+
+
+@dataclass(frozen=True)
+class ShapeReusePolicy:
+    """When a verdict cached under a plan's shape may be reused.
+
+    Attributes:
+        template_literals: Replace literal string/number parameter values with
+            type placeholders, so plans differing only in values share a shape.
+            Template references (``{{result.x}}``) and booleans are kept.
+        literal_modules: Modules whose parameters are never templated — their
+            literal values carry the intent (e.g. ``os_exec`` commands).
+        verdicts: Verdicts that may be reused from a shape hit.
+        max_risk: Highest risk level that may be reused from a shape hit.
+    """
+
+    template_literals: bool = False
+    literal_modules: frozenset[str] = field(default_factory=frozenset)
+    verdicts: frozenset[str] = frozenset({"approve"})
+    max_risk: str = "low"
+
+    def allows(self, result: dict[str, Any]) -> bool:
+        """Return True if a cached result dict may stand in for a fresh analysis."""
+        if result.get("verdict") not in self.verdicts:
+            return False
+        risk = _RISK_ORDER.get(result.get("risk_level", "critical"), len(_RISK_ORDER))
+        return risk <= _RISK_ORDER.get(self.max_risk, 0)
+
+
+def _normalise(value: Any, template: bool, key: str = "") -> Any:
+    if key in _VOLATILE_KEYS:
+        return "<volatile>"
+    if isinstance(value, dict):
+        return {k: _normalise(v, template, k) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalise(v, template) for v in value]
+    if isinstance(value, str):
+        if "{{" in value:
+            return value
+        if template:
+            return "<str>"
+        return _TIMESTAMP_RE.sub("<timestamp>", _UUID_RE.sub("<uuid>", value))
+    if isinstance(value, bool) or value is None:
+        return value
+    if template and isinstance(value, (int, float)):
+        return "<num>"
+    return value
+
+
+def plan_shape_hash(plan: IMLPlan, policy: ShapeReusePolicy) -> str:
+    """Hash the normalised shape of *plan* under *policy*.
+
+    Action ids are replaced by their position so ``depends_on`` edges keep
+    their meaning regardless of how the planner named the actions.
+    """
+    positions = {a.id: i for i, a in enumerate(plan.actions)}
+    shape = [
+        {
+            "module": a.module,
+            "action": a.action,
+            "params": _normalise(
+                a.params,
+                policy.template_literals and a.module not in policy.literal_modules,
+            ),
+            "depends_on": sorted(positions.get(d, -1) for d in a.depends_on),
+        }
+        for a in plan.actions
+    ]
+    content = json.dumps(shape, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()[:32]
@@ -17,7 +17,8 @@ Architecture:
   - LLM-agnostic via LLMClient ABC
   - Async-first (all calls are awaitable)
   - Composable system prompt via PromptComposer + ThreatCategoryRegistry
-  - Caching via plan content hash (don't re-verify identical plans)
+  - Caching via plan content hash (don't re-verify identical plans), with an
+    optional shared backend and plan-shape reuse (see ``intent_cache``)
   - Configurable strict/permissive mode
   - EventBus integration via AuditLogger
 
@@ -44,11 +45,11 @@ Usage::
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from enum import Enum
 import hashlib
 import json
 import time
-from collections import OrderedDict
-from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
@@ -56,6 +57,11 @@ from pydantic import BaseModel, Field
 from llmos_bridge.logging import get_logger
 from llmos_bridge.protocol.models import IMLAction, IMLPlan
 from llmos_bridge.security.audit import AuditEvent, AuditLogger
+from llmos_bridge.security.intent_cache import (
+    IntentCacheBackend,
+    ShapeReusePolicy,
+    plan_shape_hash,
+)
 from llmos_bridge.security.llm_client import LLMClient, LLMMessage, NullLLMClient
 
 if TYPE_CHECKING:
@@ -160,6 +166,8 @@ class IntentVerifier:
         cache_ttl: float = 300.0,
         timeout: float = 30.0,
         model: str = "",
+        cache_backend: IntentCacheBackend | None = None,
+        shape_policy: ShapeReusePolicy | None = None,
     ) -> None:
         self._llm = llm_client or NullLLMClient()
         self._audit = audit_logger
@@ -173,6 +181,13 @@ class IntentVerifier:
         self._cache: OrderedDict[str, tuple[VerificationResult, float]] = OrderedDict()
         self._cache_size = cache_size
         self._cache_ttl = cache_ttl  # seconds, 0 = no TTL
+        # Shared L2 behind the LRU (survives restarts, shared across workers).
+        self._cache_backend = cache_backend
+        # None = exact content-hash hits only.
+        self._shape_policy = shape_policy
+        # (system prompt, fingerprint) — keys are namespaced by the prompt so
+        # shared entries written under other threat categories never match.
+        self._prompt_fingerprint: tuple[str, str] | None = None
 
     @property
     def enabled(self) -> bool:
@@ -198,10 +213,18 @@ class IntentVerifier:
         """Clear all cached verification results.
 
         Called when threat categories change (via PromptComposer invalidation)
-        to prevent stale results from being served.
+        to prevent stale results from being served.  Only the in-process LRU
+        is cleared; shared entries are keyed by the system prompt and stop
+        matching on their own (see :meth:`clear_shared_cache`).
         """
         self._cache.clear()
 
+    async def clear_shared_cache(self) -> None:
+        """Clear the in-process LRU and the shared cache backend, if any."""
+        self._cache.clear()
+        if self._cache_backend is not None:
+            await self._cache_backend.clear()
+
     def _get_system_prompt(self) -> str:
         """Get the current system prompt (dynamic via PromptComposer or fallback)."""
         if self._prompt_composer is not None:
@@ -222,6 +245,8 @@ class IntentVerifier:
             "cache_size": self._cache_size,
             "cache_ttl": self._cache_ttl,
             "cache_entries": len(self._cache),
+            "cache_backend": self._cache_backend.name if self._cache_backend else "memory",
+            "shape_cache": self._shape_policy is not None,
             "has_prompt_composer": self._prompt_composer is not None,
             "threat_categories": categories,
         }
@@ -243,9 +268,17 @@ class IntentVerifier:
                 cached=False,
             )
 
-        # 1. Check cache FIRST (cheapest path — hash + dict lookup only).
-        cache_key = self._plan_hash(plan)
-        cached = self._check_cache(cache_key)
+        # 1. Check cache FIRST (cheapest path — hash + dict lookup only),
+        # then the shared backend, then the plan's shape.
+        namespace = self._cache_namespace()
+        cache_key = f"{namespace}:{self._plan_hash(plan)}"
+        cached = self._check_cache(cache_key) or await self._check_shared_cache(cache_key)
+        shape_key: str | None = None
+        if cached is None and self._shape_policy is not None:
+            shape_key = f"{namespace}:shape:{plan_shape_hash(plan, self._shape_policy)}"
+            cached = self._check_cache(shape_key) or await self._check_shared_cache(shape_key)
+            if cached is not None and not self._shape_policy.allows(cached.model_dump(mode="json")):
+                cached = None
         if cached is not None:
             return cached
 
@@ -288,8 +321,15 @@ class IntentVerifier:
 
         result.analysis_duration_ms = round((time.time() - start) * 1000, 1)
 
-        # 3. Store in cache.
-        self._store_cache(cache_key, result)
+        # 3. Store in cache — under the shape key too when the policy would
+        # let a later plan of the same shape reuse this verdict.
+        await self._store_shared(cache_key, result)
+        if (
+            shape_key is not None
+            and self._shape_policy is not None
+            and self._shape_policy.allows(result.model_dump(mode="json"))
+        ):
+            await self._store_shared(shape_key, result)
 
         # 4. Audit log.
         if self._audit:
@@ -404,6 +444,36 @@ class IntentVerifier:
         self._cache.move_to_end(cache_key)
         return VerificationResult(**{**result.model_dump(), "cached": True})
 
+    async def _check_shared_cache(self, cache_key: str) -> VerificationResult | None:
+        """Look *cache_key* up in the shared backend and promote hits to the LRU."""
+        if self._cache_backend is None or self._cache_size <= 0:
+            return None
+        data = await self._cache_backend.get(cache_key)
+        if data is None:
+            return None
+        try:
+            result = VerificationResult(**{**data, "cached": False})
+        except (TypeError, ValueError):
+            return None
+        self._store_cache(cache_key, result)
+        return VerificationResult(**{**result.model_dump(), "cached": True})
+
+    async def _store_shared(self, cache_key: str, result: VerificationResult) -> None:
+        """Store in the LRU and write through to the shared backend."""
+        self._store_cache(cache_key, result)
+        if self._cache_backend is not None and self._cache_size > 0:
+            await self._cache_backend.set(
+                cache_key, result.model_dump(mode="json"), self._cache_ttl
+            )
+
+    def _cache_namespace(self) -> str:
+        """Return a short fingerprint of the current system prompt."""
+        prompt = self._get_system_prompt()
+        if self._prompt_fingerprint is None or self._prompt_fingerprint[0] is not prompt:
+            digest = hashlib.sha256(prompt.encode()).hexdigest()[:12]
+            self._prompt_fingerprint = (prompt, digest)
+        return self._prompt_fingerprint[1]
+
     def _store_cache(self, cache_key: str, result: VerificationResult) -> None:
         """Store a verification result in the LRU cache."""
         if self._cache_size <= 0:
@@ -514,5 +584,7 @@ class IntentVerifier:
         return hashlib.sha256(content.encode()).hexdigest()[:32]
 
     async def close(self) -> None:
-        """Release LLM client resources."""
+        """Release LLM client and cache backend resources."""
         await self._llm.close()
+        if self._cache_backend is not None:
+            await self._cache_backend.close()
@@ -23,6 +23,12 @@ Schema::
         PRIMARY KEY (permission, module_id, app_id)
     );
 
+The whole table is mirrored in memory, keyed by ``(app_id, module_id,
+permission)``, with a min-heap of expiry times.  Reads of a single grant
+(``is_granted``, ``get_grant``) are dict lookups with no I/O; grants,
+revocations and expiry write through to SQLite first and update the mirror
+afterwards.  The store assumes it is the only writer of its database file.
+
 Usage::
 
     store = PermissionStore(Path("~/.llmos/permissions.db"))
@@ -38,8 +44,12 @@ Usage::
 
 from __future__ import annotations
 
+import dataclasses
+import heapq
 import time
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
 import aiosqlite
 
@@ -65,6 +75,14 @@ CREATE INDEX IF NOT EXISTS idx_grants_app_id ON permission_grants (app_id);
 CREATE INDEX IF NOT EXISTS idx_grants_module ON permission_grants (module_id);
 """
 
+_SELECT_COLUMNS = (
+    "SELECT permission, module_id, app_id, scope, granted_at, granted_by, reason, expires_at "
+    "FROM permission_grants"
+)
+
+# In-memory mirror key: (app_id, module_id, permission).
+_GrantKey = tuple[str, str, str]
+
 
 class PermissionStore:
     """Async SQLite store for OS-level permission grants.
@@ -78,6 +96,10 @@ class PermissionStore:
     def __init__(self, db_path: Path | str) -> None:
         self._db_path = Path(db_path).expanduser()
         self._conn: aiosqlite.Connection | None = None
+        self._grants: dict[_GrantKey, PermissionGrant] = {}
+        # (expires_at, key) — entries whose grant was replaced or revoked are
+        # skipped when popped.
+        self._expiry_heap: list[tuple[float, _GrantKey]] = []
 
     async def init(self) -> None:
         """Create tables and clear session-scoped grants from previous runs."""
@@ -87,7 +109,8 @@ class PermissionStore:
         await self._conn.executescript(_SCHEMA_SQL)
         await self._conn.commit()
         await self.clear_session()
-        log.debug("permission_store_init", path=str(self._db_path))
+        await self._load()
+        log.debug("permission_store_init", path=str(self._db_path), grants=len(self._grants))
 
     async def _migrate(self) -> None:
         """Migrate legacy schema (PK was (permission, module_id)) to new schema.
@@ -142,6 +165,8 @@ class PermissionStore:
         if self._conn:
             await self._conn.close()
             self._conn = None
+        self._grants.clear()
+        self._expiry_heap.clear()
 
     # ------------------------------------------------------------------
     # Write operations
@@ -167,6 +192,9 @@ class PermissionStore:
             ),
         )
         await self._conn.commit()
+        if grant.app_id != effective_app:
+            grant = dataclasses.replace(grant, app_id=effective_app)
+        self._remember(grant)
 
     async def revoke(self, permission: str, module_id: str, app_id: str = "default") -> bool:
         """Remove a specific grant. Returns True if a row was deleted."""
@@ -176,6 +204,7 @@ class PermissionStore:
             (permission, module_id, app_id),
         )
         await self._conn.commit()
+        self._grants.pop((app_id, module_id, permission), None)
         return cursor.rowcount > 0
 
     async def revoke_all_for_module(self, module_id: str, app_id: str = "default") -> int:
@@ -186,6 +215,8 @@ class PermissionStore:
             (module_id, app_id),
         )
         await self._conn.commit()
+        for key in [k for k in self._grants if k[0] == app_id and k[1] == module_id]:
+            del self._grants[key]
         return cursor.rowcount
 
     async def clear_session(self) -> int:
@@ -199,6 +230,8 @@ class PermissionStore:
             (PermissionScope.SESSION.value,),
         )
         await self._conn.commit()
+        for key in [k for k, g in self._grants.items() if g.scope == PermissionScope.SESSION]:
+            del self._grants[key]
         cleared = cursor.rowcount
         if cleared:
             log.info("permission_store_session_cleared", count=cleared)
@@ -211,40 +244,20 @@ class PermissionStore:
     async def is_granted(self, permission: str, module_id: str, app_id: str = "default") -> bool:
         """Check if a specific permission is currently granted for an app (not expired)."""
         assert self._conn is not None
-        async with self._conn.execute(
-            "SELECT expires_at FROM permission_grants WHERE permission=? AND module_id=? AND app_id=?",
-            (permission, module_id, app_id),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-        if row is None:
-            return False
-        expires_at = row[0]
-        if expires_at is not None and time.time() > expires_at:
-            await self.revoke(permission, module_id, app_id)
-            return False
-        return True
+        heap = self._expiry_heap
+        if heap and heap[0][0] < time.time():
+            await self._expire_due()
+        return (app_id, module_id, permission) in self._grants
 
     async def get_grant(
         self, permission: str, module_id: str, app_id: str = "default"
     ) -> PermissionGrant | None:
         """Retrieve a specific grant record, or None if not found / expired."""
         assert self._conn is not None
-        async with self._conn.execute(
-            "SELECT permission, module_id, app_id, scope, granted_at, granted_by, reason, expires_at "
-            "FROM permission_grants WHERE permission=? AND module_id=? AND app_id=?",
-            (permission, module_id, app_id),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-        if row is None:
-            return None
-
-        grant = self._row_to_grant(row)
-        if grant.is_expired():
-            await self.revoke(permission, module_id, app_id)
-            return None
-        return grant
+        heap = self._expiry_heap
+        if heap and heap[0][0] < time.time():
+            await self._expire_due()
+        return self._grants.get((app_id, module_id, permission))
 
     async def get_all(self) -> list[PermissionGrant]:
         """Retrieve all non-expired grants across all applications."""
@@ -286,6 +299,50 @@ class PermissionStore:
             (module_id, app_id),
         )
 
+    # ------------------------------------------------------------------
+    # In-memory mirror
+    # ------------------------------------------------------------------
+
+    async def _load(self) -> None:
+        """Populate the mirror from SQLite (after session grants were cleared)."""
+        assert self._conn is not None
+        self._grants.clear()
+        self._expiry_heap.clear()
+        async with self._conn.execute(_SELECT_COLUMNS) as cursor:
+            async for row in cursor:
+                self._remember(self._row_to_grant(row))
+        await self._expire_due()
+
+    def _remember(self, grant: PermissionGrant) -> None:
+        key = (grant.app_id, grant.module_id, grant.permission)
+        self._grants[key] = grant
+        if grant.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (grant.expires_at, key))
+            if len(self._expiry_heap) > 2 * len(self._grants) + 64:
+                self._compact_heap()
+
+    def _compact_heap(self) -> None:
+        """Drop heap entries whose grant was replaced or revoked."""
+        self._expiry_heap = [
+            (g.expires_at, key)
+            for key, g in self._grants.items()
+            if g.expires_at is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    async def _expire_due(self) -> None:
+        """Revoke (write-through) every grant whose expiry has passed."""
+        now = time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            grant = self._grants.get(key)
+            if grant is None or grant.expires_at != expires_at:
+                continue  # stale entry
+            app_id, module_id, permission = key
+            await self.revoke(permission, module_id, app_id)
+            log.debug("permission_grant_expired", permission=permission, module_id=module_id, app_id=app_id)
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -312,7 +369,7 @@ class PermissionStore:
         return results
 
     @staticmethod
-    def _row_to_grant(row: tuple) -> PermissionGrant:  # type: ignore[type-arg]
+    def _row_to_grant(row: Sequence[Any]) -> PermissionGrant:
         return PermissionGrant(
             permission=row[0],
             module_id=row[1],
@@ -1,7 +1,17 @@
 """Security layer — Per-action sliding window rate limiter.
 
-In-memory rate limiter keyed by ``module_id.action_name``.  Timestamps
-older than 1 hour are pruned on each check to prevent unbounded growth.
+In-memory rate limiter keyed by ``module_id.action_name``.
+
+Each key keeps two bucketed sliding-window counters instead of a list of
+timestamps: 60 one-second buckets for the minute window and 60 one-minute
+buckets for the hour window (plus the bucket currently filling).  Checks
+and records are O(1) and memory per key is fixed, however many calls an
+hourly limit allows.
+
+The windows are rounded *outwards* to bucket boundaries, so a counter may
+still include calls up to one bucket older than the window (≤1s for the
+minute, ≤60s for the hour) — the limiter can deny slightly early, but never
+admits more calls than an exact sliding window would.
 
 Usage::
 
@@ -19,15 +29,68 @@ from llmos_bridge.logging import get_logger
 
 log = get_logger(__name__)
 
-# Prune timestamps older than this (1 hour)
-_PRUNE_WINDOW = 3600.0
+# Buckets per window; one extra slot holds the bucket currently filling.
+_BUCKETS = 60
+_MINUTE_BUCKET_SECONDS = 1.0
+_HOUR_BUCKET_SECONDS = 60.0
+
+
+class _BucketWindow:
+    """Sliding-window call counter over fixed-width time buckets."""
+
+    __slots__ = ("_counts", "_head", "_width", "total")
+
+    def __init__(self, width: float) -> None:
+        self._width = width
+        self._counts = [0] * (_BUCKETS + 1)
+        self._head: int | None = None  # absolute index of the newest bucket
+        self.total = 0
+
+    def count(self, now: float) -> int:
+        """Calls in the window ending at *now*."""
+        self._advance(now)
+        return self.total
+
+    def add(self, now: float) -> None:
+        bucket = self._advance(now)
+        self._counts[bucket % (_BUCKETS + 1)] += 1
+        self.total += 1
+
+    def _advance(self, now: float) -> int:
+        """Expire buckets that slid out of the window; return the current one."""
+        bucket = int(now // self._width)
+        head = self._head
+        if head is None or bucket - head > _BUCKETS:
+            if self.total:
+                self._counts = [0] * (_BUCKETS + 1)
+                self.total = 0
+            self._head = bucket
+        elif bucket > head:
+            counts = self._counts
+            for i in range(head + 1, bucket + 1):
+                slot = i % (_BUCKETS + 1)
+                self.total -= counts[slot]
+                counts[slot] = 0
+            self._head = bucket
+        else:
+            # Same bucket, or the wall clock stepped back: count into the newest.
+            bucket = head
+        return bucket
+
+
+class _ActionCounters:
+    __slots__ = ("hour", "minute")
+
+    def __init__(self) -> None:
+        self.minute = _BucketWindow(_MINUTE_BUCKET_SECONDS)
+        self.hour = _BucketWindow(_HOUR_BUCKET_SECONDS)
 
 
 class ActionRateLimiter:
     """Sliding-window rate limiter for action execution."""
 
     def __init__(self) -> None:
-        self._timestamps: dict[str, list[float]] = {}
+        self._counters: dict[str, _ActionCounters] = {}
 
     def check(
         self,
@@ -37,23 +100,7 @@ class ActionRateLimiter:
         calls_per_hour: int | None = None,
     ) -> bool:
         """Return True if the action is within its rate limits."""
-        now = time.time()
-        self._prune(action_key, now)
-        timestamps = self._timestamps.get(action_key, [])
-
-        if calls_per_minute is not None:
-            cutoff = now - 60.0
-            recent = sum(1 for t in timestamps if t > cutoff)
-            if recent >= calls_per_minute:
-                return False
-
-        if calls_per_hour is not None:
-            cutoff = now - 3600.0
-            recent = sum(1 for t in timestamps if t > cutoff)
-            if recent >= calls_per_hour:
-                return False
-
-        return True
+        return self._exceeded(action_key, time.time(), calls_per_minute, calls_per_hour) is None
 
     def check_or_raise(
         self,
@@ -64,28 +111,14 @@ class ActionRateLimiter:
     ) -> None:
         """Check rate limits; raise :class:`RateLimitExceededError` if exceeded."""
         now = time.time()
-        self._prune(action_key, now)
-        timestamps = self._timestamps.get(action_key, [])
-
-        if calls_per_minute is not None:
-            cutoff = now - 60.0
-            recent = sum(1 for t in timestamps if t > cutoff)
-            if recent >= calls_per_minute:
-                raise RateLimitExceededError(
-                    action_key=action_key,
-                    limit=calls_per_minute,
-                    window="minute",
-                )
-
-        if calls_per_hour is not None:
-            cutoff = now - 3600.0
-            recent = sum(1 for t in timestamps if t > cutoff)
-            if recent >= calls_per_hour:
-                raise RateLimitExceededError(
-                    action_key=action_key,
-                    limit=calls_per_hour,
-                    window="hour",
-                )
+        exceeded = self._exceeded(action_key, now, calls_per_minute, calls_per_hour)
+        if exceeded is not None:
+            window, limit = exceeded
+            raise RateLimitExceededError(
+                action_key=action_key,
+                limit=limit,
+                window=window,
+            )
 
         # Record the invocation
         self._record(action_key, now)
@@ -101,36 +134,52 @@ class ActionRateLimiter:
         Otherwise all keys are cleared.
         """
         if action_key is None:
-            self._timestamps.clear()
+            self._counters.clear()
         else:
-            self._timestamps.pop(action_key, None)
+            self._counters.pop(action_key, None)
 
     def get_counts(
         self, action_key: str
     ) -> dict[str, int]:
         """Return current counts for an action key (minute / hour)."""
+        counters = self._counters.get(action_key)
+        if counters is None:
+            return {"minute": 0, "hour": 0}
         now = time.time()
-        self._prune(action_key, now)
-        timestamps = self._timestamps.get(action_key, [])
         return {
-            "minute": sum(1 for t in timestamps if t > now - 60.0),
-            "hour": sum(1 for t in timestamps if t > now - 3600.0),
+            "minute": counters.minute.count(now),
+            "hour": counters.hour.count(now),
         }
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
+    def _exceeded(
+        self,
+        action_key: str,
+        now: float,
+        calls_per_minute: int | None,
+        calls_per_hour: int | None,
+    ) -> tuple[str, int] | None:
+        """Return ``(window, limit)`` of the first exceeded limit, if any."""
+        counters = self._counters.get(action_key)
+        if counters is None:
+            # No calls recorded yet: only a limit of zero can be exceeded.
+            if calls_per_minute is not None and calls_per_minute <= 0:
+                return "minute", calls_per_minute
+            if calls_per_hour is not None and calls_per_hour <= 0:
+                return "hour", calls_per_hour
+            return None
+        if calls_per_minute is not None and counters.minute.count(now) >= calls_per_minute:
+            return "minute", calls_per_minute
+        if calls_per_hour is not None and counters.hour.count(now) >= calls_per_hour:
+            return "hour", calls_per_hour
+        return None
+
     def _record(self, action_key: str, now: float) -> None:
-        if action_key not in self._timestamps:
-            self._timestamps[action_key] = []
-        self._timestamps[action_key].append(now)
-
-    def _prune(self, action_key: str, now: float) -> None:
-        """Remove timestamps older than the prune window."""
-        if action_key not in self._timestamps:
-            return
-        cutoff = now - _PRUNE_WINDOW
-        self._timestamps[action_key] = [
-            t for t in self._timestamps[action_key] if t > cutoff
-        ]
+        counters = self._counters.get(action_key)
+        if counters is None:
+            counters = self._counters[action_key] = _ActionCounters()
+        counters.minute.add(now)
+        counters.hour.add(now)
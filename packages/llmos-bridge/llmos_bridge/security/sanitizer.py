@@ -11,12 +11,19 @@ Rules applied:
   2. Injection scan — Patterns that match known prompt injection attempts are flagged.
   3. Encoding norm  — Normalise encoding to prevent Unicode tricks.
   4. Nested depth   — Prevent deeply nested JSON objects from bloating context.
+
+Large tabular results (database rows, spreadsheet ranges) are mostly scalars
+and short ASCII strings, so the walk is allocation-light: pure-ASCII strings
+skip NFKC (it is the identity on ASCII), one combined regex decides whether
+the per-pattern redaction pass is needed at all, and containers whose
+children come back unchanged are returned by identity instead of copied.
 """
 
 from __future__ import annotations
 
 import re
 import unicodedata
+from itertools import islice
 from typing import Any
 
 from llmos_bridge.logging import get_logger
@@ -35,6 +42,21 @@ _INJECTION_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"your\s+new\s+instructions?\s+are", re.IGNORECASE),
 ]
 
+# Alternation of every pattern above: a miss proves none of them matches, so
+# the per-pattern redaction loop only runs on strings that need it.  The
+# lookahead lists the possible first characters (both cases spelled out, which
+# the engine matches faster than an IGNORECASE class) so it skips ahead
+# instead of trying every branch at every offset; keep it in sync.
+_INJECTION_ANY = re.compile(
+    r"(?=[<\[aAdDiIsSyY])(?:" + "|".join(f"(?:{p.pattern})" for p in _INJECTION_PATTERNS) + ")",
+    re.IGNORECASE,
+)
+# Shortest string any pattern can match ("<INST>").
+_INJECTION_MIN_LEN = 6
+
+# Leaf types returned as-is without a call into _clean().
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
 _DEFAULT_MAX_STR_LEN = 50_000
 _DEFAULT_MAX_DEPTH = 10
 _DEFAULT_MAX_LIST_ITEMS = 1_000
@@ -64,7 +86,12 @@ class OutputSanitizer:
     def sanitize(
         self, output: Any, module: str = "", action: str = ""
     ) -> Any:
-        """Sanitise *output* and return the cleaned value."""
+        """Sanitise *output* and return the cleaned value.
+
+        Containers that need no cleaning are returned as-is, so the result
+        may be *output* itself (or share sub-objects with it).  Callers must
+        copy before mutating it.
+        """
         return self._clean(output, depth=0, module=module, action=action)
 
     # ------------------------------------------------------------------
@@ -91,29 +118,92 @@ class OutputSanitizer:
         if isinstance(value, str):
             return self._clean_string(value, module=module, action=action)
         if isinstance(value, dict):
-            return {
-                k: (v if k in self._BINARY_KEYS and isinstance(v, str)
-                    else self._clean(v, depth + 1, module, action))
-                for k, v in value.items()
-            }
+            return self._clean_dict(value, depth, module, action)
         if isinstance(value, list):
-            if len(value) > self._max_list_items:
-                log.warning(
-                    "sanitizer_list_truncated",
-                    original_len=len(value),
-                    max_len=self._max_list_items,
-                )
-                value = value[: self._max_list_items]
-            return [self._clean(item, depth + 1, module, action) for item in value]
+            return self._clean_list(value, depth, module, action)
         return value
 
+    def _clean_dict(
+        self, value: dict[str, Any], depth: int, module: str, action: str
+    ) -> dict[str, Any]:
+        """Clean a dict, returning *value* itself when no child changed."""
+        out: dict[str, Any] | None = None
+        # Leaves one level past max_depth must still be truncated by _clean().
+        fast = depth < self._max_depth
+        for i, (k, v) in enumerate(value.items()):
+            if (k in self._BINARY_KEYS and isinstance(v, str)) or (
+                fast
+                and (
+                    v.__class__ in _SCALAR_TYPES
+                    or (v.__class__ is str and self._is_clean_ascii(v))
+                )
+            ):
+                cleaned = v
+            else:
+                cleaned = self._clean(v, depth + 1, module, action)
+            if out is None:
+                if cleaned is v:
+                    continue
+                out = dict(islice(value.items(), i))
+            out[k] = cleaned
+        return value if out is None else out
+
+    def _clean_list(
+        self, value: list[Any], depth: int, module: str, action: str
+    ) -> list[Any]:
+        """Clean a list, returning *value* itself when nothing was truncated or changed."""
+        if len(value) > self._max_list_items:
+            log.warning(
+                "sanitizer_list_truncated",
+                original_len=len(value),
+                max_len=self._max_list_items,
+            )
+            value = value[: self._max_list_items]
+        out: list[Any] | None = None
+        fast = depth < self._max_depth
+        for i, item in enumerate(value):
+            if fast and (
+                item.__class__ in _SCALAR_TYPES
+                or (item.__class__ is str and self._is_clean_ascii(item))
+            ):
+                cleaned = item
+            else:
+                cleaned = self._clean(item, depth + 1, module, action)
+            if out is None:
+                if cleaned is item:
+                    continue
+                out = value[:i]
+            out.append(cleaned)
+        return value if out is None else out
+
+    def _is_clean_ascii(self, value: str) -> bool:
+        """Return True if _clean_string() would return *value* unchanged.
+
+        Only answers for ASCII strings; anything else goes through
+        _clean_string() for NFKC.
+        """
+        return (
+            value.isascii()
+            and len(value) <= self._max_str_len
+            and (
+                not self._injection_scan
+                or len(value) < _INJECTION_MIN_LEN
+                or _INJECTION_ANY.search(value) is None
+            )
+        )
+
     def _clean_string(self, value: str, module: str, action: str) -> str:
         # 1. Normalise Unicode (NFKC) to collapse compatibility characters
-        # and prevent homoglyph tricks.
-        value = unicodedata.normalize("NFKC", value)
+        # and prevent homoglyph tricks.  NFKC leaves ASCII untouched.
+        if not value.isascii():
+            value = unicodedata.normalize("NFKC", value)
 
         # 2. Scan for injection patterns and neutralise.
-        if self._injection_scan:
+        if (
+            self._injection_scan
+            and len(value) >= _INJECTION_MIN_LEN
+            and _INJECTION_ANY.search(value)
+        ):
             for pattern in _INJECTION_PATTERNS:
                 if pattern.search(value):
                     log.warning(
@@ -7,7 +7,11 @@ from llmos_bridge.security.scanners.base import (
     ScanVerdict,
 )
 from llmos_bridge.security.scanners.heuristic import HeuristicScanner, PatternRule
-from llmos_bridge.security.scanners.pipeline import PipelineResult, SecurityPipeline
+from llmos_bridge.security.scanners.pipeline import (
+    PipelineResult,
+    ScanResultCache,
+    SecurityPipeline,
+)
 from llmos_bridge.security.scanners.registry import ScannerRegistry
 
 __all__ = [
@@ -18,6 +22,7 @@ __all__ = [
     "ScannerRegistry",
     "SecurityPipeline",
     "PipelineResult",
+    "ScanResultCache",
     "HeuristicScanner",
     "PatternRule",
 ]
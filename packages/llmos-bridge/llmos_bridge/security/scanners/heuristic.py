@@ -5,6 +5,17 @@ Ships with ~35 built-in patterns across 9 threat categories.
 
 Users can add/remove/disable individual patterns at runtime.
 
+Rules are not run one by one over the whole input.  Each rule's regex is
+parsed once to extract the literal strings any match must contain (e.g.
+``disregard`` for ``pi_disregard``); all of those anchors are compiled into
+one trie-shaped regex that is run over the input in a single pass, and only
+the rules whose anchors were all found are evaluated.  Rules without a
+usable anchor (character-class rules such as ``unicode_homoglyph``) always
+run.  The prefilter only ever skips rules that cannot match, so results are
+identical to evaluating every rule.  Anchor extraction relies on CPython's
+private regex parser; if it is unavailable or changes shape, every rule
+simply runs.
+
 Usage::
 
     scanner = HeuristicScanner()
@@ -34,6 +45,12 @@ from llmos_bridge.security.scanners.base import (
     ScanVerdict,
 )
 
+try:  # stdlib regex AST (Python 3.11+) — private, so only ever optional
+    from re import _constants as _sre_constants
+    from re import _parser as _sre_parser
+except ImportError:  # pragma: no cover - depends on the interpreter
+    _sre_constants = _sre_parser = None  # type: ignore[assignment]
+
 _I = re.IGNORECASE
 
 
@@ -424,6 +441,174 @@ def _build_default_patterns() -> list[PatternRule]:
     return rules
 
 
+# ---------------------------------------------------------------------------
+# Literal prefilter
+# ---------------------------------------------------------------------------
+
+# Anchor sets whose shortest literal is shorter than this are only used when
+# a rule has nothing better — they match almost everywhere.
+_MIN_ANCHOR_LEN = 3
+
+_REPEAT_OPS = tuple(
+    getattr(_sre_constants, name, None)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+)
+
+# Characters that ``re.IGNORECASE`` treats as equal to an ASCII letter but
+# that ``str.lower()`` does not map onto it (dotted/dotless i, long s).
+_FOLD_TABLE = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+# Zero-width characters (ZWJ, ZWNJ, ZWSP, soft-hyphen, BOM, word joiner).
+_ZERO_WIDTH_TABLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\ufeff\u00ad\u2060"))
+
+
+def _fold(text: str) -> str:
+    """Case-fold *text* so that lowercase ASCII anchors can be found in it
+    with a case-sensitive search, for case-sensitive and
+    ``re.IGNORECASE`` rules alike."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_FOLD_TABLE).lower()
+
+
+def _literal_factors(parsed: Any) -> list[frozenset[str]]:
+    """Literal sets required by a parsed regex.
+
+    Every match of the regex contains at least one string of *each*
+    returned set (the list is a conjunction of disjunctions).  Literals are
+    lowercased ASCII; anything the extractor does not understand simply
+    contributes no factor.
+    """
+    factors: list[frozenset[str]] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            factors.append(frozenset({"".join(run).lower()}))
+            run.clear()
+
+    for op, av in parsed:
+        if op is _sre_constants.LITERAL and av < 128:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is _sre_constants.SUBPATTERN:
+            factors.extend(_literal_factors(av[-1]))
+        elif op is _sre_constants.ATOMIC_GROUP:
+            factors.extend(_literal_factors(av))
+        elif op in _REPEAT_OPS and av[0] >= 1:
+            factors.extend(_literal_factors(av[2]))
+        elif op is _sre_constants.BRANCH:
+            alternatives = [_best_factor(_literal_factors(b)) for b in av[1]]
+            if all(alternatives):
+                factors.append(frozenset().union(*alternatives))  # type: ignore[arg-type]
+    flush()
+    return factors
+
+
+def _best_factor(factors: list[frozenset[str]]) -> frozenset[str] | None:
+    if not factors:
+        return None
+    return max(factors, key=lambda f: (min(map(len, f)), -len(f)))
+
+
+def _rule_anchors(pattern: re.Pattern[str]) -> tuple[frozenset[str], ...]:
+    """Anchor sets for *pattern*; empty when the rule must always run."""
+    if _sre_parser is None:
+        return ()
+    factors = _literal_factors(_sre_parser.parse(pattern.pattern, pattern.flags))
+    strong = {f for f in factors if min(map(len, f)) >= _MIN_ANCHOR_LEN}
+    if strong:
+        return tuple(strong)
+    best = _best_factor(factors)
+    return (best,) if best else ()
+
+
+def _trie_pattern(words: set[str]) -> str:
+    """Regex source matching any of *words*, longest first, as a prefix trie.
+
+    A trie-shaped alternation lets the regex engine reject a position after
+    one character comparison instead of trying every word in turn.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict[str, Any]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+def _overlaps(first: str, second: str) -> bool:
+    """True when a proper suffix of *first* is a proper prefix of *second*."""
+    longest = min(len(first), len(second)) - 1
+    return any(first.endswith(second[:k]) for k in range(1, longest + 1))
+
+
+class _AnchorIndex:
+    """Single-pass literal prefilter for a fixed list of rules.
+
+    ``findall`` reports non-overlapping, longest-at-position matches, so an
+    anchor occurrence can only be missed when it lies inside a reported
+    match: either wholly (it is then a substring of that match — recovered
+    through ``_implied``) or straddling its end (recovered by the explicit
+    ``in`` checks in ``_overlapping``).
+    """
+
+    def __init__(self, rules: list[PatternRule]) -> None:
+        self.key = tuple(rule.pattern for rule in rules)
+        self._anchors: list[tuple[frozenset[str], ...]] = []
+        words: set[str] = set()
+        for rule in rules:
+            try:
+                anchors = _rule_anchors(rule.pattern)
+            except Exception:
+                # Unexpected regex AST shape — run the rule unconditionally.
+                anchors = ()
+            self._anchors.append(anchors)
+            for factor in anchors:
+                words.update(factor)
+        self._regex = re.compile(_trie_pattern(words)) if words else None
+        self._implied = {w: frozenset(v for v in words if v in w) for w in words}
+        self._overlapping = {
+            w: tuple(v for v in words if v not in w and _overlaps(w, v)) for w in words
+        }
+
+    def candidates(self, folded: str) -> list[bool]:
+        """Per rule: whether it can possibly match the text *folded* came from."""
+        present: set[str] = set()
+        if self._regex is not None:
+            found = set(self._regex.findall(folded))
+            for word in found:
+                present |= self._implied[word]
+            for word in found:
+                for other in self._overlapping[word]:
+                    if other not in present and other in folded:
+                        present |= self._implied[other]
+        return [
+            all(not present.isdisjoint(factor) for factor in anchors)
+            for anchors in self._anchors
+        ]
+
+
+def _prepare_text(text: str) -> tuple[str, str]:
+    """Return ``(normalized, folded)`` for *text*."""
+    if text.isascii():
+        # NFKC is the identity on ASCII and zero-width characters are not ASCII.
+        normalized = text
+    else:
+        normalized = unicodedata.normalize("NFKC", text).translate(_ZERO_WIDTH_TABLE)
+    return normalized, _fold(normalized)
+
+
 # Compiled once at module load time — cheap regex check on import.
 _B64_RE = re.compile(r"[A-Za-z0-9+/]{40,}={0,2}")
 
@@ -470,6 +655,7 @@ class HeuristicScanner(InputScanner):
                     p.enabled = False
         self._reject_threshold = reject_threshold
         self._warn_threshold = warn_threshold
+        self._anchor_index: _AnchorIndex | None = None
 
     @property
     def patterns(self) -> list[PatternRule]:
@@ -501,24 +687,32 @@ class HeuristicScanner(InputScanner):
           equivalents (e.g. ``\uff49\uff47\uff4e\uff4f\uff52\uff45`` → ``ignore``).
         - Zero-width characters are stripped so they cannot split keywords.
         """
-        # 1. NFKC (compatibility decomposition + canonical composition)
-        normalized = unicodedata.normalize("NFKC", text)
-        # 2. Strip zero-width characters (ZWJ, ZWNJ, ZWSP, soft-hyphen, BOM)
-        _ZERO_WIDTH = frozenset("\u200b\u200c\u200d\ufeff\u00ad\u2060")
-        return "".join(ch for ch in normalized if ch not in _ZERO_WIDTH)
+        return _prepare_text(text)[0]
+
+    def _prefilter(self) -> _AnchorIndex:
+        """The anchor index for the current rule list, rebuilt on change.
+
+        Only the rules' regexes are part of the index — enabling or
+        disabling a rule does not require a rebuild.
+        """
+        index = self._anchor_index
+        if index is None or index.key != tuple(rule.pattern for rule in self._patterns):
+            index = self._anchor_index = _AnchorIndex(self._patterns)
+        return index
 
     async def scan(
         self, text: str, context: ScanContext | None = None
     ) -> ScanResult:
         """Scan text against all enabled heuristic patterns."""
-        normalized = self._normalize_text(text)
+        normalized, folded = _prepare_text(text)
+        candidates = self._prefilter().candidates(folded)
 
         matched: list[str] = []
         threat_types: set[str] = set()
         max_severity = 0.0
 
-        for rule in self._patterns:
-            if not rule.enabled:
+        for rule, candidate in zip(self._patterns, candidates, strict=True):
+            if not rule.enabled or not candidate:
                 continue
             if rule.pattern.search(normalized):
                 matched.append(rule.id)
@@ -19,17 +19,35 @@ Usage::
     result = await pipeline.scan_input(plan)
     if not result.allowed:
         raise InputScanRejectedError(...)
+
+Incremental scanning:
+    With ``cache_size > 0`` the plan is not scanned as one JSON document.
+    It is split into fragments — the description/metadata and one fragment
+    per action — and each scanner's result for a fragment is cached under
+    the SHA-256 of its text.  Agent loops that resubmit a plan with one
+    action changed then only pay for that action; the per-scanner result
+    is the merge of its fragment results.  ``plan_id`` is deliberately not
+    part of any fragment so that resubmissions hit the cache.
 """
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
 import json
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from llmos_bridge.logging import get_logger
-from llmos_bridge.security.scanners.base import ScanContext, ScanResult, ScanVerdict
+from llmos_bridge.security.scanners.base import (
+    InputScanner,
+    ScanContext,
+    ScanResult,
+    ScanVerdict,
+)
 from llmos_bridge.security.scanners.registry import ScannerRegistry
 
 if TYPE_CHECKING:
@@ -61,8 +79,109 @@ class PipelineResult:
         }
 
 
+_VERDICT_RANK = {ScanVerdict.ALLOW: 0, ScanVerdict.WARN: 1, ScanVerdict.REJECT: 2}
+
+
+@dataclass
+class _CacheEntry:
+    result: ScanResult
+    timestamp: float
+
+
+class ScanResultCache:
+    """LRU cache of per-fragment scan results, keyed by content hash.
+
+    Args:
+        max_entries: Maximum cached results (LRU eviction).
+        ttl_seconds: Time-to-live for cache entries (0 = no TTL).
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 600.0) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._cache: OrderedDict[tuple[str, str, str], _CacheEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: tuple[str, str, str]) -> ScanResult | None:
+        """Return the cached result for *key*, or None on miss/expiry."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if self._ttl > 0 and (time.monotonic() - entry.timestamp) > self._ttl:
+            del self._cache[key]
+            self._misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry.result
+
+    def put(self, key: tuple[str, str, str], result: ScanResult) -> None:
+        """Store *result*, evicting the least recently used entry if full."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self._max_entries:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+        self._cache[key] = _CacheEntry(result=result, timestamp=time.monotonic())
+
+    def clear(self) -> None:
+        """Drop all entries, e.g. after scanner rules changed at runtime."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        total = self._hits + self._misses
+        return {
+            "size": len(self._cache),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": round(self._hits / total, 4) if total > 0 else 0.0,
+        }
+
+
+@dataclass
+class _ScannerLatency:
+    """Recent wall-clock durations of one scanner (seconds)."""
+
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=512))
+    timeouts: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        latencies = sorted(self.samples)
+
+        def pct(q: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3)
+
+        return {
+            "count": len(latencies),
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            "timeouts": self.timeouts,
+        }
+
+
 class SecurityPipeline:
-    """Orchestrates input scanners in priority order before plan execution."""
+    """Orchestrates input scanners in priority order before plan execution.
+
+    By default scanners run one after another, fastest first.  With
+    ``parallel=True`` they run concurrently so the slow ML adapters'
+    latencies overlap instead of adding up; with ``fail_fast`` the first
+    REJECT cancels the scanners still running.  ``scanner_timeout`` gives
+    every scanner a deadline — a scanner that misses it yields a WARN
+    result instead of stalling plan admission.
+    """
 
     def __init__(
         self,
@@ -73,6 +192,10 @@ class SecurityPipeline:
         reject_threshold: float = 0.7,
         warn_threshold: float = 0.3,
         enabled: bool = True,
+        cache_size: int = 0,
+        cache_ttl_seconds: float = 600.0,
+        parallel: bool = False,
+        scanner_timeout: float | None = None,
     ) -> None:
         self._registry = registry
         self._audit = audit_logger
@@ -80,6 +203,14 @@ class SecurityPipeline:
         self._reject_threshold = reject_threshold
         self._warn_threshold = warn_threshold
         self._enabled = enabled
+        self._cache = (
+            ScanResultCache(max_entries=cache_size, ttl_seconds=cache_ttl_seconds)
+            if cache_size > 0
+            else None
+        )
+        self._parallel = parallel
+        self._scanner_timeout = scanner_timeout
+        self._latency: dict[str, _ScannerLatency] = {}
 
     @property
     def enabled(self) -> bool:
@@ -93,6 +224,15 @@ class SecurityPipeline:
     def registry(self) -> ScannerRegistry:
         return self._registry
 
+    @property
+    def cache(self) -> ScanResultCache | None:
+        return self._cache
+
+    def clear_cache(self) -> None:
+        """Forget cached fragment results (call after changing scanner rules)."""
+        if self._cache is not None:
+            self._cache.clear()
+
     async def scan_input(self, plan: IMLPlan) -> PipelineResult:
         """Run all enabled scanners against the serialised plan."""
         if not self._enabled:
@@ -102,7 +242,8 @@ class SecurityPipeline:
         if not scanners:
             return PipelineResult(allowed=True)
 
-        plan_text = self._serialize_plan(plan)
+        fragments = self._plan_fragments(plan) if self._cache is not None else None
+        plan_text = self._serialize_plan(plan) if fragments is None else ""
         context = ScanContext(
             plan_id=plan.plan_id,
             plan_description=plan.description,
@@ -114,49 +255,13 @@ class SecurityPipeline:
         start = time.time()
         pipeline_result = PipelineResult()
 
-        for scanner in scanners:
-            try:
-                scan_start = time.time()
-                result = await scanner.scan(plan_text, context)
-                result.scan_duration_ms = round(
-                    (time.time() - scan_start) * 1000, 2
-                )
-            except Exception as exc:
-                log.error(
-                    "scanner_error",
-                    scanner_id=scanner.scanner_id,
-                    error=str(exc),
-                )
-                result = ScanResult(
-                    scanner_id=scanner.scanner_id,
-                    verdict=ScanVerdict.WARN,
-                    risk_score=0.0,
-                    details=f"Scanner error: {exc}",
-                )
-
-            pipeline_result.scanner_results.append(result)
-
-            # Update aggregates.
-            if result.risk_score > pipeline_result.max_risk_score:
-                pipeline_result.max_risk_score = result.risk_score
-            if result.verdict == ScanVerdict.REJECT:
-                pipeline_result.aggregate_verdict = ScanVerdict.REJECT
-                pipeline_result.allowed = False
-            elif (
-                result.verdict == ScanVerdict.WARN
-                and pipeline_result.aggregate_verdict != ScanVerdict.REJECT
-            ):
-                pipeline_result.aggregate_verdict = ScanVerdict.WARN
-
-            # Short-circuit on REJECT if fail_fast.
-            if self._fail_fast and result.verdict == ScanVerdict.REJECT:
-                pipeline_result.short_circuited = True
-                log.warning(
-                    "scanner_pipeline_short_circuit",
-                    scanner_id=scanner.scanner_id,
-                    risk_score=result.risk_score,
-                )
-                break
+        if self._parallel and len(scanners) > 1:
+            await self._run_parallel(scanners, plan_text, fragments, context, pipeline_result)
+        else:
+            for scanner in scanners:
+                result = await self._scan_one(scanner, plan_text, fragments, context)
+                if self._record(pipeline_result, scanner, result):
+                    break
 
         pipeline_result.total_duration_ms = round(
             (time.time() - start) * 1000, 2
@@ -192,6 +297,200 @@ class SecurityPipeline:
 
         return pipeline_result
 
+    async def _run_parallel(
+        self,
+        scanners: list[InputScanner],
+        plan_text: str,
+        fragments: list[tuple[str, str, str]] | None,
+        context: ScanContext,
+        pipeline_result: PipelineResult,
+    ) -> None:
+        """Run all scanners concurrently; on a fail-fast REJECT cancel the rest.
+
+        Results are reported in priority order regardless of completion order.
+        """
+        tasks = {
+            asyncio.ensure_future(self._scan_one(scanner, plan_text, fragments, context)): scanner
+            for scanner in scanners
+        }
+        done_results: dict[str, ScanResult] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                stop = False
+                for task in done:
+                    result = task.result()
+                    done_results[tasks[task].scanner_id] = result
+                    if self._fail_fast and result.verdict == ScanVerdict.REJECT:
+                        stop = True
+                if stop:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for scanner in scanners:
+            scanned = done_results.get(scanner.scanner_id)
+            if scanned is None:
+                continue  # cancelled after another scanner rejected
+            if self._record(pipeline_result, scanner, scanned):
+                break
+
+    async def _scan_one(
+        self,
+        scanner: InputScanner,
+        plan_text: str,
+        fragments: list[tuple[str, str, str]] | None,
+        context: ScanContext,
+    ) -> ScanResult:
+        """Run one scanner under the per-scanner deadline and record its latency."""
+
+        async def work() -> ScanResult:
+            if fragments is None:
+                return (await self._run_scanner(scanner, plan_text, context))[0]
+            return await self._scan_fragments(scanner, fragments, context)
+
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            if self._scanner_timeout is None:
+                result = await work()
+            else:
+                result = await asyncio.wait_for(work(), self._scanner_timeout)
+        except TimeoutError:
+            timed_out = True
+            log.warning(
+                "scanner_timeout",
+                scanner_id=scanner.scanner_id,
+                timeout_s=self._scanner_timeout,
+            )
+            result = ScanResult(
+                scanner_id=scanner.scanner_id,
+                verdict=ScanVerdict.WARN,
+                risk_score=0.0,
+                details=f"Scanner timed out after {self._scanner_timeout}s",
+                metadata={"timed_out": True},
+            )
+        elapsed = time.perf_counter() - started
+        stats = self._latency.setdefault(scanner.scanner_id, _ScannerLatency())
+        stats.samples.append(elapsed)
+        if timed_out:
+            stats.timeouts += 1
+            result.scan_duration_ms = round(elapsed * 1000, 2)
+        return result
+
+    def _record(
+        self, pipeline_result: PipelineResult, scanner: InputScanner, result: ScanResult
+    ) -> bool:
+        """Fold *result* into the aggregates.  Returns True to short-circuit."""
+        pipeline_result.scanner_results.append(result)
+
+        if result.risk_score > pipeline_result.max_risk_score:
+            pipeline_result.max_risk_score = result.risk_score
+        if result.verdict == ScanVerdict.REJECT:
+            pipeline_result.aggregate_verdict = ScanVerdict.REJECT
+            pipeline_result.allowed = False
+        elif (
+            result.verdict == ScanVerdict.WARN
+            and pipeline_result.aggregate_verdict != ScanVerdict.REJECT
+        ):
+            pipeline_result.aggregate_verdict = ScanVerdict.WARN
+
+        # Short-circuit on REJECT if fail_fast.
+        if self._fail_fast and result.verdict == ScanVerdict.REJECT:
+            pipeline_result.short_circuited = True
+            log.warning(
+                "scanner_pipeline_short_circuit",
+                scanner_id=scanner.scanner_id,
+                risk_score=result.risk_score,
+            )
+            return True
+        return False
+
+    async def _run_scanner(
+        self, scanner: InputScanner, text: str, context: ScanContext
+    ) -> tuple[ScanResult, bool]:
+        """Run one scanner over *text*, converting exceptions to WARN.
+
+        Returns the result and whether the scanner completed without error.
+        """
+        try:
+            scan_start = time.time()
+            result = await scanner.scan(text, context)
+            result.scan_duration_ms = round((time.time() - scan_start) * 1000, 2)
+            return result, True
+        except Exception as exc:
+            log.error(
+                "scanner_error",
+                scanner_id=scanner.scanner_id,
+                error=str(exc),
+            )
+            result = ScanResult(
+                scanner_id=scanner.scanner_id,
+                verdict=ScanVerdict.WARN,
+                risk_score=0.0,
+                details=f"Scanner error: {exc}",
+            )
+            return result, False
+
+    async def _scan_fragments(
+        self,
+        scanner: InputScanner,
+        fragments: list[tuple[str, str, str]],
+        context: ScanContext,
+    ) -> ScanResult:
+        """Scan each fragment through the cache and merge the results."""
+        assert self._cache is not None
+        parts: list[tuple[str, ScanResult]] = []
+        hits = 0
+        duration_ms = 0.0
+        for label, text, digest in fragments:
+            key = (scanner.scanner_id, scanner.version, digest)
+            result = self._cache.get(key)
+            if result is not None:
+                hits += 1
+            else:
+                fragment_context = dataclasses.replace(
+                    context, extra={**context.extra, "fragment": label}
+                )
+                result, ok = await self._run_scanner(scanner, text, fragment_context)
+                duration_ms += result.scan_duration_ms
+                if ok:
+                    self._cache.put(key, result)
+            parts.append((label, result))
+            if self._fail_fast and result.verdict == ScanVerdict.REJECT:
+                break
+        merged = self._merge_results(scanner.scanner_id, parts)
+        merged.scan_duration_ms = round(duration_ms, 2)
+        merged.metadata["fragments"] = len(parts)
+        merged.metadata["cache_hits"] = hits
+        return merged
+
+    @staticmethod
+    def _merge_results(
+        scanner_id: str, parts: list[tuple[str, ScanResult]]
+    ) -> ScanResult:
+        """Combine per-fragment results: worst verdict, max risk, union of matches."""
+        merged = ScanResult(scanner_id=scanner_id, verdict=ScanVerdict.ALLOW)
+        threat_types: set[str] = set()
+        details: list[str] = []
+        for label, result in parts:
+            if _VERDICT_RANK[result.verdict] > _VERDICT_RANK[merged.verdict]:
+                merged.verdict = result.verdict
+            merged.risk_score = max(merged.risk_score, result.risk_score)
+            threat_types.update(result.threat_types)
+            for pattern_id in result.matched_patterns:
+                if pattern_id not in merged.matched_patterns:
+                    merged.matched_patterns.append(pattern_id)
+            if result.details:
+                details.append(f"{label}: {result.details}")
+        merged.threat_types = sorted(threat_types)
+        merged.details = "; ".join(details)
+        return merged
+
     def status(self) -> dict[str, Any]:
         """Return pipeline status for REST API."""
         return {
@@ -200,8 +499,37 @@ class SecurityPipeline:
             "reject_threshold": self._reject_threshold,
             "warn_threshold": self._warn_threshold,
             "scanners": self._registry.to_dict_list(),
+            "parallel": self._parallel,
+            "scanner_timeout_s": self._scanner_timeout,
+            "scan_cache": self._cache.stats() if self._cache is not None else None,
+            "latency": {
+                scanner_id: stats.to_dict() for scanner_id, stats in self._latency.items()
+            },
         }
 
+    @staticmethod
+    def _plan_fragments(plan: IMLPlan) -> list[tuple[str, str, str]]:
+        """Split *plan* into ``(label, text, sha256)`` scan fragments."""
+        header: dict[str, Any] = {"description": plan.description}
+        if plan.metadata:
+            header["metadata"] = {
+                "created_by": plan.metadata.created_by,
+                "tags": plan.metadata.tags,
+            }
+        texts = [("plan", json.dumps(header, default=str))]
+        for a in plan.actions:
+            texts.append((
+                f"action {a.id}",
+                json.dumps(
+                    {"id": a.id, "module": a.module, "action": a.action, "params": a.params},
+                    default=str,
+                ),
+            ))
+        return [
+            (label, text, hashlib.sha256(text.encode()).hexdigest())
+            for label, text in texts
+        ]
+
     @staticmethod
     def _serialize_plan(plan: IMLPlan) -> str:
         """Serialize plan to JSON text for scanners."""
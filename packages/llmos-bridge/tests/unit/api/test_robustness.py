@@ -16,7 +16,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from llmos_bridge.api.middleware import RateLimitMiddleware
-from llmos_bridge.orchestration.executor import _truncate_result
+from llmos_bridge.orchestration.executor import _json_size, _truncate_result
 
 
 # ---------------------------------------------------------------------------
@@ -183,6 +183,49 @@ class TestResultTruncation:
         result = _truncate_result({}, max_bytes=100)
         assert result == {}
 
+    def test_truncation_is_idempotent(self) -> None:
+        first = _truncate_result({"data": "x" * 5000}, max_bytes=200)
+        assert _truncate_result(first, max_bytes=200) is first
+
+    def test_forged_truncated_marker_still_limited(self) -> None:
+        data = {"_truncated": True, "data": "x" * 2000}
+        result = _truncate_result(data, max_bytes=1000)
+        assert result is not data
+        assert result["_original_size"] > 1000
+        assert len(result["data"]) == 1000
+
+    def test_measured_size_matches_json_dumps(self) -> None:
+        data = {
+            "rows": [{"id": i, "name": f"r\u00e9{i}", "ok": i % 2 == 0} for i in range(200)],
+            "meta": {str(i): None for i in range(100)},
+            "tuple": tuple(range(70)),
+            1: 2.5,
+        }
+        expected = len(json.dumps(data, default=str))
+        assert _json_size(data, limit=expected) == expected
+        assert _truncate_result(data, max_bytes=expected) is data
+
+    def test_size_stops_early_inside_small_envelope(self) -> None:
+        serialised = 0
+
+        class Leaf:
+            def __str__(self) -> str:
+                nonlocal serialised
+                serialised += 1
+                return "x" * 100
+
+        data = {"rows": [Leaf() for _ in range(10_000)]}
+        assert _json_size(data, limit=1_000) > 1_000
+        assert serialised < 20
+
+    def test_oversized_measurement_stops_early(self) -> None:
+        data = ["y" * 100] * 100_000
+        result = _truncate_result(data, max_bytes=1000)
+        assert result["_truncated"] is True
+        # Lower bound only — the full ~10 MB payload is never serialised.
+        assert 1000 < result["_original_size"] < 10_000
+        assert result["data"] == json.dumps(data)[:1000]
+
 
 # ---------------------------------------------------------------------------
 # Tests — Enriched Health Response
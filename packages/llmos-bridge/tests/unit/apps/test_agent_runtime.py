@@ -452,3 +452,220 @@ class TestBuildToolDefs:
             tools=[],
         )
         assert agent._build_tool_defs() == []
+
+
+class TestTokenAccounting:
+    class RecordingLLM(MultiTurnLLM):
+        def __init__(self, n_tool_turns=3):
+            super().__init__(n_tool_turns)
+            self.requests: list[list[dict]] = []
+
+        async def chat(self, *, system, messages, tools, max_tokens=4096, **kwargs):
+            self.requests.append(messages)
+            return await super().chat(system=system, messages=messages, tools=tools)
+
+    @pytest.mark.asyncio
+    async def test_tool_cost_counted_once_per_run(self):
+        counted: list[str] = []
+
+        def tokenizer(text):
+            counted.append(text)
+            return len(text) // 4
+
+        agent = AgentRuntime(
+            agent_config=make_config(),
+            llm=MultiTurnLLM(n_tool_turns=4),
+            tools=[make_tool()],
+            execute_tool=mock_execute_tool,
+            tokenizer=tokenizer,
+        )
+        result = await agent.run("go")
+        assert result.success
+        tools_json = json.dumps(agent._build_tool_defs())
+        assert counted.count(tools_json) == 1
+        # History is counted as messages arrive, not re-serialised per turn.
+        assert len(counted) == 1 + 1 + 2 * len(agent._context_manager.messages)
+
+    @pytest.mark.asyncio
+    async def test_preflight_trims_with_cached_counts(self):
+        from llmos_bridge.apps.models import ContextConfig
+
+        async def big_result(module_id, action, params):
+            return {"content": "x" * 1200}
+
+        llm = self.RecordingLLM(n_tool_turns=5)
+        config = make_config(loop=LoopConfig(
+            type=LoopType.reactive,
+            max_turns=10,
+            context=ContextConfig(max_tokens=100_000, model_context_window=1000),
+        ))
+        agent = AgentRuntime(
+            agent_config=config, llm=llm, tools=[make_tool()], execute_tool=big_result,
+        )
+        await agent.run("go")
+        last = llm.requests[-1]
+        # The final assistant reply is added after the last request.
+        sent_from = agent.get_conversation_messages()[:-1]
+        assert 0 < len(last) < len(sent_from)
+        assert last == sent_from[-len(last):]
+
+
+class ScriptedStreamLLM(LLMProvider):
+    """Streams scripted turns; each turn is a list of (delay_s, event)."""
+
+    def __init__(self, turns, log):
+        self._turns = list(turns)
+        self._log = log
+
+    async def chat(self, *, system, messages, tools, max_tokens=4096, **kwargs):
+        raise AssertionError("pipelined runs must stream")
+
+    async def chat_stream(self, *, system, messages, tools, max_tokens=4096, **kwargs):
+        import asyncio
+
+        for delay, event in self._turns.pop(0):
+            await asyncio.sleep(delay)
+            if isinstance(event, Exception):
+                raise event
+            yield event
+        self._log.append("stream_end")
+
+    async def close(self):
+        pass
+
+
+def _call(tc_id, name, **arguments):
+    return {"type": "tool_call", "id": tc_id, "name": name, "arguments": arguments}
+
+
+class TestPipelinedTools:
+    @staticmethod
+    def _agent(turns, log, delay=0.05, **loop):
+        import asyncio
+
+        async def execute(module_id, action, params):
+            log.append(f"start:{action}:{params.get('path', '')}")
+            await asyncio.sleep(delay)
+            return {"ok": True}
+
+        config = make_config(loop=LoopConfig(
+            type=LoopType.reactive, max_turns=5, pipeline_tools=True, **loop,
+        ))
+        tools = [
+            make_tool(),
+            make_tool("filesystem.write_file", action="write_file"),
+        ]
+        return AgentRuntime(
+            agent_config=config,
+            llm=ScriptedStreamLLM(turns, log),
+            tools=tools,
+            execute_tool=execute,
+        )
+
+    @pytest.mark.asyncio
+    async def test_reads_start_before_stream_ends(self):
+        log: list[str] = []
+        turns = [
+            [
+                (0, _call("a", "filesystem__read_file", path="/a")),
+                (0, _call("b", "filesystem__read_file", path="/b")),
+                (0.05, {"type": "text", "text": "Reading."}),
+                (0, {"type": "stop", "done": False}),
+            ],
+            [(0, {"type": "text", "text": "Done."}), (0, {"type": "stop", "done": True})],
+        ]
+        agent = self._agent(turns, log)
+        result = await agent.run("go")
+        assert result.success
+        assert result.output == "Done."
+        assert log.index("start:read_file:/a") < log.index("stream_end")
+        assert log.index("start:read_file:/b") < log.index("stream_end")
+        assert [r.tool_call_id for r in result.turns[0].tool_results] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_writes_wait_and_block_later_reads(self):
+        log: list[str] = []
+        turns = [
+            [
+                (0, _call("r1", "filesystem__read_file", path="/a")),
+                (0, _call("w", "filesystem__write_file", path="/a")),
+                (0, _call("r2", "filesystem__read_file", path="/a")),
+                (0.02, {"type": "stop", "done": False}),
+            ],
+            [(0, {"type": "stop", "done": True})],
+        ]
+        agent = self._agent(turns, log)
+        await agent.run("go")
+        end = log.index("stream_end")
+        assert log.index("start:read_file:/a") < end
+        assert log.index("start:write_file:/a") > end
+        assert log.count("start:read_file:/a") == 2
+        assert log[end + 1:].count("start:read_file:/a") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_cancels_speculative_reads(self):
+        from llmos_bridge.apps.models import OnLLMError
+
+        log: list[str] = []
+        turns = [[
+            (0, _call("a", "filesystem__read_file", path="/a")),
+            (0.01, RuntimeError("connection reset")),
+        ]]
+        agent = self._agent(turns, log, delay=1.0, on_llm_error=OnLLMError.fail)
+        result = await agent.run("go")
+        assert result.stop_reason == "error"
+        assert log == ["start:read_file:/a"]
+
+    @pytest.mark.asyncio
+    async def test_default_stream_wraps_chat(self):
+        config = make_config(loop=LoopConfig(
+            type=LoopType.reactive, max_turns=5, pipeline_tools=True,
+        ))
+        agent = AgentRuntime(
+            agent_config=config,
+            llm=ToolCallingLLM(),
+            tools=[make_tool()],
+            execute_tool=mock_execute_tool,
+        )
+        result = await agent.run("read it")
+        assert result.success
+        assert result.output == "File read successfully."
+        assert result.turns[0].tool_results[0].tool_call_id == "tc1"
+
+    @pytest.mark.asyncio
+    async def test_pipelining_cuts_turn_latency(self):
+        import time
+
+        def turns():
+            return [
+                [
+                    (0, _call("a", "filesystem__read_file", path="/a")),
+                    (0.1, {"type": "text", "text": "Still generating."}),
+                    (0, {"type": "stop", "done": False}),
+                ],
+                [(0, {"type": "stop", "done": True})],
+            ]
+
+        async def timed(pipeline):
+            agent = self._agent(turns(), [], delay=0.1)
+            agent._config.loop.pipeline_tools = pipeline
+            if not pipeline:
+                # Same scripted provider through the buffered chat() path.
+                agent._llm.chat = lambda **kw: _drain(agent._llm.chat_stream(**kw))
+            start = time.monotonic()
+            await agent.run("go")
+            return time.monotonic() - start
+
+        assert await timed(True) < await timed(False) - 0.05
+
+
+async def _drain(stream):
+    text, tool_calls, done = "", [], False
+    async for event in stream:
+        if event["type"] == "text":
+            text += event["text"]
+        elif event["type"] == "tool_call":
+            tool_calls.append({k: event[k] for k in ("id", "name", "arguments")})
+        else:
+            done = event["done"]
+    return {"text": text, "tool_calls": tool_calls, "done": done}
@@ -1,5 +1,7 @@
 """Tests for ContextManager — message tracking, compression, token estimation."""
 
+import json
+
 import pytest
 
 from llmos_bridge.apps.context_manager import ContextManager, Message, estimate_tokens
@@ -205,3 +207,47 @@ class TestCompression:
         # Tokens should only reflect remaining messages
         expected = sum(m.token_estimate for m in mgr.messages)
         assert mgr.total_tokens == expected
+
+
+class TestTokenAccounting:
+    @staticmethod
+    def _request_cost(mgr):
+        return sum(estimate_tokens(json.dumps(m.to_dict())) for m in mgr.messages)
+
+    def test_request_tokens_match_serialised_messages(self, mgr):
+        mgr.add_user_message("hello there")
+        mgr.add_assistant_message("", tool_calls=[{"id": "t1", "function": {"name": "x"}}])
+        mgr.add_tool_result("t1", "x", '{"content": "data"}')
+        assert mgr.request_tokens == self._request_cost(mgr)
+
+    def test_request_tokens_follow_compression(self):
+        for strategy in (ContextStrategy.truncate, ContextStrategy.sliding_window):
+            config = ContextConfig(max_tokens=1000, strategy=strategy, keep_last_n_messages=2)
+            mgr = ContextManager(config)
+            for _ in range(20):
+                mgr.add_user_message("z" * 400)
+            assert mgr.request_tokens == self._request_cost(mgr)
+
+    def test_each_message_counted_once(self):
+        calls = []
+
+        def tokenizer(text):
+            calls.append(text)
+            return len(text)
+
+        mgr = ContextManager(ContextConfig(max_tokens=100_000), tokenizer=tokenizer)
+        mgr.set_system_prompt("system")
+        for i in range(10):
+            mgr.add_user_message(f"message {i}")
+        mgr.needs_compression()
+        # One count for the system prompt, two (content + request) per message.
+        assert len(calls) == 1 + 2 * 10
+        assert mgr.system_tokens == len("system")
+
+    def test_set_tokenizer_recounts(self, mgr):
+        mgr.set_system_prompt("abcd")
+        mgr.add_user_message("hello")
+        mgr.set_tokenizer(len)
+        assert mgr.system_tokens == 4
+        assert mgr.total_tokens == len("hello")
+        assert mgr.request_tokens == len(json.dumps(mgr.messages[0].to_dict()))
@@ -3,7 +3,12 @@
 import os
 import pytest
 
-from llmos_bridge.apps.expression import ExpressionContext, ExpressionEngine
+from llmos_bridge.apps.expression import (
+    ExpressionContext,
+    ExpressionEngine,
+    _compile_template,
+    compile_template,
+)
 
 
 @pytest.fixture
@@ -271,3 +276,54 @@ class TestIndexAccess:
 
     def test_list_index_last(self, engine, ctx):
         assert engine.resolve("{{result.step1.lines[2]}}", ctx) == "c"
+
+
+class TestCompiledCache:
+    def test_template_compiled_once(self, engine, ctx):
+        text = "{{result.step1.content | upper}} / {{loop.iteration}}"
+        first = compile_template(text)
+        assert compile_template(text) is first
+        assert engine.resolve(text, ctx) == "HELLO WORLD / 3"
+
+    def test_compiled_expression_reads_current_context(self, engine):
+        text = "{{result.s.value ?? 'none'}}"
+        assert engine.resolve(text, ExpressionContext(results={"s": {"value": 1}})) == 1
+        assert engine.resolve(text, ExpressionContext(results={})) == "none"
+
+    def test_malformed_branch_only_fails_when_reached(self, engine, ctx):
+        assert engine.resolve("{{trigger.input ?? broken[}}", ctx) == "fix the bug"
+        with pytest.raises(ValueError):
+            engine.resolve("{{trigger.missing ?? broken[}}", ctx)
+
+    def test_compiler_warms_cache(self):
+        from llmos_bridge.apps.compiler import AppCompiler
+
+        text = "{{trigger.input | lower}} (warm-cache test)"
+        AppCompiler().compile_string(
+            "app:\n  name: warm\nagent:\n  system_prompt: \"" + text + "\"\n"
+        )
+        before = _compile_template.cache_info().misses
+        compile_template(text)
+        assert _compile_template.cache_info().misses == before
+
+
+class TestChildScope:
+    def test_reads_fall_through_and_writes_stay_local(self, engine, ctx):
+        scope = ctx.child()
+        scope.variables["item"] = "x"
+        scope.variables["workspace"] = "/child"
+        assert engine.resolve("{{trigger.input}} {{item}}", scope) == "fix the bug x"
+        assert "item" not in ctx.variables
+        assert engine.resolve("{{workspace}}", ctx) == "/home/test/project"
+
+    def test_shared_namespaces_write_through(self, ctx):
+        scope = ctx.child(shared=("results",))
+        scope.results["new"] = {"ok": True}
+        assert ctx.results["new"] == {"ok": True}
+
+    def test_child_does_not_copy_parent(self):
+        big = {f"k{i}": i for i in range(10_000)}
+        parent = ExpressionContext(variables=big)
+        scope = parent.child()
+        assert scope.variables.maps[-1] is big
+        assert scope.variables["k42"] == 42
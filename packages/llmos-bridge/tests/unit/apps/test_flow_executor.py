@@ -212,6 +212,17 @@ class TestParallelStep:
         await executor.execute(steps)
         assert max_concurrent <= 2
 
+    @pytest.mark.asyncio
+    async def test_branch_variable_writes_stay_local(self, executor, ctx):
+        steps = [FlowStep(id="par", parallel=ParallelConfig(steps=[
+            FlowStep(id="p1", pipe=[FlowStep(id="a", action="m.a", params={"v": 1})]),
+            FlowStep(id="p2", pipe=[FlowStep(id="b", action="m.b", params={"v": 2})]),
+        ]))]
+        result = await executor.execute(steps)
+        assert result.success
+        assert "pipe" not in ctx.variables
+        assert {"a", "b"} <= set(ctx.results)
+
 
 class TestBranchStep:
     @pytest.mark.asyncio
@@ -321,6 +332,168 @@ class TestMapStep:
         result = await executor.execute(steps)
         assert not result.results["mp"].success
 
+    @pytest.mark.asyncio
+    async def test_concurrent_items_do_not_share_variables(self, ctx):
+        async def echo_after_delay(mod, act, params):
+            if act == "wait":
+                await asyncio.sleep(0.01 * params["n"])
+            return {"n": params["n"]}
+
+        ctx.variables["numbers"] = list(range(5))
+        executor = FlowExecutor(expr_context=ctx, execute_action=echo_after_delay)
+        steps = [FlowStep(id="mp", map=MapConfig(
+            over="{{numbers}}",
+            as_var="n",
+            max_concurrent=5,
+            step=[
+                FlowStep(action="m.wait", params={"n": "{{n}}"}),
+                FlowStep(action="m.echo", params={"n": "{{n}}"}),
+            ],
+        ))]
+        result = await executor.execute(steps)
+        assert [o["n"] for o in result.results["mp"].output] == list(range(5))
+        assert "n" not in ctx.variables
+        assert ctx.loop == {}
+
+
+class TestMapStream:
+    @staticmethod
+    async def _double_or_fail(module_id, action_name, params):
+        if action_name == "add":
+            return {"total": params["acc"]["total"] + params["value"]}
+        n = params["n"]
+        if n == 3:
+            return {"error": "bad item"}
+        return {"value": n * 2}
+
+    @pytest.mark.asyncio
+    async def test_stream_reduce_incrementally(self, ctx):
+        ctx.variables["numbers"] = list(range(10))
+        executor = FlowExecutor(expr_context=ctx, execute_action=self._double_or_fail)
+        steps = [FlowStep(id="mp", map=MapConfig(
+            over="{{numbers}}",
+            as_var="n",
+            max_concurrent=3,
+            stream=True,
+            step=[FlowStep(id="dbl", action="m.double", params={"n": "{{n}}"})],
+            initial={"total": 0},
+            reduce=FlowStep(action="m.add", params={
+                "acc": "{{acc}}", "value": "{{reduce.item.value}}",
+            }),
+        ))]
+        result = await executor.execute(steps)
+        mp = result.results["mp"]
+        assert not mp.success  # item 3 failed
+        assert mp.output == {"total": sum(n * 2 for n in range(10) if n != 3)}
+        # Only the failed item is retained.
+        assert [c.step_id for c in mp.children] == ["mp[3]"]
+
+    @classmethod
+    def _with_files(cls, files: dict[str, str], denied: str = ""):
+        """_double_or_fail plus a fake filesystem module backed by *files*."""
+
+        async def execute(module_id, action_name, params):
+            if module_id != "filesystem":
+                return await cls._double_or_fail(module_id, action_name, params)
+            if params["path"] == denied:
+                return {"error": "Path outside sandbox"}
+            if action_name == "write_file":
+                files[params["path"]] = params["content"]
+            else:
+                assert action_name == "append_file" and params["newline"] is False
+                files[params["path"]] += params["content"]
+            return {"path": params["path"]}
+
+        return execute
+
+    @pytest.mark.asyncio
+    async def test_stream_spills_outputs(self, ctx):
+        import json
+
+        files = {"/data/map.ndjson": "stale"}
+        ctx.variables["numbers"] = [1, 2]
+        ctx.variables["out"] = "/data/map.ndjson"
+        executor = FlowExecutor(expr_context=ctx, execute_action=self._with_files(files))
+        steps = [FlowStep(id="mp", map=MapConfig(
+            over="{{numbers}}",
+            as_var="n",
+            stream=True,
+            spill_to="{{out}}",
+            step=[FlowStep(action="m.double", params={"n": "{{n}}"})],
+        ))]
+        result = await executor.execute(steps)
+        mp = result.results["mp"]
+        assert mp.success
+        assert mp.output == {
+            "count": 2, "succeeded": 2, "failed": 0, "spill_path": "/data/map.ndjson",
+        }
+        assert mp.children == []
+        lines = files["/data/map.ndjson"].splitlines()
+        assert sorted(json.loads(line)["output"]["value"] for line in lines) == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_stream_spill_in_chunks(self, ctx, monkeypatch):
+        import json
+
+        import llmos_bridge.apps.flow_executor as flow_executor
+
+        monkeypatch.setattr(flow_executor, "_SPILL_CHUNK_BYTES", 1)
+        files: dict[str, str] = {}
+        ctx.variables["numbers"] = [n for n in range(20) if n != 3]
+        executor = FlowExecutor(expr_context=ctx, execute_action=self._with_files(files))
+        steps = [FlowStep(id="mp", map=MapConfig(
+            over="{{numbers}}", as_var="n", stream=True, max_concurrent=4,
+            spill_to="/data/out.ndjson",
+            step=[FlowStep(action="m.double", params={"n": "{{n}}"})],
+        ))]
+        result = await executor.execute(steps)
+        assert result.results["mp"].success
+        lines = files["/data/out.ndjson"].splitlines()
+        assert sorted(json.loads(line)["output"]["value"] for line in lines) == [
+            n * 2 for n in range(20) if n != 3
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_spill_goes_through_filesystem_checks(self, ctx):
+        files: dict[str, str] = {}
+        ctx.variables["numbers"] = [1, 2]
+        executor = FlowExecutor(
+            expr_context=ctx, execute_action=self._with_files(files, denied="/etc/cron.d/x"),
+        )
+        steps = [FlowStep(id="mp", map=MapConfig(
+            over="{{numbers}}",
+            stream=True,
+            spill_to="/etc/cron.d/x",
+            step=[FlowStep(action="m.double", params={"n": "{{item}}"})],
+        ))]
+        result = await executor.execute(steps)
+        mp = result.results["mp"]
+        assert not mp.success
+        assert "outside sandbox" in mp.error
+        assert files == {}
+
+    @pytest.mark.asyncio
+    async def test_stream_accepts_iterables(self, ctx):
+        ctx.variables["numbers"] = range(5)
+        executor = FlowExecutor(expr_context=ctx, execute_action=mock_action)
+        steps = [FlowStep(id="mp", map=MapConfig(
+            over="{{numbers}}", stream=True,
+            step=[FlowStep(action="m.a", params={})],
+        ))]
+        result = await executor.execute(steps)
+        assert result.results["mp"].output["count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_rejects_string(self, ctx):
+        ctx.variables["not_list"] = "string"
+        executor = FlowExecutor(expr_context=ctx, execute_action=mock_action)
+        steps = [FlowStep(id="mp", map=MapConfig(
+            over="{{not_list}}", stream=True,
+            step=[FlowStep(action="m.a", params={})],
+        ))]
+        result = await executor.execute(steps)
+        assert not result.results["mp"].success
+
 
 class TestReduceStep:
     @pytest.mark.asyncio
@@ -0,0 +1,89 @@
+"""Benchmark — FlowExecutor map over 10k and 100k items, buffered vs streaming.
+
+Reports throughput and peak RSS growth (sampled while the map runs).  The
+buffered map keeps one task and one StepResult per item; the streaming map
+keeps a fixed worker pool and folds outputs into a reduce, so its peak
+should not grow with the collection.  Run with ``pytest -m slow -s`` to see
+the numbers; RSS and throughput are reported, not asserted, since both
+depend on the machine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import psutil
+import pytest
+
+from llmos_bridge.apps.expression import ExpressionContext
+from llmos_bridge.apps.flow_executor import FlowExecutor
+from llmos_bridge.apps.models import FlowStep, MapConfig
+
+_N_ITEMS = (10_000, 100_000)
+
+
+async def _action(module_id, action_name, params):
+    if action_name == "add":
+        return {"total": params["acc"]["total"] + 1}
+    return {"row": params["row"], "payload": "x" * 64}
+
+
+def _map_step(stream: bool) -> FlowStep:
+    extra = {}
+    if stream:
+        extra = {
+            "stream": True,
+            "initial": {"total": 0},
+            "reduce": FlowStep(action="m.add", params={"acc": "{{acc}}"}),
+        }
+    return FlowStep(id="mp", map=MapConfig(
+        over="{{rows}}",
+        as_var="row",
+        max_concurrent=8,
+        step=[FlowStep(id="fetch", action="m.fetch", params={"row": "{{row}}"})],
+        **extra,
+    ))
+
+
+async def _run(n: int, stream: bool) -> tuple[float, int]:
+    """Return (elapsed seconds, peak RSS growth in bytes) for one map run."""
+    ctx = ExpressionContext(variables={"rows": list(range(n))})
+    executor = FlowExecutor(expr_context=ctx, execute_action=_action)
+    proc = psutil.Process()
+    baseline = peak = proc.memory_info().rss
+    done = asyncio.Event()
+
+    async def sample() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, proc.memory_info().rss)
+            await asyncio.sleep(0.005)
+
+    sampler = asyncio.create_task(sample())
+    t0 = time.perf_counter()
+    result = await executor.execute([_map_step(stream)])
+    elapsed = time.perf_counter() - t0
+    peak = max(peak, proc.memory_info().rss)
+    done.set()
+    await sampler
+
+    assert result.success
+    if stream:
+        assert result.results["mp"].output == {"total": n}
+    else:
+        assert len(result.results["mp"].output) == n
+    return elapsed, peak - baseline
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.parametrize("n", _N_ITEMS)
+async def test_map_stream_memory_and_throughput(n: int) -> None:
+    # Streaming first, so it cannot reuse memory freed by the buffered run.
+    for mode, stream in (("stream", True), ("buffered", False)):
+        elapsed, growth = await _run(n, stream)
+        print(
+            f"\n{mode:<9} n={n:>7}  {n / elapsed:>9.0f} items/s  "
+            f"peak RSS growth={growth / 2**20:>7.1f} MiB"
+        )
@@ -0,0 +1,103 @@
+"""Unit tests — AnthropicProvider retry and streaming behaviour (no network)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+
+from llmos_bridge.apps.providers import AnthropicProvider
+
+
+def _rate_limit_error() -> anthropic.RateLimitError:
+    response = httpx.Response(
+        429,
+        headers={"retry-after": "0"},
+        request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"),
+    )
+    return anthropic.RateLimitError("rate limited", response=response, body=None)
+
+
+def _text(text: str) -> SimpleNamespace:
+    return SimpleNamespace(type="text", text=text)
+
+
+def _message(*blocks: SimpleNamespace) -> SimpleNamespace:
+    return SimpleNamespace(content=list(blocks), stop_reason="end_turn")
+
+
+class _FakeStream:
+    def __init__(self, final: SimpleNamespace, fail: Exception | None = None) -> None:
+        self._final = final
+        self._fail = fail
+
+    async def __aenter__(self) -> _FakeStream:
+        if self._fail is not None:
+            raise self._fail
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def __aiter__(self):
+        for block in self._final.content:
+            # The SDK emits one text event per delta; split to mimic that.
+            for part in (block.text[:2], block.text[2:]):
+                yield SimpleNamespace(type="text", text=part)
+
+    async def get_final_message(self) -> SimpleNamespace:
+        return self._final
+
+
+class _FakeMessages:
+    def __init__(self, final: SimpleNamespace, failures: int = 0) -> None:
+        self._final = final
+        self._failures = failures
+        self.stream_calls = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        return self._final
+
+    def stream(self, **kwargs: object) -> _FakeStream:
+        self.stream_calls += 1
+        fail = _rate_limit_error() if self.stream_calls <= self._failures else None
+        return _FakeStream(self._final, fail)
+
+
+def _provider(messages: _FakeMessages) -> AnthropicProvider:
+    provider = AnthropicProvider(api_key="test")
+    provider._client = SimpleNamespace(messages=messages)
+    return provider
+
+
+async def _stream_text(provider: AnthropicProvider) -> str:
+    parts = []
+    async for event in provider.chat_stream(system="", messages=[], tools=[]):
+        if event["type"] == "text":
+            parts.append(event["text"])
+    return "".join(parts)
+
+
+@pytest.mark.unit
+class TestAnthropicStreaming:
+    @pytest.mark.asyncio
+    async def test_stream_retries_rate_limit(self) -> None:
+        messages = _FakeMessages(_message(_text("hello")), failures=2)
+        assert await _stream_text(_provider(messages)) == "hello"
+        assert messages.stream_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_gives_up_after_last_attempt(self) -> None:
+        messages = _FakeMessages(_message(_text("hello")), failures=10)
+        with pytest.raises(anthropic.RateLimitError):
+            await _stream_text(_provider(messages))
+        assert messages.stream_calls == 4
+
+    @pytest.mark.asyncio
+    async def test_chat_and_stream_return_same_text(self) -> None:
+        final = _message(_text("First part. "), _text("Second part."))
+        provider = _provider(_FakeMessages(final))
+        chat = await provider.chat(system="", messages=[], tools=[])
+        assert chat["text"] == await _stream_text(provider) == "First part. Second part."
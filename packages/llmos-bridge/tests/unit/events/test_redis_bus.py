@@ -216,3 +216,185 @@ class TestRedisStreamsBusStreamKeys:
 
         stream_key = bus._redis.xadd.call_args[0][0]
         assert stream_key == "llmos:custom.topic"
+
+
+# ---------------------------------------------------------------------------
+# Batched publishing (fakeredis)
+# ---------------------------------------------------------------------------
+
+
+def _fake_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+@pytest.mark.unit
+class TestRedisStreamsBusBatching:
+    @pytest.mark.asyncio
+    async def test_batch_flush_publishes_in_order(self) -> None:
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        bus = RedisStreamsBus("redis://x", "n", batch=True, flush_interval=10.0)
+        bus._redis = _fake_redis()
+        for i in range(10):
+            await bus.emit("llmos.actions", {"n": i})
+        await bus.emit("llmos.plans", {"n": "p"})
+
+        assert await bus._redis.xlen("llmos:llmos.actions") == 0
+        await bus.flush()
+
+        entries = await bus._redis.xrange("llmos:llmos.actions")
+        assert [json.loads(f["data"])["n"] for _, f in entries] == list(range(10))
+        assert await bus._redis.xlen("llmos:llmos.plans") == 1
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_one_pipeline_per_flush(self) -> None:
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        bus = RedisStreamsBus("redis://x", "n", batch=True, flush_interval=10.0)
+        bus._redis = _fake_redis()
+        with patch.object(bus._redis, "pipeline", wraps=bus._redis.pipeline) as pipeline, \
+                patch.object(bus._redis, "xadd", wraps=bus._redis.xadd) as xadd:
+            for i in range(20):
+                await bus.emit("llmos.actions", {"n": i})
+            await bus.flush()
+
+        assert pipeline.call_count == 1
+        xadd.assert_not_called()
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_size_trigger_and_status(self) -> None:
+        import asyncio
+
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        bus = RedisStreamsBus("redis://x", "n", batch=True, flush_interval=10.0, batch_max_events=4)
+        bus._redis = _fake_redis()
+        for i in range(4):
+            await bus.emit("llmos.actions", {"n": i})
+        for _ in range(20):
+            await asyncio.sleep(0.005)
+            if bus.status()["published"] == 4:
+                break
+
+        status = bus.status()
+        assert status["mode"] == "batch"
+        assert status["published"] == 4
+        assert status["flushes"] == 1
+        assert status["batch_size_histogram"] == {"4": 1}
+        assert status["flush_latency_ms"]["max"] > 0
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_tail(self) -> None:
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        redis = _fake_redis()
+        bus = RedisStreamsBus("redis://x", "n", batch=True, flush_interval=10.0)
+        bus._redis = redis
+        await bus.emit("llmos.actions", {"n": 1})
+        await bus.close()
+
+        assert await redis.xlen("llmos:llmos.actions") == 1
+        assert bus.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_in_flight_flush(self) -> None:
+        import asyncio
+
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        redis = _fake_redis()
+        started, release = asyncio.Event(), asyncio.Event()
+        real_pipeline = redis.pipeline
+
+        def slow_pipeline(*args, **kwargs):
+            pipe = real_pipeline(*args, **kwargs)
+            real_execute = pipe.execute
+
+            async def execute():
+                started.set()
+                await release.wait()
+                return await real_execute()
+
+            pipe.execute = execute
+            return pipe
+
+        bus = RedisStreamsBus("redis://x", "n", batch=True, flush_interval=10.0, batch_max_events=2)
+        bus._redis = redis
+        with patch.object(redis, "pipeline", side_effect=slow_pipeline):
+            await bus.emit("llmos.actions", {"n": 0})
+            await bus.emit("llmos.actions", {"n": 1})
+            await asyncio.wait_for(started.wait(), timeout=1)
+            await bus.emit("llmos.actions", {"n": 2})
+            closing = asyncio.ensure_future(bus.close())
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.wait_for(closing, timeout=1)
+
+        entries = await redis.xrange("llmos:llmos.actions")
+        assert [json.loads(f["data"])["n"] for _, f in entries] == [0, 1, 2]
+        assert bus.status()["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_counts_and_never_raises(self) -> None:
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        bus = RedisStreamsBus("redis://x", "n", batch=True, flush_interval=10.0)
+        bus._redis = _fake_redis()
+        await bus.emit("llmos.actions", {"n": 1})
+        with patch.object(bus._redis, "pipeline", side_effect=ConnectionError("down")):
+            await bus.flush()
+
+        status = bus.status()
+        assert status["failed"] == 1
+        assert status["pending"] == 0
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_listeners_dispatched_immediately(self) -> None:
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        bus = RedisStreamsBus("redis://x", "n", batch=True, flush_interval=10.0)
+        bus._redis = _fake_redis()
+        cb = AsyncMock()
+        bus.register_listener("llmos.actions", cb)
+        await bus.emit("llmos.actions", {"n": 1})
+        cb.assert_awaited_once()
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_per_event_mode_status(self) -> None:
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        bus = RedisStreamsBus("redis://x", "n")
+        bus._redis = _fake_redis()
+        await bus.emit("llmos.actions", {"n": 1})
+
+        status = bus.status()
+        assert status["mode"] == "per_event"
+        assert status["published"] == 1
+        assert await bus._redis.xlen("llmos:llmos.actions") == 1
+
+
+@pytest.mark.unit
+class TestRedisStreamsBusSharedEvents:
+    @pytest.mark.asyncio
+    async def test_forwarded_event_gets_source_node_spliced(self) -> None:
+        from llmos_bridge.events.bus import FanoutEventBus, NullEventBus
+        from llmos_bridge.events.redis_bus import RedisStreamsBus
+
+        redis_bus = RedisStreamsBus("redis://x", "node-9")
+        redis_bus._redis = _make_mock_redis()
+        local = NullEventBus()
+        bus = FanoutEventBus([local, redis_bus])
+
+        await bus.emit("llmos.actions", {"event": "e", "n": 1})
+
+        payload = json.loads(redis_bus._redis.xadd.call_args[0][1]["data"])
+        assert payload["_source_node"] == "node-9"
+        assert payload["n"] == 1
+        # The shared record seen by the local bus is not tagged.
+        assert "_source_node" not in bus._recent_events[-1]
@@ -135,3 +135,66 @@ class TestEventRouter:
 
         assert received[0]["_topic"] == "llmos.plans"
         assert "_timestamp" in received[0]
+
+
+@pytest.mark.unit
+class TestRouteIndex:
+    _PATTERNS = [
+        "#", "llmos.#", "llmos.plans", "llmos.plans.#", "llmos.*", "llmos.*.changed",
+        "*.plans", "*", "*.*", "llmos.iot.#", "llmos.iot.*.temp", "llmos.file*",
+        "llmos.#.temp", "#.temp", "llmos.*.#", "a..b", "llmos.",
+    ]
+    _TOPICS = [
+        "", "llmos", "llmos.", "llmos.plans", "llmos.plans.x", "llmos.plans..",
+        "llmos.filesystem", "llmos.filesystem.changed", "llmos.iot", "llmos.iot.a.temp",
+        "llmos.iot.a.b.temp", "llmos.iot.", "other.plans", "a..b", "a.b", "x.temp",
+    ]
+
+    def _handlers(self, router: EventRouter) -> dict[str, list]:
+        calls: dict[str, list] = {}
+        for pattern in self._PATTERNS:
+            def handler(topic: str, event: dict, _p: str = pattern) -> None:
+                calls.setdefault(topic, []).append(_p)
+
+            router.add_route(pattern, handler)
+        return calls
+
+    async def test_index_agrees_with_topic_matches(self) -> None:
+        router = EventRouter()
+        calls = self._handlers(router)
+        for topic in self._TOPICS:
+            await router.emit(topic, {})
+        for topic in self._TOPICS:
+            expected = [p for p in self._PATTERNS if topic_matches(p, topic)]
+            assert calls.get(topic, []) == expected, topic
+
+    async def test_cache_invalidated_on_route_changes(self) -> None:
+        router = EventRouter()
+        h1 = AsyncMock()
+        h2 = AsyncMock()
+        router.add_route("llmos.*", h1)
+        await router.emit("llmos.plans", {})
+        router.add_route("llmos.plans", h2)
+        await router.emit("llmos.plans", {})
+        router.remove_route("llmos.*", h1)
+        await router.emit("llmos.plans", {})
+        assert h1.call_count == 2
+        assert h2.call_count == 2
+
+    async def test_duplicate_route_called_twice_and_removed_once(self) -> None:
+        router = EventRouter()
+        handler = AsyncMock()
+        router.add_route("llmos.#", handler)
+        router.add_route("llmos.#", handler)
+        await router.emit("llmos.plans", {})
+        assert handler.call_count == 2
+        router.remove_route("llmos.#", handler)
+        await router.emit("llmos.plans", {})
+        assert handler.call_count == 3
+
+    async def test_removed_branch_is_pruned(self) -> None:
+        router = EventRouter()
+        handler = AsyncMock()
+        router.add_route("llmos.deep.*.x", handler)
+        router.remove_route("llmos.deep.*.x", handler)
+        assert router._index._root.is_empty()
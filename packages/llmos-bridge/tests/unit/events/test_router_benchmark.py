@@ -0,0 +1,91 @@
+"""Benchmark — EventRouter route matching with 1k routes.
+
+Compares the trie-indexed :meth:`EventRouter.emit` with the previous
+linear scan that built and ran a fresh regex for every route on every
+event.  Run with ``pytest -m slow -s`` to see the timings; only the matched
+routes are asserted, never the speed-up.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+
+import pytest
+
+from llmos_bridge.events.router import EventRouter
+
+_N_ROUTES = 1000
+# Every topic is distinct, so the router's per-topic cache never hits.
+_N_EVENTS = 200
+
+
+def _legacy_topic_matches(pattern: str, topic: str) -> bool:
+    """Reference implementation: the pre-index regex-per-call matcher."""
+    if "#" not in pattern and "*" not in pattern:
+        return pattern == topic
+    if pattern.endswith(".#"):
+        prefix = re.escape(pattern[:-2])
+        return bool(re.fullmatch(prefix + r"(\..+)?", topic))
+    regex_parts: list[str] = []
+    for segment in re.split(r"(\*|#)", pattern):
+        if segment == "#":
+            regex_parts.append(".*")
+        elif segment == "*":
+            regex_parts.append(r"[^.]+")
+        else:
+            regex_parts.append(re.escape(segment))
+    return bool(re.fullmatch("".join(regex_parts), topic))
+
+
+def _patterns() -> list[str]:
+    patterns: list[str] = []
+    for i in range(_N_ROUTES):
+        kind = i % 4
+        if kind == 0:
+            patterns.append(f"llmos.module{i}.events")
+        elif kind == 1:
+            patterns.append(f"llmos.module{i}.*")
+        elif kind == 2:
+            patterns.append(f"llmos.iot.sensor{i}.#")
+        else:
+            patterns.append(f"llmos.triggers.t{i}.*.fired")
+    return patterns
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_route_matching_with_1k_routes() -> None:
+    patterns = _patterns()
+    topics = [
+        f"llmos.module{i}.events" if i % 2 else f"llmos.iot.sensor{i}.temp"
+        for i in range(_N_EVENTS)
+    ]
+
+    hits = 0
+
+    def handler(topic: str, event: dict) -> None:
+        nonlocal hits
+        hits += 1
+
+    t0 = time.perf_counter()
+    legacy_hits = 0
+    for topic in topics:
+        for pattern in patterns:
+            if _legacy_topic_matches(pattern, topic):
+                legacy_hits += 1
+    legacy_ms = (time.perf_counter() - t0) * 1000
+
+    router = EventRouter()
+    for pattern in patterns:
+        router.add_route(pattern, handler)
+    t0 = time.perf_counter()
+    for topic in topics:
+        await router.emit(topic, {})
+    indexed_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"\nroutes={_N_ROUTES} events={_N_EVENTS}")
+    print(f"legacy linear scan: {legacy_ms:>9.2f} ms")
+    print(f"trie index:         {indexed_ms:>9.2f} ms  ({legacy_ms / indexed_ms:.0f}x)")
+
+    assert hits == legacy_hits
@@ -14,6 +14,7 @@ from llmos_bridge.events.bus import (
     TOPIC_PLANS,
     TOPIC_SECURITY,
     FanoutEventBus,
+    FrozenEvent,
     LogEventBus,
     NullEventBus,
 )
@@ -131,3 +132,424 @@ class TestFanoutEventBus:
         # Should not raise despite backend failure (return_exceptions=True)
         await bus.emit(TOPIC_PLANS, {"event": "test"})
         good_backend.emit.assert_called_once()
+
+    async def test_close_listeners_reaches_nested_backends(self) -> None:
+        local_bus = NullEventBus()
+        cb = AsyncMock()
+        local_bus.register_listener(TOPIC_PLANS, cb, queue_size=10)
+        bus = FanoutEventBus([local_bus, NullEventBus()])
+        await bus.emit(TOPIC_PLANS, {"event": "test"})
+        await local_bus.drain_listeners()
+        queue = local_bus._listener_queues[(TOPIC_PLANS, cb)]
+        assert queue._task is not None
+
+        bus.close_listeners()
+        assert queue._task is None
+
+
+@pytest.mark.unit
+class TestFrozenEvent:
+    def test_reads_like_a_dict(self) -> None:
+        event = FrozenEvent({"event": "x", "n": 1})
+        assert event["event"] == "x"
+        assert event.get("n") == 1
+        assert json.loads(json.dumps(event)) == {"event": "x", "n": 1}
+        assert {**event, "extra": True}["extra"] is True
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda e: e.__setitem__("k", 1),
+            lambda e: e.__delitem__("event"),
+            lambda e: e.update(k=1),
+            lambda e: e.setdefault("k", 1),
+            lambda e: e.pop("event"),
+            lambda e: e.popitem(),
+            lambda e: e.clear(),
+        ],
+    )
+    def test_rejects_mutation(self, mutate) -> None:
+        event = FrozenEvent({"event": "x"})
+        with pytest.raises(TypeError):
+            mutate(event)
+        assert event == {"event": "x"}
+
+    def test_copies_are_plain_mutable_dicts(self) -> None:
+        import copy
+        import pickle
+
+        event = FrozenEvent({"event": "x", "nested": {"a": 1}})
+        for clone in (dict(event), event.copy(), copy.copy(event),
+                      copy.deepcopy(event), pickle.loads(pickle.dumps(event))):
+            assert type(clone) is dict
+            assert clone == event
+            clone["k"] = 1
+
+    def test_json_cached(self) -> None:
+        event = FrozenEvent({"event": "x", "obj": object()})
+        first = event.json()
+        assert event.json() is first
+        assert json.loads(first)["event"] == "x"
+
+
+@pytest.mark.unit
+class TestSharedEventRecord:
+    async def test_fanout_shares_one_record(self) -> None:
+        received: list[dict] = []
+        inner1, inner2 = NullEventBus(), NullEventBus()
+
+        async def cb(topic: str, event: dict[str, Any]) -> None:
+            received.append(event)
+
+        inner1.register_listener(TOPIC_PLANS, cb)
+        inner2.register_listener(TOPIC_PLANS, cb)
+        bus = FanoutEventBus([inner1, inner2])
+        bus.register_listener(TOPIC_PLANS, cb)
+
+        event = {"event": "plan_started", "result": {"rows": list(range(1000))}}
+        await bus.emit(TOPIC_PLANS, event)
+
+        assert len(received) == 3
+        assert received[0] is received[1] is received[2]
+        assert isinstance(received[0], FrozenEvent)
+        assert bus._recent_events[-1] is received[0]
+        assert inner1._recent_events[-1] is received[0]
+        assert received[0]["result"] is event["result"]
+        # The caller's dict is still stamped in place.
+        assert event["_topic"] == TOPIC_PLANS
+
+    async def test_fanout_serialises_once(self, tmp_path: Path) -> None:
+        from unittest.mock import patch
+
+        bus = FanoutEventBus([LogEventBus(tmp_path / "a.ndjson"), LogEventBus(tmp_path / "b.ndjson")])
+        with patch("llmos_bridge.events.bus.json.dumps", wraps=json.dumps) as dumps:
+            await bus.emit(TOPIC_ACTIONS, {"event": "x"})
+        assert dumps.call_count == 1
+        assert (tmp_path / "a.ndjson").read_text() == (tmp_path / "b.ndjson").read_text()
+
+    async def test_listener_mutation_does_not_leak(self) -> None:
+        seen: list[dict] = []
+
+        async def mutating(topic: str, event: dict[str, Any]) -> None:
+            event["hacked"] = True
+
+        async def reader(topic: str, event: dict[str, Any]) -> None:
+            seen.append(event)
+
+        bus = NullEventBus()
+        bus.register_listener(TOPIC_PLANS, mutating)
+        bus.register_listener(TOPIC_PLANS, reader)
+        await bus.emit(TOPIC_PLANS, {"event": "x"})
+        assert "hacked" not in seen[0]
+
+
+@pytest.mark.unit
+class TestQueuedListenerDispatch:
+    async def test_slow_listener_does_not_block_emit(self) -> None:
+        import asyncio
+        import time
+
+        bus = NullEventBus()
+        bus.configure_listener_dispatch("queued")
+        received: list[str] = []
+
+        async def slow(topic: str, event: dict[str, Any]) -> None:
+            await asyncio.sleep(0.05)
+            received.append(event["event"])
+
+        for _ in range(20):
+            # Distinct callables so each gets its own worker.
+            async def cb(t: str, e: dict[str, Any], _slow=slow) -> None:
+                await _slow(t, e)
+
+            bus.register_listener(TOPIC_ACTIONS, cb)
+
+        start = time.perf_counter()
+        await bus.emit(TOPIC_ACTIONS, {"event": "e1"})
+        assert time.perf_counter() - start < 0.02
+
+        await bus.drain_listeners()
+        assert received == ["e1"] * 20
+        bus.close_listeners()
+
+    async def test_events_delivered_in_order(self) -> None:
+        bus = NullEventBus()
+        seen: list[int] = []
+
+        async def cb(topic: str, event: dict[str, Any]) -> None:
+            seen.append(event["n"])
+
+        bus.register_listener(TOPIC_PLANS, cb, queue_size=100)
+        for i in range(50):
+            await bus.emit(TOPIC_PLANS, {"n": i})
+        await bus.drain_listeners()
+        assert seen == list(range(50))
+
+    async def test_drop_oldest_overflow(self) -> None:
+        import asyncio
+
+        bus = NullEventBus()
+        gate = asyncio.Event()
+        seen: list[int] = []
+
+        async def cb(topic: str, event: dict[str, Any]) -> None:
+            await gate.wait()
+            seen.append(event["n"])
+
+        bus.register_listener(TOPIC_PLANS, cb, queue_size=3, overflow="drop_oldest")
+        await bus.emit(TOPIC_PLANS, {"n": 0})
+        await asyncio.sleep(0)  # worker picks up n=0 and waits on the gate
+        for i in range(1, 8):
+            await bus.emit(TOPIC_PLANS, {"n": i})
+
+        stats = bus.listener_stats()[0]
+        assert stats["depth"] == 3
+        assert stats["dropped"] == 4
+        assert stats["lag_seconds"] >= 0.0
+
+        gate.set()
+        await bus.drain_listeners()
+        assert seen == [0, 5, 6, 7]
+
+    async def test_block_overflow_is_lossless(self) -> None:
+        import asyncio
+
+        bus = NullEventBus()
+        seen: list[int] = []
+
+        async def cb(topic: str, event: dict[str, Any]) -> None:
+            await asyncio.sleep(0.001)
+            seen.append(event["n"])
+
+        bus.register_listener(TOPIC_PLANS, cb, queue_size=2, overflow="block")
+        for i in range(20):
+            await bus.emit(TOPIC_PLANS, {"n": i})
+        await bus.drain_listeners()
+
+        assert seen == list(range(20))
+        stats = bus.listener_stats()[0]
+        assert stats["dropped"] == 0
+        assert stats["max_depth"] <= 2
+
+    async def test_coalesce_keeps_latest_per_key(self) -> None:
+        import asyncio
+
+        bus = NullEventBus()
+        gate = asyncio.Event()
+        seen: list[tuple[str, int]] = []
+
+        async def cb(topic: str, event: dict[str, Any]) -> None:
+            await gate.wait()
+            seen.append((event["action_id"], event["pct"]))
+
+        bus.register_listener(TOPIC_ACTIONS, cb, overflow="coalesce")
+        await bus.emit(TOPIC_ACTIONS, {"event": "progress", "action_id": "warmup", "pct": 0})
+        await asyncio.sleep(0)
+        for pct in range(1, 11):
+            await bus.emit(TOPIC_ACTIONS, {"event": "progress", "action_id": "a1", "pct": pct})
+            await bus.emit(TOPIC_ACTIONS, {"event": "progress", "action_id": "a2", "pct": pct})
+
+        assert bus.listener_stats()[0]["coalesced"] == 18
+        gate.set()
+        await bus.drain_listeners()
+        assert seen == [("warmup", 0), ("a1", 10), ("a2", 10)]
+
+    async def test_listener_error_does_not_stop_worker(self) -> None:
+        bus = NullEventBus()
+        seen: list[int] = []
+
+        async def cb(topic: str, event: dict[str, Any]) -> None:
+            if event["n"] == 1:
+                raise RuntimeError("boom")
+            seen.append(event["n"])
+
+        bus.register_listener(TOPIC_PLANS, cb, queue_size=10)
+        for i in range(3):
+            await bus.emit(TOPIC_PLANS, {"n": i})
+        await bus.drain_listeners()
+        assert seen == [0, 2]
+        assert bus.listener_stats()[0]["delivered"] == 3
+
+    async def test_unregister_stops_worker(self) -> None:
+        bus = NullEventBus()
+        cb = AsyncMock()
+        bus.register_listener(TOPIC_PLANS, cb, queue_size=10)
+        await bus.emit(TOPIC_PLANS, {"n": 0})
+        await bus.drain_listeners()
+        bus.unregister_listener(TOPIC_PLANS, cb)
+
+        assert bus.listener_stats() == []
+        await bus.emit(TOPIC_PLANS, {"n": 1})
+        assert cb.await_count == 1
+
+    async def test_put_after_close_does_not_restart_worker(self) -> None:
+        import asyncio
+
+        bus = NullEventBus()
+        gate = asyncio.Event()
+        seen: list[int] = []
+
+        async def cb(topic: str, event: dict[str, Any]) -> None:
+            await gate.wait()
+            seen.append(event["n"])
+
+        bus.register_listener(TOPIC_PLANS, cb, queue_size=1, overflow="block")
+        queue = bus._listener_queues[(TOPIC_PLANS, cb)]
+        await bus.emit(TOPIC_PLANS, {"n": 0})
+        await asyncio.sleep(0)  # worker takes n=0 and waits on the gate
+        await bus.emit(TOPIC_PLANS, {"n": 1})
+        blocked = asyncio.ensure_future(bus.emit(TOPIC_PLANS, {"n": 2}))
+        await asyncio.sleep(0)
+
+        bus.close_listeners()
+        await asyncio.wait_for(blocked, timeout=1)
+        await queue.put({"n": 3})
+        gate.set()
+        await asyncio.sleep(0.01)
+
+        assert queue._task is None
+        assert len(queue) == 0
+        assert seen == []
+
+    async def test_inline_mode_is_default(self) -> None:
+        bus = NullEventBus()
+        cb = AsyncMock()
+        bus.register_listener(TOPIC_PLANS, cb)
+        await bus.emit(TOPIC_PLANS, {"n": 0})
+        cb.assert_awaited_once()
+        assert bus.listener_stats() == []
+
+
+@pytest.mark.unit
+class TestLogEventBusBuffered:
+    async def test_lines_written_after_flush(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(log_file, buffered=True, flush_interval=10.0)
+        for i in range(5):
+            await bus.emit(TOPIC_ACTIONS, {"event": f"e{i}"})
+        await bus.flush()
+
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["event"] for line in lines] == [f"e{i}" for i in range(5)]
+        await bus.close()
+
+    async def test_time_based_flush(self, tmp_path: Path) -> None:
+        import asyncio
+
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(log_file, buffered=True, flush_interval=0.01)
+        await bus.emit(TOPIC_ACTIONS, {"event": "tick"})
+        await asyncio.sleep(0.1)
+        assert log_file.read_text().count("\n") == 1
+        await bus.close()
+
+    async def test_size_based_flush_batches_writes(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(log_file, buffered=True, flush_interval=10.0, flush_max_events=50)
+        for i in range(200):
+            await bus.emit(TOPIC_ACTIONS, {"n": i})
+        await bus.close()
+
+        stats = bus.stats()
+        assert stats["written"] == 200
+        assert stats["batches"] < 200
+        assert len(log_file.read_text().splitlines()) == 200
+
+    async def test_block_overflow_is_lossless(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(log_file, buffered=True, flush_interval=10.0, max_pending=4)
+        for i in range(50):
+            await bus.emit(TOPIC_ACTIONS, {"n": i})
+        await bus.close()
+
+        ns = [json.loads(line)["n"] for line in log_file.read_text().splitlines()]
+        assert ns == list(range(50))
+        assert bus.stats()["dropped"] == 0
+
+    async def test_drop_oldest_overflow(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(
+            log_file, buffered=True, flush_interval=10.0,
+            max_pending=4, overflow="drop_oldest",
+        )
+        for i in range(10):
+            await bus.emit(TOPIC_ACTIONS, {"n": i})
+        await bus.close()
+
+        ns = [json.loads(line)["n"] for line in log_file.read_text().splitlines()]
+        assert ns == [6, 7, 8, 9]
+        assert bus.stats()["dropped"] == 6
+
+    async def test_flush_returns_under_steady_load(self, tmp_path: Path) -> None:
+        import asyncio
+
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(log_file, buffered=True, flush_interval=0.001, max_pending=4)
+        stop = asyncio.Event()
+
+        async def producer() -> None:
+            n = 0
+            while not stop.is_set():
+                await bus.emit(TOPIC_ACTIONS, {"n": n})
+                n += 1
+
+        tasks = [asyncio.create_task(producer()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(bus.flush(), timeout=5)
+        stop.set()
+        await asyncio.gather(*tasks)
+        await asyncio.wait_for(bus.close(), timeout=5)
+        assert bus.stats()["pending"] == 0
+
+    async def test_emit_sync_joins_the_buffer(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(log_file, buffered=True, flush_interval=10.0)
+        await bus.emit(TOPIC_ACTIONS, {"n": 0})
+        bus.emit_sync(TOPIC_ACTIONS, {"n": 1})
+        await bus.emit(TOPIC_ACTIONS, {"n": 2})
+        assert not log_file.exists()
+        await bus.close()
+
+        ns = [json.loads(line)["n"] for line in log_file.read_text().splitlines()]
+        assert ns == [0, 1, 2]
+
+    async def test_listeners_still_called(self, tmp_path: Path) -> None:
+        bus = LogEventBus(tmp_path / "events.ndjson", buffered=True)
+        cb = AsyncMock()
+        bus.register_listener(TOPIC_ACTIONS, cb)
+        await bus.emit(TOPIC_ACTIONS, {"event": "x"})
+        cb.assert_awaited_once()
+        await bus.close()
+
+    async def test_fsync_policy(self, tmp_path: Path) -> None:
+        from unittest.mock import patch
+
+        log_file = tmp_path / "events.ndjson"
+        bus = LogEventBus(log_file, buffered=True, fsync=True)
+        with patch("llmos_bridge.events.bus.os.fsync") as fsync:
+            await bus.emit(TOPIC_ACTIONS, {"event": "x"})
+            await bus.flush()
+        assert fsync.called
+        await bus.close()
+
+
+@pytest.mark.unit
+class TestLogEventBusRotation:
+    @pytest.mark.parametrize("buffered", [False, True])
+    async def test_rotates_at_max_bytes(self, tmp_path: Path, buffered: bool) -> None:
+        log_file = tmp_path / "audit.log"
+        bus = LogEventBus(
+            log_file, buffered=buffered, flush_max_events=1,
+            max_bytes=1024, backup_count=2,
+        )
+        for i in range(100):
+            await bus.emit(TOPIC_ACTIONS, {"n": i, "pad": "x" * 40})
+            await bus.flush()
+        await bus.close()
+
+        assert log_file.stat().st_size <= 1024
+        assert (tmp_path / "audit.log.1").exists()
+        assert (tmp_path / "audit.log.2").exists()
+        assert not (tmp_path / "audit.log.3").exists()
+        last = json.loads(log_file.read_text().splitlines()[-1])
+        assert last["n"] == 99
@@ -0,0 +1,39 @@
+"""Benchmark — LogEventBus audit throughput, unbuffered vs. buffered.
+
+The unbuffered path opens, appends and closes the file for every event on
+the event loop; the buffered path batches lines and writes them from a
+background task.  Run with ``pytest -m slow -s`` to see events/second;
+the numbers are reported, not asserted, so the test never fails on timing.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import time
+
+import pytest
+
+from llmos_bridge.events.bus import TOPIC_ACTIONS, LogEventBus
+
+_N_EVENTS = 5000
+
+
+async def _events_per_second(bus: LogEventBus) -> float:
+    t0 = time.perf_counter()
+    for i in range(_N_EVENTS):
+        await bus.emit(TOPIC_ACTIONS, {"event": "action_started", "action_id": f"a{i}"})
+    await bus.close()
+    return _N_EVENTS / (time.perf_counter() - t0)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_audit_throughput_buffered_vs_unbuffered(tmp_path: Path) -> None:
+    before = await _events_per_second(LogEventBus(tmp_path / "before.ndjson"))
+    after = await _events_per_second(LogEventBus(tmp_path / "after.ndjson", buffered=True))
+
+    print(f"\nunbuffered: {before:>10.0f} events/s")
+    print(f"buffered:   {after:>10.0f} events/s  ({after / before:.1f}x)")
+
+    for name in ("before.ndjson", "after.ndjson"):
+        assert len((tmp_path / name).read_text().splitlines()) == _N_EVENTS
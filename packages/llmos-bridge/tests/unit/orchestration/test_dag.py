@@ -143,6 +143,99 @@ class TestGraphQueries:
         assert not s.is_independent("a1", "a3")
 
 
+class TestDataflowTracker:
+    def test_initial_ready_is_roots(self) -> None:
+        plan = _plan(
+            _action("b"),
+            _action("a"),
+            _action("c", ["a"]),
+            mode=ExecutionMode.PARALLEL,
+        )
+        tracker = DAGScheduler(plan).dataflow()
+        assert tracker.initial_ready() == ["a", "b"]
+        assert tracker.remaining == 3
+
+    def test_successor_released_without_waiting_for_wave(self) -> None:
+        # slow and fast are in the same wave; fast_child only depends on fast.
+        plan = _plan(
+            _action("slow"),
+            _action("fast"),
+            _action("fast_child", ["fast"]),
+            _action("slow_child", ["slow"]),
+            mode=ExecutionMode.PARALLEL,
+        )
+        tracker = DAGScheduler(plan).dataflow()
+        assert tracker.complete("fast") == ["fast_child"]
+        assert tracker.complete("fast_child") == []
+        assert tracker.complete("slow") == ["slow_child"]
+
+    def test_join_waits_for_all_dependencies(self) -> None:
+        plan = _plan(
+            _action("root"),
+            _action("left", ["root"]),
+            _action("right", ["root"]),
+            _action("merge", ["left", "right"]),
+            mode=ExecutionMode.PARALLEL,
+        )
+        tracker = DAGScheduler(plan).dataflow()
+        assert tracker.complete("root") == ["left", "right"]
+        assert tracker.complete("left") == []
+        assert tracker.complete("right") == ["merge"]
+
+    def test_complete_twice_is_noop(self) -> None:
+        plan = _plan(_action("a1"), _action("a2", ["a1"]), mode=ExecutionMode.PARALLEL)
+        tracker = DAGScheduler(plan).dataflow()
+        assert tracker.complete("a1") == ["a2"]
+        assert tracker.complete("a1") == []
+        assert tracker.remaining == 1
+
+
+class TestCriticalPathPriority:
+    def _actions(self) -> list[IMLAction]:
+        # excel_a -> excel_b is the long chain; leaf is a short standalone action.
+        return [
+            IMLAction(id="leaf", module="api_http", action="get", params={}),
+            IMLAction(id="excel_a", module="excel", action="write", params={}),
+            IMLAction(
+                id="excel_b", module="excel", action="write", params={},
+                depends_on=["excel_a"],
+            ),
+        ]
+
+    def test_disabled_by_default(self) -> None:
+        plan = _plan(*self._actions(), mode=ExecutionMode.PARALLEL)
+        scheduler = DAGScheduler(plan)
+        assert scheduler.priority("excel_a") == 0.0
+        assert next(scheduler.waves()).action_ids == ["excel_a", "leaf"]
+
+    def test_longest_remaining_path_weighted_by_history(self) -> None:
+        plan = _plan(*self._actions(), mode=ExecutionMode.PARALLEL)
+        scheduler = DAGScheduler(
+            plan,
+            critical_path=True,
+            action_durations={"excel.write": 30.0, "api_http.get": 0.5},
+        )
+        assert scheduler.priority("excel_b") == 30.0
+        assert scheduler.priority("excel_a") == 60.0
+        assert scheduler.priority("leaf") == 0.5
+
+    def test_default_duration_for_unknown_actions(self) -> None:
+        plan = _plan(*self._actions(), mode=ExecutionMode.PARALLEL)
+        scheduler = DAGScheduler(plan, critical_path=True, default_duration=2.0)
+        assert scheduler.priority("excel_a") == 4.0
+        assert scheduler.priority("leaf") == 2.0
+
+    def test_ready_actions_ordered_by_priority(self) -> None:
+        actions = self._actions()
+        actions[0] = IMLAction(id="aaa_leaf", module="api_http", action="get", params={})
+        plan = _plan(*actions, mode=ExecutionMode.PARALLEL)
+        scheduler = DAGScheduler(
+            plan, critical_path=True, action_durations={"excel.write": 30.0},
+        )
+        assert next(scheduler.waves()).action_ids == ["excel_a", "aaa_leaf"]
+        assert scheduler.dataflow().initial_ready() == ["excel_a", "aaa_leaf"]
+
+
 class TestCycleDetection:
     def test_build_with_cycle_raises(self) -> None:
         from llmos_bridge.protocol.parser import IMLParser
@@ -421,6 +421,53 @@ class TestPlanExecutorMemory:
         await kv_store.close()
 
 
+# ---------------------------------------------------------------------------
+# Perception
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestPlanExecutorPerception:
+    async def test_perception_does_not_mutate_module_result(
+        self, registry: ModuleRegistry, guard: PermissionGuard, state_store, audit_logger
+    ) -> None:
+        """The sanitiser may return the module's own dict; perception data is
+        injected into a copy, never into that dict."""
+        module_result = {"content": "clean"}
+
+        async def held_result(self_module, action, params):
+            return module_result
+
+        perception = MagicMock()
+        perception.run_after = AsyncMock(return_value={"after_text": "screen"})
+        plan = make_plan(
+            [
+                {
+                    "id": "read1",
+                    "module": "filesystem",
+                    "action": "read_file",
+                    "params": {"path": "/tmp/x.txt"},
+                    "perception": {"capture_after": True},
+                }
+            ]
+        )
+        with patch.object(FilesystemModule, "execute", held_result):
+            executor = PlanExecutor(
+                module_registry=registry,
+                guard=guard,
+                state_store=state_store,
+                audit_logger=audit_logger,
+                perception_pipeline=perception,
+            )
+            state = await executor.run(plan)
+
+        from llmos_bridge.protocol.models import PlanStatus
+        assert state.plan_status == PlanStatus.COMPLETED
+        assert module_result == {"content": "clean"}
+        result = state.get_action("read1").result
+        assert result["_perception"] == {"after_text": "screen"}
+
+
 # ---------------------------------------------------------------------------
 # Module version requirements
 # ---------------------------------------------------------------------------
@@ -692,3 +739,315 @@ class TestPlanExecutorApproval:
 
         assert state.plan_status == PlanStatus.FAILED
         assert state.get_action("write1").status == ActionStatus.FAILED
+
+
+@pytest.mark.unit
+class TestPlanExecutorInMemoryState:
+    async def test_plan_runs_on_memory_backend(
+        self, registry, guard, audit_logger, tmp_path: Path
+    ) -> None:
+        from llmos_bridge.orchestration.state import InMemoryStateStore
+        from llmos_bridge.protocol.models import ActionStatus, PlanStatus
+
+        store = InMemoryStateStore()
+        await store.init()
+        executor = PlanExecutor(
+            module_registry=registry,
+            guard=guard,
+            state_store=store,
+            audit_logger=audit_logger,
+        )
+        out = tmp_path / "mem.txt"
+        plan = make_plan(
+            [
+                {
+                    "id": "write1",
+                    "module": "filesystem",
+                    "action": "write_file",
+                    "params": {"path": str(out), "content": "hi"},
+                }
+            ]
+        )
+        await executor.run(plan)
+
+        stored = await store.get("test-plan")
+        assert stored is not None
+        assert stored.plan_status == PlanStatus.COMPLETED
+        assert stored.get_action("write1").status == ActionStatus.COMPLETED
+
+
+# ---------------------------------------------------------------------------
+# Dataflow scheduling
+# ---------------------------------------------------------------------------
+
+
+def _dataflow_plan(actions: list[dict[str, Any]]) -> IMLPlan:
+    from llmos_bridge.protocol.models import ExecutionMode
+
+    return IMLPlan(
+        plan_id="dataflow-plan",
+        description="Dataflow test plan",
+        execution_mode=ExecutionMode.PARALLEL,
+        actions=[
+            IMLAction(module="filesystem", action="read_file", params={"path": "/tmp/x"}, **a)
+            for a in actions
+        ],
+    )
+
+
+@pytest.mark.unit
+class TestPlanExecutorDataflow:
+    @staticmethod
+    def _timed_executor(
+        registry, guard, state_store, audit_logger, delays: dict[str, float], **kwargs: Any
+    ) -> tuple[PlanExecutor, list[tuple[str, str]]]:
+        executor = PlanExecutor(
+            module_registry=registry,
+            guard=guard,
+            state_store=state_store,
+            audit_logger=audit_logger,
+            **kwargs,
+        )
+        events: list[tuple[str, str]] = []
+
+        async def fake_dispatch(action: IMLAction, params: dict[str, Any]) -> Any:
+            events.append(("start", action.id))
+            await asyncio.sleep(delays.get(action.id, 0.0))
+            events.append(("end", action.id))
+            if action.id.startswith("fail"):
+                raise RuntimeError("boom")
+            return {"id": action.id}
+
+        executor._dispatch = fake_dispatch  # type: ignore[method-assign]
+        return executor, events
+
+    async def test_successor_starts_before_slow_sibling_finishes(
+        self, registry, guard, state_store, audit_logger
+    ) -> None:
+        from llmos_bridge.protocol.models import PlanStatus
+
+        executor, events = self._timed_executor(
+            registry, guard, state_store, audit_logger,
+            delays={"slow": 0.2}, scheduling_mode="dataflow",
+        )
+        plan = _dataflow_plan([
+            {"id": "slow"},
+            {"id": "fast"},
+            {"id": "fast_child", "depends_on": ["fast"]},
+        ])
+        state = await executor.run(plan)
+
+        assert state.plan_status == PlanStatus.COMPLETED
+        assert events.index(("start", "fast_child")) < events.index(("end", "slow"))
+
+    async def test_wave_mode_keeps_barrier(
+        self, registry, guard, state_store, audit_logger
+    ) -> None:
+        executor, events = self._timed_executor(
+            registry, guard, state_store, audit_logger, delays={"slow": 0.05},
+        )
+        plan = _dataflow_plan([
+            {"id": "slow"},
+            {"id": "fast"},
+            {"id": "fast_child", "depends_on": ["fast"]},
+        ])
+        await executor.run(plan)
+
+        assert events.index(("start", "fast_child")) > events.index(("end", "slow"))
+
+    async def test_global_concurrency_cap(
+        self, registry, guard, state_store, audit_logger
+    ) -> None:
+        executor, events = self._timed_executor(
+            registry, guard, state_store, audit_logger,
+            delays={f"a{i}": 0.01 for i in range(6)},
+            scheduling_mode="dataflow", max_parallel_actions=2,
+        )
+        plan = _dataflow_plan([{"id": f"a{i}"} for i in range(6)])
+        await executor.run(plan)
+
+        running = peak = 0
+        for kind, _ in events:
+            running += 1 if kind == "start" else -1
+            peak = max(peak, running)
+        assert peak == 2
+
+    async def test_abort_cascade_skips_descendants(
+        self, registry, guard, state_store, audit_logger
+    ) -> None:
+        from llmos_bridge.protocol.models import ActionStatus, PlanStatus
+
+        executor, events = self._timed_executor(
+            registry, guard, state_store, audit_logger,
+            delays={"sibling": 0.05}, scheduling_mode="dataflow",
+        )
+        plan = _dataflow_plan([
+            {"id": "fail1", "on_error": "abort"},
+            {"id": "sibling"},
+            {"id": "child", "depends_on": ["fail1"]},
+            {"id": "grandchild", "depends_on": ["child"]},
+        ])
+        state = await executor.run(plan)
+
+        assert state.plan_status == PlanStatus.FAILED
+        assert state.get_action("fail1").status == ActionStatus.FAILED
+        # In-flight siblings run to completion, as in wave mode.
+        assert state.get_action("sibling").status == ActionStatus.COMPLETED
+        assert state.get_action("child").status == ActionStatus.SKIPPED
+        assert state.get_action("grandchild").status == ActionStatus.SKIPPED
+        assert ("start", "child") not in events
+
+    async def test_abort_skips_each_action_once(
+        self, registry, guard, state_store, audit_logger
+    ) -> None:
+        from collections import Counter
+
+        from llmos_bridge.protocol.models import ActionStatus
+
+        executor, _ = self._timed_executor(
+            registry, guard, state_store, audit_logger,
+            delays={"sibling": 0.05}, scheduling_mode="dataflow",
+        )
+        skips: Counter[str] = Counter()
+        update_action = executor._store.update_action
+
+        async def counting_update(plan_id, action_id, status, **kwargs):
+            if status == ActionStatus.SKIPPED:
+                skips[action_id] += 1
+            return await update_action(plan_id, action_id, status, **kwargs)
+
+        executor._store.update_action = counting_update  # type: ignore[method-assign]
+        plan = _dataflow_plan([
+            {"id": "fail1", "on_error": "abort"},
+            {"id": "sibling"},
+            {"id": "child", "depends_on": ["fail1"]},
+            {"id": "grandchild", "depends_on": ["child"]},
+        ])
+        await executor.run(plan)
+
+        assert skips == {"child": 1, "grandchild": 1}
+
+    async def test_continue_on_error_releases_successors(
+        self, registry, guard, state_store, audit_logger
+    ) -> None:
+        from llmos_bridge.protocol.models import ActionStatus
+
+        executor, _ = self._timed_executor(
+            registry, guard, state_store, audit_logger, delays={}, scheduling_mode="dataflow",
+        )
+        plan = _dataflow_plan([
+            {"id": "fail1", "on_error": "continue"},
+            {"id": "child", "depends_on": ["fail1"]},
+        ])
+        state = await executor.run(plan)
+
+        assert state.get_action("fail1").status == ActionStatus.FAILED
+        assert state.get_action("child").status == ActionStatus.COMPLETED
+
+    async def test_critical_path_dispatched_first_under_contention(
+        self, registry, guard, state_store, audit_logger
+    ) -> None:
+        from llmos_bridge.orchestration.resource_manager import ResourceManager
+
+        executor, events = self._timed_executor(
+            registry, guard, state_store, audit_logger,
+            delays={},
+            scheduling_mode="dataflow",
+            critical_path_scheduling=True,
+            resource_manager=ResourceManager(limits={"filesystem": 1}),
+        )
+        # "zz_head" heads the longest chain but sorts last alphabetically.
+        plan = _dataflow_plan([
+            {"id": "a_leaf"},
+            {"id": "b_leaf"},
+            {"id": "zz_head"},
+            {"id": "zz_mid", "depends_on": ["zz_head"]},
+            {"id": "zz_tail", "depends_on": ["zz_mid"]},
+        ])
+        await executor.run(plan)
+
+        starts = [aid for kind, aid in events if kind == "start"]
+        assert starts[0] == "zz_head"
+
+
+# ---------------------------------------------------------------------------
+# Result spill-to-disk
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestPlanExecutorResultSpill:
+    async def test_oversized_result_flows_to_next_action(
+        self, registry, guard, state_store, audit_logger, tmp_path: Path
+    ) -> None:
+        from llmos_bridge.orchestration.result_store import ResultBlobStore
+        from llmos_bridge.protocol.models import PlanStatus
+
+        blobs = ResultBlobStore(tmp_path / "blobs")
+        executor = PlanExecutor(
+            module_registry=registry,
+            guard=guard,
+            state_store=state_store,
+            audit_logger=audit_logger,
+            max_result_size=1024,
+            result_store=blobs,
+        )
+        src = tmp_path / "big.txt"
+        src.write_text("line\n" * 8_000)  # under the sanitizer cap
+        dst = tmp_path / "copy.txt"
+        plan = make_plan([
+            {
+                "id": "read1",
+                "module": "filesystem",
+                "action": "read_file",
+                "params": {"path": str(src)},
+            },
+            {
+                "id": "write1",
+                "module": "filesystem",
+                "action": "write_file",
+                "params": {"path": str(dst), "content": "{{result.read1.content}}"},
+                "depends_on": ["read1"],
+            },
+        ])
+        state = await executor.run(plan)
+
+        assert state.plan_status == PlanStatus.COMPLETED
+        assert dst.read_text() == src.read_text()
+        stored = (await state_store.get("test-plan")).get_action("read1").result
+        assert blobs.is_handle(stored)
+        assert len(stored["data"]) == 1024
+
+    async def test_without_store_result_is_truncated(
+        self, registry, guard, state_store, audit_logger, tmp_path: Path
+    ) -> None:
+        from llmos_bridge.protocol.models import ActionStatus
+
+        executor = PlanExecutor(
+            module_registry=registry,
+            guard=guard,
+            state_store=state_store,
+            audit_logger=audit_logger,
+            max_result_size=1024,
+        )
+        src = tmp_path / "big.txt"
+        src.write_text("x" * 10_000)
+        plan = make_plan([
+            {
+                "id": "read1",
+                "module": "filesystem",
+                "action": "read_file",
+                "params": {"path": str(src)},
+            },
+            {
+                "id": "write1",
+                "module": "filesystem",
+                "action": "write_file",
+                "params": {"path": str(tmp_path / "o.txt"), "content": "{{result.read1.content}}"},
+                "depends_on": ["read1"],
+            },
+        ])
+        state = await executor.run(plan)
+
+        assert state.get_action("read1").result["_truncated"] is True
+        assert state.get_action("write1").status == ActionStatus.FAILED
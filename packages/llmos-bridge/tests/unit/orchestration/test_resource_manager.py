@@ -100,6 +100,63 @@ class TestAcquire:
                 assert status["word"]["in_use"] == 1
 
 
+class TestPriority:
+    """Waiters on a saturated module are woken highest priority first."""
+
+    @pytest.mark.asyncio
+    async def test_highest_priority_waiter_acquires_first(self, rm: ResourceManager) -> None:
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def holder() -> None:
+            async with rm.acquire("word"):
+                await release.wait()
+
+        async def waiter(name: str, priority: float) -> None:
+            async with rm.acquire("word", priority=priority):
+                order.append(name)
+
+        hold = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(waiter("leaf", 1.0)),
+            asyncio.create_task(waiter("critical", 30.0)),
+            asyncio.create_task(waiter("mid", 5.0)),
+            asyncio.create_task(waiter("leaf2", 1.0)),
+        ]
+        await asyncio.sleep(0)
+        assert rm.status()["word"]["waiting"] == 4
+        release.set()
+        await asyncio.gather(hold, *tasks)
+        assert order == ["critical", "mid", "leaf", "leaf2"]
+        assert rm.status()["word"]["available"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self, rm: ResourceManager) -> None:
+        release = asyncio.Event()
+
+        async def holder() -> None:
+            async with rm.acquire("word"):
+                await release.wait()
+
+        hold = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+
+        async def waiter() -> None:
+            async with rm.acquire("word", priority=10.0):
+                pass
+
+        task = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        task.cancel()
+        release.set()
+        await hold
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert rm.status()["word"]["available"] == 1
+        assert rm.status()["word"]["waiting"] == 0
+
+
 class TestStatus:
     """Test the status() method."""
 
@@ -0,0 +1,62 @@
+"""Benchmark — result size check on under-limit and oversized results.
+
+Compares :func:`_truncate_result` with a single ``json.dumps`` + encode,
+the baseline measurement every result used to pay.  Run with
+``pytest -m slow -s`` to see the timings; only the results are asserted,
+never the speed-up.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from typing import Any
+
+import pytest
+
+from llmos_bridge.orchestration.executor import _DEFAULT_MAX_RESULT_SIZE, _truncate_result
+
+_ROUNDS = 5
+_NAMES = ["alice", "bob", "carol", "dave", "Zoë", "erin", "frank"]
+
+
+def _rows(n: int, rng: random.Random) -> dict[str, Any]:
+    rows = [
+        {
+            "id": i,
+            "name": rng.choice(_NAMES),
+            "amount": round(rng.uniform(0, 10_000), 2),
+            "created_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "active": rng.random() < 0.5,
+            "notes": None if rng.random() < 0.7 else "follow up next quarter",
+        }
+        for i in range(n)
+    ]
+    return {"columns": list(rows[0]), "rows": rows, "row_count": n}
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("n_rows", [4_000, 100_000], ids=["under-limit", "oversized"])
+def test_truncate_result_vs_json_dumps(n_rows: int) -> None:
+    result = _rows(n_rows, random.Random(3))
+
+    t0 = time.perf_counter()
+    for _ in range(_ROUNDS):
+        size = len(json.dumps(result, default=str).encode("utf-8"))
+    baseline_ms = (time.perf_counter() - t0) * 1000 / _ROUNDS
+
+    t0 = time.perf_counter()
+    for _ in range(_ROUNDS):
+        checked = _truncate_result(result, _DEFAULT_MAX_RESULT_SIZE)
+    measured_ms = (time.perf_counter() - t0) * 1000 / _ROUNDS
+
+    print(
+        f"\nrows={n_rows:<7} bytes={size:<9} json.dumps={baseline_ms:>8.2f} ms  "
+        f"_truncate_result={measured_ms:>8.2f} ms  ({baseline_ms / measured_ms:.1f}x)"
+    )
+    if size <= _DEFAULT_MAX_RESULT_SIZE:
+        assert checked is result
+    else:
+        assert checked["_truncated"] is True
+        assert checked["data"] == json.dumps(result, default=str)[:_DEFAULT_MAX_RESULT_SIZE]
@@ -0,0 +1,158 @@
+"""Unit tests — ResultBlobStore (spilled action results)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+from llmos_bridge.exceptions import TemplateResolutionError
+from llmos_bridge.orchestration.executor import _BINARY_RESULT_KEYS, _truncate_result
+from llmos_bridge.orchestration.result_store import ResultBlobStore
+from llmos_bridge.protocol.template import TemplateResolver, compile_template
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ResultBlobStore:
+    return ResultBlobStore(tmp_path / "blobs")
+
+
+async def _spill(store: ResultBlobStore, result, max_bytes: int = 100) -> dict:
+    summary = _truncate_result(result, max_bytes)
+    return await store.spill(result, summary, exclude=_BINARY_RESULT_KEYS)
+
+
+@pytest.mark.unit
+class TestBlobs:
+    def test_put_get_roundtrip(self, store: ResultBlobStore) -> None:
+        value = {"rows": [[i, f"name-{i}"] for i in range(50_000)]}
+        digest = store.put(value)
+        assert store.get(digest) == value
+
+    def test_content_addressed(self, store: ResultBlobStore) -> None:
+        a = store.put({"x": [1, 2, 3]})
+        b = store.put({"x": [1, 2, 3]})
+        assert a == b
+        assert len(list(store.root.glob("??/*"))) == 1
+        assert not list(store.root.glob(".tmp-*"))
+
+    def test_digest_is_validated(self, store: ResultBlobStore) -> None:
+        with pytest.raises(ValueError):
+            store.get("../../etc/passwd")
+
+    def test_purge_removes_old_blobs(self, store: ResultBlobStore) -> None:
+        old = store.put("old")
+        fresh = store.put("fresh")
+        past = time.time() - 3600
+        os.utime(store.root / old[:2] / old[2:], (past, past))
+
+        assert store.purge(60) == 1
+        assert store.get(fresh) == "fresh"
+        with pytest.raises(FileNotFoundError):
+            store.get(old)
+
+    def test_purge_removes_stale_partial_writes(self, store: ResultBlobStore) -> None:
+        store.put("warm")  # creates the root directory
+        stale = store.root / ".tmp-crashed"
+        stale.write_text('{"partial"')
+        past = time.time() - 3600
+        os.utime(stale, (past, past))
+        in_progress = store.root / ".tmp-writing"
+        in_progress.write_text('{"partial"')
+
+        assert store.purge(60) == 1
+        assert not stale.exists()
+        assert in_progress.exists()
+
+
+@pytest.mark.unit
+class TestHandles:
+    async def test_handle_keeps_truncated_preview(self, store: ResultBlobStore) -> None:
+        result = {"data": "d" * 1000, "count": 3}
+        handle = await _spill(store, result)
+
+        assert store.is_handle(handle)
+        assert handle["_truncated"] is True
+        assert len(handle["data"]) == 100
+        json.dumps(handle)  # persisted as-is in actions.result
+
+    async def test_load_whole_and_field(self, store: ResultBlobStore) -> None:
+        result = {"data": "d" * 1000, "count": 3, "screenshot_b64": "AAAA"}
+        handle = await _spill(store, result)
+
+        assert store.load(handle) == result
+        assert store.load(handle, "data") == "d" * 1000
+        assert store.load(handle, "screenshot_b64") == "AAAA"
+        assert store.fields(handle) == ["count", "data", "screenshot_b64"]
+        with pytest.raises(KeyError):
+            store.load(handle, "missing")
+
+    async def test_non_dict_result(self, store: ResultBlobStore) -> None:
+        result = list(range(1000))
+        handle = await _spill(store, result)
+        assert store.load(handle) == result
+
+    def test_plain_results_are_not_handles(self, store: ResultBlobStore) -> None:
+        assert not store.is_handle({"_truncated": True, "data": "x"})
+        assert not store.is_handle("text")
+
+
+@pytest.mark.unit
+class TestTemplateDereference:
+    async def test_field_template_loads_from_disk(self, store: ResultBlobStore) -> None:
+        rows = [{"id": i} for i in range(5000)]
+        handle = await _spill(store, {"rows": rows, "total": 5000})
+        resolver = TemplateResolver(execution_results={"a1": handle}, result_store=store)
+
+        resolved = resolver.resolve({"rows": "{{result.a1.rows}}", "n": "{{result.a1.total}} rows"})
+        assert resolved == {"rows": rows, "n": "5000 rows"}
+
+    async def test_preload_reads_blobs_off_the_event_loop(
+        self, store: ResultBlobStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        rows = [{"id": i} for i in range(100)]
+        handle = await _spill(store, {"rows": rows, "total": 100})
+        params = {"rows": "{{result.a1.rows}}", "n": "{{result.a1.total}} rows"}
+        compiled = compile_template(params)
+        resolver = TemplateResolver(execution_results={"a1": handle}, result_store=store)
+
+        await resolver.preload(compiled)
+
+        def no_sync_reads(digest: str) -> None:
+            raise AssertionError("blob read during resolve()")
+
+        monkeypatch.setattr(store, "get", no_sync_reads)
+        assert resolver.resolve(params, compiled) == {"rows": rows, "n": "100 rows"}
+
+    async def test_preload_leaves_errors_to_resolve(self, store: ResultBlobStore) -> None:
+        handle = await _spill(store, {"rows": ["r"] * 500})
+        params = {"x": "{{result.a1.nope}}"}
+        compiled = compile_template(params)
+        resolver = TemplateResolver(execution_results={"a1": handle}, result_store=store)
+
+        await resolver.preload(compiled)
+        with pytest.raises(TemplateResolutionError, match="rows"):
+            resolver.resolve(params, compiled)
+
+    async def test_unknown_field_lists_original_fields(self, store: ResultBlobStore) -> None:
+        handle = await _spill(store, {"rows": ["r"] * 500})
+        resolver = TemplateResolver(execution_results={"a1": handle}, result_store=store)
+
+        with pytest.raises(TemplateResolutionError, match="rows"):
+            resolver.resolve({"x": "{{result.a1.nope}}"})
+
+    async def test_purged_blob_raises_resolution_error(self, store: ResultBlobStore) -> None:
+        handle = await _spill(store, {"rows": ["r"] * 500})
+        store.purge(-1)
+        resolver = TemplateResolver(execution_results={"a1": handle}, result_store=store)
+
+        with pytest.raises(TemplateResolutionError, match="unavailable"):
+            resolver.resolve({"x": "{{result.a1.rows}}"})
+
+    async def test_without_store_handle_is_plain_dict(self, store: ResultBlobStore) -> None:
+        handle = await _spill(store, {"rows": ["r"] * 500})
+        resolver = TemplateResolver(execution_results={"a1": handle})
+        assert resolver.resolve({"x": "{{result.a1}}"})["x"] is handle
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 from pathlib import Path
 from typing import Any
@@ -11,7 +13,9 @@ import pytest_asyncio
 
 from llmos_bridge.orchestration.state import (
     ActionState,
+    BaseStateStore,
     ExecutionState,
+    InMemoryStateStore,
     PlanStateStore,
 )
 from llmos_bridge.protocol.models import ActionStatus, PlanStatus
@@ -153,3 +157,437 @@ class TestPlanStateStoreRejection:
         assert loaded is not None
         assert loaded.rejection_details == details
         assert loaded.rejection_details["scanner_details"][0]["scanner_id"] == "heuristic"
+
+
+# ---------------------------------------------------------------------------
+# PlanStateStore — historical action durations
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+class TestActionDurationStats:
+    async def test_empty_store(self, store: PlanStateStore) -> None:
+        assert await store.action_duration_stats() == {}
+
+    async def test_mean_over_completed_actions(self, store: PlanStateStore) -> None:
+        state = ExecutionState(plan_id="p1")
+        for aid, module in (("a1", "excel"), ("a2", "excel"), ("a3", "api_http")):
+            state.actions[aid] = ActionState(action_id=aid, module=module, action="run")
+        await store.create(state)
+        for aid in ("a1", "a2", "a3"):
+            await store.update_action("p1", aid, ActionStatus.RUNNING)
+        await store.update_action("p1", "a1", ActionStatus.COMPLETED)
+        await store.update_action("p1", "a2", ActionStatus.COMPLETED)
+        await store.update_action("p1", "a3", ActionStatus.FAILED, error="x")
+        # Make durations deterministic.
+        assert store._conn is not None
+        await store._conn.execute(
+            "UPDATE actions SET started_at=0, finished_at=? WHERE action_id=?", (10.0, "a1")
+        )
+        await store._conn.execute(
+            "UPDATE actions SET started_at=0, finished_at=? WHERE action_id=?", (20.0, "a2")
+        )
+        await store._conn.commit()
+
+        stats = await store.action_duration_stats()
+        assert stats == {"excel.run": 15.0}
+
+
+# ---------------------------------------------------------------------------
+# PlanStateStore — write-behind group commits
+# ---------------------------------------------------------------------------
+
+
+def _two_action_state(plan_id: str) -> ExecutionState:
+    state = ExecutionState(plan_id=plan_id)
+    for aid in ("a1", "a2"):
+        state.actions[aid] = ActionState(action_id=aid, module="filesystem", action="read_file")
+    return state
+
+
+@pytest_asyncio.fixture
+async def wb_store(tmp_path: Path) -> PlanStateStore:
+    # Long interval + large batch so only explicit flushes hit the disk.
+    s = PlanStateStore(
+        tmp_path / "wb.db", write_behind=True, flush_interval=60.0, flush_max_records=1000
+    )
+    await s.init()
+    yield s
+    await s.close()
+
+
+async def _disk_view(path: Path, plan_id: str) -> ExecutionState | None:
+    """Read the plan through an independent connection (what survives a crash)."""
+    reader = PlanStateStore(path)
+    await reader.init()
+    try:
+        return await reader.get(plan_id)
+    finally:
+        await reader.close()
+
+
+@pytest.mark.asyncio
+class TestPlanStateStoreWriteBehind:
+    async def test_get_reads_own_writes(self, wb_store: PlanStateStore) -> None:
+        await wb_store.create(_two_action_state("p1"))
+        await wb_store.update_plan_status("p1", PlanStatus.RUNNING)
+        await wb_store.update_action("p1", "a1", ActionStatus.RUNNING, attempt=1)
+        await wb_store.update_action("p1", "a1", ActionStatus.COMPLETED, result={"ok": 1})
+
+        loaded = await wb_store.get("p1")
+        assert loaded is not None
+        assert loaded.plan_status == PlanStatus.RUNNING
+        a1 = loaded.get_action("a1")
+        assert a1.status == ActionStatus.COMPLETED
+        assert a1.result == {"ok": 1}
+        assert a1.attempt == 1
+        assert a1.started_at is not None and a1.finished_at is not None
+        assert loaded.get_action("a2").status == ActionStatus.PENDING
+
+    async def test_get_reads_own_writes_during_overlapping_flushes(
+        self, wb_store: PlanStateStore
+    ) -> None:
+        await wb_store.create(_two_action_state("p1"))
+        # Another writer holds the lock, so both flushes have to wait for it.
+        await wb_store._lock.acquire()
+        await wb_store.update_action("p1", "a1", ActionStatus.COMPLETED)
+        first = asyncio.create_task(wb_store.flush())
+        await asyncio.sleep(0)
+        await wb_store.update_action("p1", "a2", ActionStatus.COMPLETED)
+        second = asyncio.create_task(wb_store.flush())
+        await asyncio.sleep(0)
+
+        loaded = await wb_store.get("p1")
+        assert loaded is not None
+        assert loaded.get_action("a1").status == ActionStatus.COMPLETED
+        assert loaded.get_action("a2").status == ActionStatus.COMPLETED
+        wb_store._lock.release()
+        await asyncio.gather(first, second)
+        assert wb_store.pending_writes == 0
+        on_disk = await _disk_view(wb_store._db_path, "p1")
+        assert on_disk is not None
+        assert on_disk.get_action("a1").status == ActionStatus.COMPLETED
+        assert on_disk.get_action("a2").status == ActionStatus.COMPLETED
+
+    async def test_updates_coalesce_per_row(self, wb_store: PlanStateStore) -> None:
+        await wb_store.create(_two_action_state("p1"))
+        await wb_store.update_action("p1", "a1", ActionStatus.RUNNING, attempt=1)
+        await wb_store.update_action("p1", "a1", ActionStatus.RUNNING, attempt=2)
+        await wb_store.update_action("p1", "a1", ActionStatus.FAILED, error="boom")
+        await wb_store.update_plan_status("p1", PlanStatus.RUNNING)
+        await wb_store.update_plan_status("p1", PlanStatus.FAILED)
+        assert wb_store.pending_writes == 2
+
+        await wb_store.flush()
+        assert wb_store.pending_writes == 0
+        on_disk = await _disk_view(wb_store._db_path, "p1")
+        assert on_disk is not None
+        assert on_disk.plan_status == PlanStatus.FAILED
+        a1 = on_disk.get_action("a1")
+        assert a1.status == ActionStatus.FAILED
+        assert a1.error == "boom"
+        assert a1.attempt == 2
+        assert a1.started_at is not None and a1.finished_at is not None
+
+    async def test_rejection_details_survive_later_status_update(
+        self, wb_store: PlanStateStore
+    ) -> None:
+        await wb_store.create(ExecutionState(plan_id="p1"))
+        await wb_store.update_plan_status(
+            "p1", PlanStatus.FAILED, rejection_details={"source": "scanner_pipeline"}
+        )
+        await wb_store.update_plan_status("p1", PlanStatus.FAILED)
+        await wb_store.flush()
+        on_disk = await _disk_view(wb_store._db_path, "p1")
+        assert on_disk is not None
+        assert on_disk.rejection_details == {"source": "scanner_pipeline"}
+
+    async def test_crash_loses_at_most_unflushed_updates(
+        self, wb_store: PlanStateStore
+    ) -> None:
+        """Plan creation is durable; only updates since the last flush are lost."""
+        await wb_store.create(_two_action_state("p1"))
+        await wb_store.update_action("p1", "a1", ActionStatus.COMPLETED, result={"n": 1})
+        await wb_store.flush()
+        await wb_store.update_action("p1", "a2", ActionStatus.RUNNING, attempt=1)
+        await wb_store.update_plan_status("p1", PlanStatus.RUNNING)
+        lost = wb_store.pending_writes
+
+        # "Crash": nothing more is flushed; inspect what is on disk.
+        on_disk = await _disk_view(wb_store._db_path, "p1")
+        assert on_disk is not None
+        assert lost == 2
+        assert on_disk.plan_status == PlanStatus.PENDING
+        assert on_disk.get_action("a1").status == ActionStatus.COMPLETED
+        assert on_disk.get_action("a1").result == {"n": 1}
+        assert on_disk.get_action("a2").status == ActionStatus.PENDING
+
+    async def test_flushes_when_batch_is_full(self, tmp_path: Path) -> None:
+        store = PlanStateStore(
+            tmp_path / "batch.db", write_behind=True, flush_interval=60.0, flush_max_records=2
+        )
+        await store.init()
+        try:
+            await store.create(_two_action_state("p1"))
+            await store.update_action("p1", "a1", ActionStatus.COMPLETED)
+            await store.update_action("p1", "a2", ActionStatus.COMPLETED)
+            for _ in range(20):
+                if store.pending_writes == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert store.pending_writes == 0
+            on_disk = await _disk_view(store._db_path, "p1")
+            assert on_disk is not None
+            assert on_disk.get_action("a2").status == ActionStatus.COMPLETED
+        finally:
+            await store.close()
+
+    async def test_flushes_on_interval(self, tmp_path: Path) -> None:
+        store = PlanStateStore(tmp_path / "tick.db", write_behind=True, flush_interval=0.01)
+        await store.init()
+        try:
+            await store.create(_two_action_state("p1"))
+            await store.update_action("p1", "a1", ActionStatus.RUNNING)
+            await asyncio.sleep(0.1)
+            assert store.pending_writes == 0
+        finally:
+            await store.close()
+
+    async def test_close_flushes_pending(self, tmp_path: Path) -> None:
+        path = tmp_path / "close.db"
+        store = PlanStateStore(path, write_behind=True, flush_interval=60.0)
+        await store.init()
+        await store.create(_two_action_state("p1"))
+        await store.update_plan_status("p1", PlanStatus.COMPLETED)
+        await store.close()
+        on_disk = await _disk_view(path, "p1")
+        assert on_disk is not None
+        assert on_disk.plan_status == PlanStatus.COMPLETED
+
+    async def test_get_reads_own_writes_across_concurrent_flush(
+        self, wb_store: PlanStateStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await wb_store.create(_two_action_state("p1"))
+        await wb_store.update_plan_status("p1", PlanStatus.COMPLETED)
+        await wb_store.update_action("p1", "a1", ActionStatus.COMPLETED, result={"ok": 1})
+
+        assert wb_store._conn is not None
+        execute = wb_store._conn.execute
+
+        @contextlib.asynccontextmanager
+        async def flush_between_selects(sql: str, params: Any = ()) -> Any:
+            # Commit and clear the buffers after the plans row has been read.
+            if sql.startswith("SELECT action_id"):
+                await wb_store.flush()
+            async with execute(sql, params) as cursor:
+                yield cursor
+
+        monkeypatch.setattr(wb_store._conn, "execute", flush_between_selects)
+        loaded = await wb_store.get("p1")
+
+        assert wb_store.pending_writes == 0
+        assert loaded is not None
+        assert loaded.plan_status == PlanStatus.COMPLETED
+        assert loaded.get_action("a1").status == ActionStatus.COMPLETED
+        assert loaded.get_action("a1").result == {"ok": 1}
+
+    async def test_failed_flush_rolls_back_partial_batch(
+        self, wb_store: PlanStateStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await wb_store.create(_two_action_state("p1"))
+        await wb_store.flush()
+        await wb_store.update_plan_status("p1", PlanStatus.COMPLETED)
+        await wb_store.update_action("p1", "a1", ActionStatus.COMPLETED)
+
+        assert wb_store._conn is not None
+        executemany = wb_store._conn.executemany
+
+        async def fail_on_actions(sql: str, rows: Any) -> Any:
+            if "UPDATE actions" in sql:
+                raise OSError("disk I/O error")
+            return await executemany(sql, rows)
+
+        monkeypatch.setattr(wb_store._conn, "executemany", fail_on_actions)
+        with pytest.raises(OSError):
+            await wb_store.flush()
+        monkeypatch.undo()
+
+        # An unrelated write commits; the half-applied plan UPDATE must not.
+        await wb_store.create(ExecutionState(plan_id="p2"))
+        on_disk = await _disk_view(wb_store._db_path, "p1")
+        assert on_disk is not None
+        assert on_disk.plan_status == PlanStatus.PENDING
+
+        await wb_store.flush()
+        on_disk = await _disk_view(wb_store._db_path, "p1")
+        assert on_disk is not None
+        assert on_disk.plan_status == PlanStatus.COMPLETED
+        assert on_disk.get_action("a1").status == ActionStatus.COMPLETED
+
+    async def test_list_plans_sees_buffered_status(self, wb_store: PlanStateStore) -> None:
+        await wb_store.create(ExecutionState(plan_id="p1"))
+        await wb_store.update_plan_status("p1", PlanStatus.COMPLETED)
+        plans = await wb_store.list_plans(status=PlanStatus.COMPLETED)
+        assert [p["plan_id"] for p in plans] == ["p1"]
+
+
+# ---------------------------------------------------------------------------
+# PlanStateStore — bulk create / chunked purge
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+class TestPlanStateStoreBulk:
+    async def test_create_many_actions(self, store: PlanStateStore) -> None:
+        state = ExecutionState(plan_id="fanout")
+        for i in range(300):
+            state.actions[f"a{i}"] = ActionState(
+                action_id=f"a{i}", module="filesystem", action="read_file"
+            )
+        await store.create(state)
+        loaded = await store.get("fanout")
+        assert loaded is not None
+        assert len(loaded.actions) == 300
+        assert loaded.get_action("a299").module == "filesystem"
+
+    async def test_create_without_actions(self, store: PlanStateStore) -> None:
+        await store.create(ExecutionState(plan_id="empty"))
+        loaded = await store.get("empty")
+        assert loaded is not None
+        assert loaded.actions == {}
+
+    async def test_purge_in_chunks(self, store: PlanStateStore) -> None:
+        assert store._conn is not None
+        for i in range(7):
+            state = _two_action_state(f"old{i}")
+            state.plan_status = PlanStatus.COMPLETED
+            await store.create(state)
+        await store.create(_two_action_state("running"))
+        await store._conn.execute("UPDATE plans SET updated_at=0")
+        await store._conn.commit()
+
+        purged = await store.purge_old_plans(3600, chunk_size=3)
+        assert purged == 7
+        assert await store.get("old0") is None
+        assert await store.get("running") is not None
+        async with store._conn.execute("SELECT COUNT(*) FROM actions") as cur:
+            assert (await cur.fetchone())[0] == 2
+
+
+# ---------------------------------------------------------------------------
+# Backend contract — SQLite and in-memory must behave the same
+# ---------------------------------------------------------------------------
+
+
+@pytest_asyncio.fixture(params=["sqlite", "memory"])
+async def any_store(request: pytest.FixtureRequest, tmp_path: Path) -> BaseStateStore:
+    s: BaseStateStore = (
+        PlanStateStore(tmp_path / "contract.db")
+        if request.param == "sqlite"
+        else InMemoryStateStore()
+    )
+    await s.init()
+    yield s
+    await s.close()
+
+
+@pytest.mark.asyncio
+class TestStateBackendContract:
+    async def test_roundtrip(self, any_store: BaseStateStore) -> None:
+        await any_store.create(_two_action_state("p1"), app_id="app1")
+        await any_store.update_plan_status("p1", PlanStatus.RUNNING)
+        await any_store.update_action("p1", "a1", ActionStatus.RUNNING, attempt=1)
+        await any_store.update_action("p1", "a1", ActionStatus.COMPLETED, result={"k": [1, 2]})
+
+        loaded = await any_store.get("p1")
+        assert loaded is not None
+        assert loaded.plan_status == PlanStatus.RUNNING
+        a1 = loaded.get_action("a1")
+        assert a1.status == ActionStatus.COMPLETED
+        assert a1.result == {"k": [1, 2]}
+        assert a1.attempt == 1
+        assert a1.started_at is not None and a1.finished_at is not None
+        assert a1.module == "filesystem"
+        assert loaded.get_action("a2").status == ActionStatus.PENDING
+
+    async def test_get_unknown(self, any_store: BaseStateStore) -> None:
+        assert await any_store.get("nope") is None
+
+    async def test_get_returns_snapshot(self, any_store: BaseStateStore) -> None:
+        await any_store.create(_two_action_state("p1"))
+        loaded = await any_store.get("p1")
+        assert loaded is not None
+        loaded.get_action("a1").status = ActionStatus.FAILED
+        again = await any_store.get("p1")
+        assert again is not None
+        assert again.get_action("a1").status == ActionStatus.PENDING
+
+    async def test_rejection_details(self, any_store: BaseStateStore) -> None:
+        await any_store.create(ExecutionState(plan_id="p1"))
+        await any_store.update_plan_status(
+            "p1", PlanStatus.FAILED, rejection_details={"source": "intent_verifier"}
+        )
+        loaded = await any_store.get("p1")
+        assert loaded is not None
+        assert loaded.rejection_details == {"source": "intent_verifier"}
+
+    async def test_list_plans_filters(self, any_store: BaseStateStore) -> None:
+        await any_store.create(ExecutionState(plan_id="p1"), app_id="a")
+        await any_store.create(ExecutionState(plan_id="p2"), app_id="b")
+        await any_store.update_plan_status("p2", PlanStatus.COMPLETED)
+
+        assert {p["plan_id"] for p in await any_store.list_plans()} == {"p1", "p2"}
+        done = await any_store.list_plans(status=PlanStatus.COMPLETED)
+        assert [p["plan_id"] for p in done] == ["p2"]
+        by_app = await any_store.list_plans(app_id="a")
+        assert [p["app_id"] for p in by_app] == ["a"]
+        assert len(await any_store.list_plans(limit=1)) == 1
+
+    async def test_purge_only_old_terminal_plans(self, any_store: BaseStateStore) -> None:
+        await any_store.create(ExecutionState(plan_id="done"))
+        await any_store.update_plan_status("done", PlanStatus.COMPLETED)
+        await any_store.create(ExecutionState(plan_id="running"))
+        await asyncio.sleep(0.01)
+        assert await any_store.purge_old_plans(0.001) == 1
+        assert await any_store.get("done") is None
+        assert await any_store.get("running") is not None
+
+    async def test_action_duration_stats(self, any_store: BaseStateStore) -> None:
+        await any_store.create(_two_action_state("p1"))
+        await any_store.update_action("p1", "a1", ActionStatus.RUNNING)
+        await any_store.update_action("p1", "a1", ActionStatus.COMPLETED)
+        stats = await any_store.action_duration_stats()
+        assert set(stats) == {"filesystem.read_file"}
+        assert stats["filesystem.read_file"] >= 0.0
+
+
+@pytest.mark.asyncio
+class TestInMemoryStateStore:
+    async def test_evicts_least_recently_updated(self) -> None:
+        store = InMemoryStateStore(max_plans=2)
+        await store.init()
+        await store.create(ExecutionState(plan_id="p1"))
+        await store.create(ExecutionState(plan_id="p2"))
+        # Touch p1 so p2 becomes the least recently updated.
+        await store.update_plan_status("p1", PlanStatus.RUNNING)
+        await store.create(ExecutionState(plan_id="p3"))
+
+        assert await store.get("p2") is None
+        assert await store.get("p1") is not None
+        assert await store.get("p3") is not None
+
+    async def test_updates_to_evicted_plan_are_ignored(self) -> None:
+        store = InMemoryStateStore(max_plans=1)
+        await store.create(_two_action_state("p1"))
+        await store.create(ExecutionState(plan_id="p2"))
+        await store.update_action("p1", "a1", ActionStatus.COMPLETED)
+        await store.update_plan_status("p1", PlanStatus.COMPLETED)
+        assert await store.get("p1") is None
+
+    async def test_duplicate_plan_rejected(self) -> None:
+        from llmos_bridge.exceptions import StateStoreError
+
+        store = InMemoryStateStore()
+        await store.create(ExecutionState(plan_id="p1"))
+        with pytest.raises(StateStoreError):
+            await store.create(ExecutionState(plan_id="p1"))
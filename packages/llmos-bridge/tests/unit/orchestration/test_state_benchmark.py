@@ -0,0 +1,74 @@
+"""Benchmark — PlanStateStore plan creation latency vs. action count.
+
+Compares the bulk ``executemany`` path in :meth:`PlanStateStore.create`
+with the previous one-``execute``-per-action insert loop.  Run with
+``pytest -m slow -s`` to see the timing table; the timings are reported,
+not asserted.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import time
+
+import pytest
+
+from llmos_bridge.orchestration.state import ActionState, ExecutionState, PlanStateStore
+
+_ACTION_COUNTS = (10, 100, 500, 1000)
+
+
+def _state(plan_id: str, n_actions: int) -> ExecutionState:
+    state = ExecutionState(plan_id=plan_id)
+    for i in range(n_actions):
+        state.actions[f"a{i}"] = ActionState(
+            action_id=f"a{i}", module="filesystem", action="read_file"
+        )
+    return state
+
+
+async def _create_row_by_row(store: PlanStateStore, state: ExecutionState) -> None:
+    """Reference implementation: the pre-bulk insert loop."""
+    now = time.time()
+    async with store._lock:
+        assert store._conn is not None
+        await store._conn.execute(
+            "INSERT INTO plans (plan_id, status, created_at, updated_at, data, app_id) "
+            "VALUES (?,?,?,?,?,?)",
+            (state.plan_id, state.plan_status.value, now, now, json.dumps({}), "default"),
+        )
+        for action_id, a in state.actions.items():
+            await store._conn.execute(
+                "INSERT INTO actions (plan_id, action_id, status, module, action) "
+                "VALUES (?,?,?,?,?)",
+                (state.plan_id, action_id, a.status.value, a.module, a.action),
+            )
+        await store._conn.commit()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_plan_creation_latency_vs_action_count(tmp_path: Path) -> None:
+    store = PlanStateStore(tmp_path / "bench.db")
+    await store.init()
+    rows: list[tuple[int, float, float]] = []
+    try:
+        for n in _ACTION_COUNTS:
+            t0 = time.perf_counter()
+            await _create_row_by_row(store, _state(f"loop-{n}", n))
+            loop_ms = (time.perf_counter() - t0) * 1000
+
+            t0 = time.perf_counter()
+            await store.create(_state(f"bulk-{n}", n))
+            bulk_ms = (time.perf_counter() - t0) * 1000
+            rows.append((n, loop_ms, bulk_ms))
+
+            loaded = await store.get(f"bulk-{n}")
+            assert loaded is not None and len(loaded.actions) == n
+    finally:
+        await store.close()
+
+    print("\nactions  row-by-row(ms)  bulk(ms)  speedup")
+    for n, loop_ms, bulk_ms in rows:
+        print(f"{n:>7}  {loop_ms:>14.2f}  {bulk_ms:>8.2f}  {loop_ms / bulk_ms:>6.1f}x")
@@ -5,7 +5,7 @@ import os
 import pytest
 
 from llmos_bridge.exceptions import TemplateResolutionError
-from llmos_bridge.protocol.template import TemplateResolver
+from llmos_bridge.protocol.template import TemplateResolver, compile_template
 
 
 @pytest.fixture
@@ -108,3 +108,69 @@ class TestNestedParams:
         params = {"x": "{{unknown.ref.field}}"}
         with pytest.raises(TemplateResolutionError, match="Unknown template prefix"):
             resolver.resolve(params)
+
+
+class TestCompiledTemplates:
+    _PARAMS = {
+        "path": "{{result.a1.content}}",
+        "size": "{{result.a1.size}}",
+        "header": "Key={{memory.api_key}} at {{memory.last_run}}",
+        "body": {"text": "x" * 1000, "rows": [[1, 2, 3], [4, 5, 6]]},
+        "nested": {"items": ["static", "{{result.a2.rows}}"], "flag": True},
+        "plain": "no {braces} here",
+    }
+
+    def test_records_only_template_paths(self) -> None:
+        compiled = compile_template(self._PARAMS)
+        assert {slot.path for slot in compiled.slots} == {
+            ("path",), ("size",), ("header",), ("nested", "items", 1),
+        }
+        assert not compiled.is_static
+
+    def test_static_params(self) -> None:
+        assert compile_template({"a": 1, "b": ["x", {"c": "y"}]}).is_static
+
+    def test_same_result_as_full_walk(self, resolver: TemplateResolver) -> None:
+        compiled = compile_template(self._PARAMS)
+        assert resolver.resolve(self._PARAMS, compiled) == resolver.resolve(self._PARAMS)
+
+    def test_untouched_subtrees_are_shared(self, resolver: TemplateResolver) -> None:
+        resolved = resolver.resolve(self._PARAMS, compile_template(self._PARAMS))
+        assert resolved is not self._PARAMS
+        assert resolved["body"] is self._PARAMS["body"]
+        # Containers on a slot path are copied, never mutated in place.
+        assert resolved["nested"] is not self._PARAMS["nested"]
+        assert resolved["nested"]["items"] is not self._PARAMS["nested"]["items"]
+        assert self._PARAMS["nested"]["items"][1] == "{{result.a2.rows}}"
+        assert resolved["nested"]["items"][1] == [{"name": "Alice"}, {"name": "Bob"}]
+
+    def test_type_preserved_for_whole_expression(self, resolver: TemplateResolver) -> None:
+        params = {"n": "{{result.a1.size}}"}
+        assert resolver.resolve(params, compile_template(params)) == {"n": 42}
+
+    def test_errors_match_full_walk(self, resolver: TemplateResolver) -> None:
+        params = {"x": {"y": "{{result.missing.field}}"}}
+        with pytest.raises(TemplateResolutionError, match="has not produced a result"):
+            resolver.resolve(params, compile_template(params))
+
+    def test_action_caches_compiled_params(self) -> None:
+        from llmos_bridge.protocol.parser import IMLParser
+
+        plan = IMLParser().parse(
+            {
+                "protocol_version": "2.0",
+                "description": "compiled",
+                "actions": [
+                    {
+                        "id": "a1",
+                        "module": "filesystem",
+                        "action": "read_file",
+                        "params": {"path": "{{env.HOME}}"},
+                    }
+                ],
+            }
+        )
+        action = plan.actions[0]
+        assert action._compiled_params is not None
+        assert action.compiled_params() is action.compiled_params()
+        assert [slot.path for slot in action.compiled_params().slots] == [("path",)]
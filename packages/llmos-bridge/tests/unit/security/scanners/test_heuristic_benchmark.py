@@ -0,0 +1,92 @@
+"""Benchmark — HeuristicScanner on serialised plans of realistic size.
+
+Compares the anchor-prefiltered :meth:`HeuristicScanner.scan` with the
+previous implementation that ran every enabled rule over the whole input.
+Run with ``pytest -m slow -s`` to see the timings; only the verdicts are
+asserted, never the speed-up.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import unicodedata
+
+import pytest
+
+from llmos_bridge.security.scanners.heuristic import HeuristicScanner
+
+_WORDS = (
+    "the quarterly report summary includes revenue totals per region and "
+    "customer invoice shipping order status table select from where create "
+    "directory path value user name project draft review meeting notes"
+).split()
+
+# (actions per plan, words of content per action)
+_PLAN_SIZES = [(3, 40), (20, 120), (50, 250)]
+_ROUNDS = 5
+
+
+def _plan(n_actions: int, n_words: int, rng: random.Random) -> str:
+    actions = []
+    for i in range(n_actions):
+        actions.append({
+            "id": f"a{i}",
+            "module": "filesystem",
+            "action": "write_file",
+            "params": {
+                "path": f"/home/user/reports/section_{i}.md",
+                "content": " ".join(rng.choice(_WORDS) for _ in range(n_words)),
+            },
+            "depends_on": [f"a{i - 1}"] if i else [],
+        })
+    return json.dumps({
+        "plan_id": "bench",
+        "protocol_version": "2.0",
+        "description": "Generate the quarterly reports",
+        "actions": actions,
+    })
+
+
+def _legacy_matches(scanner: HeuristicScanner, text: str) -> list[str]:
+    """Reference implementation: every enabled rule over the whole input."""
+    normalized = unicodedata.normalize("NFKC", text)
+    zero_width = frozenset("\u200b\u200c\u200d\ufeff\u00ad\u2060")
+    normalized = "".join(ch for ch in normalized if ch not in zero_width)
+    matched = [
+        rule.id
+        for rule in scanner.patterns
+        if rule.enabled and rule.pattern.search(normalized)
+    ]
+    if HeuristicScanner._check_base64_payloads(text) > 0:
+        matched.append("base64_decoded_suspicious")
+    return matched
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_scan_realistic_plans() -> None:
+    rng = random.Random(42)
+    scanner = HeuristicScanner()
+    await scanner.scan("warm-up")  # builds the anchor index once
+    print()
+    for n_actions, n_words in _PLAN_SIZES:
+        text = _plan(n_actions, n_words, rng)
+
+        t0 = time.perf_counter()
+        for _ in range(_ROUNDS):
+            expected = _legacy_matches(scanner, text)
+        legacy_ms = (time.perf_counter() - t0) * 1000 / _ROUNDS
+
+        t0 = time.perf_counter()
+        for _ in range(_ROUNDS):
+            result = await scanner.scan(text)
+        prefiltered_ms = (time.perf_counter() - t0) * 1000 / _ROUNDS
+
+        print(
+            f"actions={n_actions:<3} bytes={len(text):<7} "
+            f"legacy={legacy_ms:>9.2f} ms  prefiltered={prefiltered_ms:>7.2f} ms  "
+            f"({legacy_ms / prefiltered_ms:.0f}x)"
+        )
+        assert result.matched_patterns == expected
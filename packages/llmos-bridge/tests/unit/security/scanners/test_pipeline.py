@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -13,7 +16,11 @@ from llmos_bridge.security.scanners.base import (
     ScanResult,
     ScanVerdict,
 )
-from llmos_bridge.security.scanners.pipeline import PipelineResult, SecurityPipeline
+from llmos_bridge.security.scanners.pipeline import (
+    PipelineResult,
+    ScanResultCache,
+    SecurityPipeline,
+)
 from llmos_bridge.security.scanners.registry import ScannerRegistry
 
 
@@ -429,3 +436,248 @@ class TestPipelineSerialization:
         assert data["description"] == "serialize test"
         assert len(data["actions"]) == 1
         assert data["actions"][0]["module"] == "filesystem"
+
+
+# ---------------------------------------------------------------------------
+# Pipeline — incremental per-fragment scanning
+# ---------------------------------------------------------------------------
+
+
+class _RecordingScanner(InputScanner):
+    """Records every text it is asked to scan; rejects texts containing 'evil'."""
+
+    scanner_id = "rec"  # type: ignore[assignment]
+    priority = 10  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    async def scan(self, text: str, context: ScanContext | None = None) -> ScanResult:
+        self.texts.append(text)
+        if "evil" in text:
+            return ScanResult(
+                scanner_id=self.scanner_id, verdict=ScanVerdict.REJECT,
+                risk_score=0.9, threat_types=["custom"],
+                details="evil found", matched_patterns=["evil"],
+            )
+        return ScanResult(scanner_id=self.scanner_id, verdict=ScanVerdict.ALLOW)
+
+
+def _multi_plan(plan_id: str, *paths: str) -> IMLPlan:
+    return IMLPlan(
+        plan_id=plan_id,
+        description="read things",
+        actions=[
+            IMLAction(id=f"a{i}", action="read_file", module="filesystem", params={"path": p})
+            for i, p in enumerate(paths)
+        ],
+    )
+
+
+def _cached_pipeline(*scanners: InputScanner, **kwargs: Any) -> SecurityPipeline:
+    return SecurityPipeline(registry=_registry(*scanners), cache_size=64, **kwargs)
+
+
+@pytest.mark.unit
+class TestPipelineScanCache:
+    @pytest.mark.asyncio
+    async def test_scans_per_fragment(self) -> None:
+        rec = _RecordingScanner()
+        p = _cached_pipeline(rec)
+        result = await p.scan_input(_multi_plan("p1", "/a", "/b"))
+        assert result.allowed
+        # Description fragment + one per action.
+        assert len(rec.texts) == 3
+        assert result.scanner_results[0].metadata == {"fragments": 3, "cache_hits": 0}
+
+    @pytest.mark.asyncio
+    async def test_resubmission_only_scans_changed_action(self) -> None:
+        rec = _RecordingScanner()
+        p = _cached_pipeline(rec)
+        await p.scan_input(_multi_plan("p1", "/a", "/b", "/c"))
+        rec.texts.clear()
+
+        result = await p.scan_input(_multi_plan("p2", "/a", "/b", "/changed"))
+        assert len(rec.texts) == 1
+        assert "/changed" in rec.texts[0]
+        assert result.scanner_results[0].metadata["cache_hits"] == 3
+
+        stats = p.status()["scan_cache"]
+        assert stats["hits"] == 3
+        assert stats["misses"] == 5
+        assert stats["hit_rate"] == pytest.approx(3 / 8, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_merged_result_from_cache(self) -> None:
+        rec = _RecordingScanner()
+        p = _cached_pipeline(rec, fail_fast=False)
+        first = await p.scan_input(_multi_plan("p1", "/ok", "/evil"))
+        second = await p.scan_input(_multi_plan("p2", "/ok", "/evil"))
+        for result in (first, second):
+            assert not result.allowed
+            merged = result.scanner_results[0]
+            assert merged.verdict == ScanVerdict.REJECT
+            assert merged.risk_score == 0.9
+            assert merged.matched_patterns == ["evil"]
+            assert merged.threat_types == ["custom"]
+            assert merged.details == "action a1: evil found"
+        assert second.scanner_results[0].scan_duration_ms == 0.0
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_stops_fragment_loop(self) -> None:
+        rec = _RecordingScanner()
+        p = _cached_pipeline(rec)
+        await p.scan_input(_multi_plan("p1", "/evil", "/b", "/c"))
+        assert len(rec.texts) == 2  # description + first action
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self) -> None:
+        rec = _RecordingScanner()
+        p = SecurityPipeline(registry=_registry(rec), cache_size=64, cache_ttl_seconds=0.01)
+        await p.scan_input(_multi_plan("p1", "/a"))
+        time.sleep(0.02)
+        await p.scan_input(_multi_plan("p1", "/a"))
+        assert len(rec.texts) == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self) -> None:
+        p = _cached_pipeline(_ErrorScanner())
+        await p.scan_input(_plan())
+        assert p.cache is not None and p.cache.size == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_cache(self) -> None:
+        rec = _RecordingScanner()
+        p = _cached_pipeline(rec)
+        await p.scan_input(_plan())
+        p.clear_cache()
+        await p.scan_input(_plan())
+        assert len(rec.texts) == 4
+
+    def test_lru_eviction(self) -> None:
+        cache = ScanResultCache(max_entries=2, ttl_seconds=0)
+        r = ScanResult(scanner_id="s", verdict=ScanVerdict.ALLOW)
+        cache.put(("s", "1", "a"), r)
+        cache.put(("s", "1", "b"), r)
+        assert cache.get(("s", "1", "a")) is r  # 'b' becomes LRU
+        cache.put(("s", "1", "c"), r)
+        assert cache.get(("s", "1", "b")) is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_status_without_cache(self) -> None:
+        assert _pipeline().status()["scan_cache"] is None
+
+
+# ---------------------------------------------------------------------------
+# Pipeline — parallel execution and deadlines
+# ---------------------------------------------------------------------------
+
+
+class _SlowScanner(InputScanner):
+    """Sleeps before returning a fixed verdict; records cancellation."""
+
+    def __init__(
+        self, sid: str, delay: float, verdict: ScanVerdict = ScanVerdict.ALLOW,
+        risk: float = 0.0, priority: int = 10,
+    ) -> None:
+        self.scanner_id = sid  # type: ignore[misc]
+        self.priority = priority  # type: ignore[misc]
+        self._delay = delay
+        self._verdict = verdict
+        self._risk = risk
+        self.cancelled = False
+
+    async def scan(self, text: str, context: ScanContext | None = None) -> ScanResult:
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return ScanResult(scanner_id=self.scanner_id, verdict=self._verdict, risk_score=self._risk)
+
+
+@pytest.mark.unit
+class TestPipelineParallel:
+    @pytest.mark.asyncio
+    async def test_latencies_overlap(self) -> None:
+        p = SecurityPipeline(
+            registry=_registry(
+                _SlowScanner("a", 0.1, priority=10),
+                _SlowScanner("b", 0.1, priority=20),
+                _SlowScanner("c", 0.1, priority=30),
+            ),
+            parallel=True,
+        )
+        t0 = time.perf_counter()
+        result = await p.scan_input(_plan())
+        assert time.perf_counter() - t0 < 0.25
+        assert result.allowed
+        assert [r.scanner_id for r in result.scanner_results] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_cancels_remaining(self) -> None:
+        slow = _SlowScanner("slow", 5.0, priority=10)
+        p = SecurityPipeline(
+            registry=_registry(slow, _SlowScanner("fast", 0.0, ScanVerdict.REJECT, 0.9, 20)),
+            parallel=True,
+        )
+        t0 = time.perf_counter()
+        result = await p.scan_input(_plan())
+        assert time.perf_counter() - t0 < 1.0
+        assert not result.allowed
+        assert result.short_circuited
+        assert [r.scanner_id for r in result.scanner_results] == ["fast"]
+        assert slow.cancelled
+
+    @pytest.mark.asyncio
+    async def test_no_fail_fast_waits_for_all(self) -> None:
+        p = SecurityPipeline(
+            registry=_registry(
+                _SlowScanner("reject", 0.0, ScanVerdict.REJECT, 0.9, 10),
+                _SlowScanner("slow", 0.05, ScanVerdict.WARN, 0.4, 20),
+            ),
+            parallel=True,
+            fail_fast=False,
+        )
+        result = await p.scan_input(_plan())
+        assert [r.scanner_id for r in result.scanner_results] == ["reject", "slow"]
+        assert not result.short_circuited
+
+    @pytest.mark.asyncio
+    async def test_deadline_degrades_to_warn(self) -> None:
+        slow = _SlowScanner("slow", 5.0)
+        p = SecurityPipeline(registry=_registry(slow), scanner_timeout=0.05)
+        t0 = time.perf_counter()
+        result = await p.scan_input(_plan())
+        assert time.perf_counter() - t0 < 1.0
+        assert result.allowed
+        assert result.aggregate_verdict == ScanVerdict.WARN
+        scan = result.scanner_results[0]
+        assert scan.verdict == ScanVerdict.WARN
+        assert scan.metadata == {"timed_out": True}
+        assert slow.cancelled
+        assert p.status()["latency"]["slow"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_in_parallel_mode(self) -> None:
+        p = SecurityPipeline(
+            registry=_registry(
+                _SlowScanner("ok", 0.0, priority=10),
+                _SlowScanner("slow", 5.0, priority=20),
+            ),
+            parallel=True,
+            scanner_timeout=0.05,
+        )
+        result = await p.scan_input(_plan())
+        verdicts = {r.scanner_id: r.verdict for r in result.scanner_results}
+        assert verdicts == {"ok": ScanVerdict.ALLOW, "slow": ScanVerdict.WARN}
+
+    @pytest.mark.asyncio
+    async def test_latency_percentiles_in_status(self) -> None:
+        p = _pipeline(_FixedScanner("s1", ScanVerdict.ALLOW))
+        for _ in range(5):
+            await p.scan_input(_plan())
+        latency = p.status()["latency"]["s1"]
+        assert latency["count"] == 5
+        assert 0.0 <= latency["p50_ms"] <= latency["p95_ms"] <= latency["max_ms"]
+        assert latency["timeouts"] == 0
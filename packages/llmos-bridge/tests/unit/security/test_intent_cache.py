@@ -0,0 +1,237 @@
+"""Unit tests -- shared IntentVerifier cache backends and plan-shape reuse."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from llmos_bridge.protocol.models import IMLAction, IMLPlan
+from llmos_bridge.security.intent_cache import (
+    RedisIntentCache,
+    ShapeReusePolicy,
+    SQLiteIntentCache,
+    plan_shape_hash,
+)
+from llmos_bridge.security.intent_verifier import IntentVerifier
+from llmos_bridge.security.llm_client import LLMClient, LLMMessage, LLMResponse
+
+
+class _CountingLLM(LLMClient):
+    def __init__(self, verdict: str = "approve", risk: str = "low") -> None:
+        self._response = json.dumps({"verdict": verdict, "risk_level": risk, "reasoning": "ok"})
+        self.call_count = 0
+
+    async def chat(
+        self,
+        messages: list[LLMMessage],
+        *,
+        temperature: float = 0.0,
+        max_tokens: int = 2048,
+        timeout: float = 30.0,
+    ) -> LLMResponse:
+        self.call_count += 1
+        return LLMResponse(content=self._response, model="mock")
+
+    async def close(self) -> None:
+        pass
+
+
+class _DictCacheClient:
+    """Minimal stand-in for CacheClient."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> Any | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    async def delete_pattern(self, pattern: str) -> int:
+        prefix = pattern.rstrip("*")
+        keys = [k for k in self.data if k.startswith(prefix)]
+        for k in keys:
+            del self.data[k]
+        return len(keys)
+
+
+def _plan(plan_id: str = "p1", path: str = "/tmp/a.txt", module: str = "filesystem") -> IMLPlan:
+    return IMLPlan(
+        plan_id=plan_id,
+        description="test",
+        actions=[
+            IMLAction(id=f"{plan_id}-read", module=module, action="read_file", params={"path": path}),
+            IMLAction(
+                id=f"{plan_id}-write",
+                module=module,
+                action="write_file",
+                params={"path": "/tmp/out.txt", "content": "{{result." + plan_id + "-read.content}}"},
+                depends_on=[f"{plan_id}-read"],
+            ),
+        ],
+    )
+
+
+@pytest.mark.unit
+class TestSQLiteIntentCache:
+    async def test_roundtrip_and_persistence(self, tmp_path: Path) -> None:
+        db = tmp_path / "intent.db"
+        cache = SQLiteIntentCache(db)
+        await cache.set("k", {"verdict": "approve"}, ttl=0)
+        await cache.close()
+
+        reopened = SQLiteIntentCache(db)
+        assert await reopened.get("k") == {"verdict": "approve"}
+        assert await reopened.get("missing") is None
+        await reopened.close()
+
+    async def test_expired_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = SQLiteIntentCache(tmp_path / "intent.db")
+        await cache.set("k", {"verdict": "approve"}, ttl=0)
+        await cache.set("k2", {"verdict": "approve"}, ttl=0.001)
+        await asyncio.sleep(0.01)
+        assert await cache.get("k") == {"verdict": "approve"}
+        assert await cache.get("k2") is None
+        await cache.close()
+
+    async def test_clear(self, tmp_path: Path) -> None:
+        cache = SQLiteIntentCache(tmp_path / "intent.db")
+        await cache.set("k", {"verdict": "approve"}, ttl=0)
+        await cache.clear()
+        assert await cache.get("k") is None
+        await cache.close()
+
+
+@pytest.mark.unit
+class TestRedisIntentCache:
+    async def test_prefix_ttl_and_clear(self) -> None:
+        client = _DictCacheClient()
+        cache = RedisIntentCache(client, prefix="t:")  # type: ignore[arg-type]
+        await cache.set("k", {"verdict": "approve"}, ttl=0.5)
+        assert client.ttls == {"t:k": 1}
+        assert await cache.get("k") == {"verdict": "approve"}
+        await cache.clear()
+        assert await cache.get("k") is None
+
+
+@pytest.mark.unit
+class TestPlanShape:
+    def test_ignores_plan_and_action_ids(self) -> None:
+        policy = ShapeReusePolicy()
+        p1 = IMLPlan(plan_id="x", description="t", actions=[IMLAction(id="a", module="m", action="f", params={})])
+        p2 = IMLPlan(plan_id="y", description="t", actions=[IMLAction(id="b", module="m", action="f", params={})])
+        assert plan_shape_hash(p1, policy) == plan_shape_hash(p2, policy)
+
+    def test_volatile_values_normalised(self) -> None:
+        policy = ShapeReusePolicy()
+
+        def plan(ts: str, rid: str) -> IMLPlan:
+            return IMLPlan(description="t", actions=[IMLAction(
+                id="a", module="m", action="f",
+                params={"note": f"run at {ts}", "request_id": rid},
+            )])
+
+        assert plan_shape_hash(
+            plan("2026-01-01T10:00:00Z", "r1"), policy
+        ) == plan_shape_hash(plan("2026-02-03 11:30", "r2"), policy)
+
+    def test_literals_templated_only_when_enabled(self) -> None:
+        exact = ShapeReusePolicy()
+        templated = ShapeReusePolicy(template_literals=True)
+        assert plan_shape_hash(_plan(path="/a"), exact) != plan_shape_hash(_plan(path="/b"), exact)
+        assert plan_shape_hash(_plan(path="/a"), templated) == plan_shape_hash(
+            _plan(path="/b"), templated
+        )
+
+    def test_literal_modules_keep_values(self) -> None:
+        policy = ShapeReusePolicy(template_literals=True, literal_modules=frozenset({"os_exec"}))
+        assert plan_shape_hash(_plan(path="/a", module="os_exec"), policy) != plan_shape_hash(
+            _plan(path="/b", module="os_exec"), policy
+        )
+
+    def test_default_literal_modules_keep_file_paths(self) -> None:
+        from llmos_bridge.config import IntentVerifierConfig
+
+        modules = frozenset(IntentVerifierConfig().shape_literal_modules)
+        policy = ShapeReusePolicy(template_literals=True, literal_modules=modules)
+        assert plan_shape_hash(_plan(path="/tmp/a", module="filesystem"), policy) != plan_shape_hash(
+            _plan(path="/etc/shadow", module="filesystem"), policy
+        )
+
+    def test_policy_allows(self) -> None:
+        policy = ShapeReusePolicy(verdicts=frozenset({"approve", "warn"}), max_risk="medium")
+        assert policy.allows({"verdict": "approve", "risk_level": "low"})
+        assert policy.allows({"verdict": "warn", "risk_level": "medium"})
+        assert not policy.allows({"verdict": "warn", "risk_level": "high"})
+        assert not policy.allows({"verdict": "reject", "risk_level": "low"})
+
+
+@pytest.mark.unit
+class TestVerifierSharedCache:
+    async def test_backend_shared_across_verifiers(self, tmp_path: Path) -> None:
+        db = tmp_path / "intent.db"
+        first_llm, second_llm = _CountingLLM(), _CountingLLM()
+        first = IntentVerifier(llm_client=first_llm, cache_backend=SQLiteIntentCache(db))
+        second = IntentVerifier(llm_client=second_llm, cache_backend=SQLiteIntentCache(db))
+
+        assert (await first.verify_plan(_plan())).cached is False
+        result = await second.verify_plan(_plan())
+        assert result.cached is True
+        assert second_llm.call_count == 0
+        assert second.status()["cache_backend"] == "sqlite"
+        await first.close()
+        await second.close()
+
+    async def test_shape_hit_reuses_approved_verdict(self) -> None:
+        llm = _CountingLLM()
+        verifier = IntentVerifier(
+            llm_client=llm,
+            cache_backend=RedisIntentCache(_DictCacheClient()),  # type: ignore[arg-type]
+            shape_policy=ShapeReusePolicy(template_literals=True),
+        )
+        await verifier.verify_plan(_plan(path="/tmp/a.txt"))
+        result = await verifier.verify_plan(_plan(path="/tmp/b.txt"))
+        assert result.cached is True
+        assert llm.call_count == 1
+
+    async def test_shape_hit_not_reused_outside_policy(self) -> None:
+        llm = _CountingLLM(verdict="warn", risk="medium")
+        verifier = IntentVerifier(
+            llm_client=llm, shape_policy=ShapeReusePolicy(template_literals=True)
+        )
+        await verifier.verify_plan(_plan(path="/tmp/a.txt"))
+        result = await verifier.verify_plan(_plan(path="/tmp/b.txt"))
+        assert result.cached is False
+        assert llm.call_count == 2
+
+    async def test_prompt_change_misses_shared_entries(self) -> None:
+        client = _DictCacheClient()
+        llm = _CountingLLM()
+        verifier = IntentVerifier(
+            llm_client=llm,
+            cache_backend=RedisIntentCache(client),  # type: ignore[arg-type]
+        )
+        await verifier.verify_plan(_plan())
+        verifier.clear_cache()
+        verifier._get_system_prompt = lambda: "a different prompt"  # type: ignore[method-assign]
+        assert (await verifier.verify_plan(_plan())).cached is False
+        assert llm.call_count == 2
+
+    async def test_clear_shared_cache(self) -> None:
+        client = _DictCacheClient()
+        llm = _CountingLLM()
+        verifier = IntentVerifier(
+            llm_client=llm,
+            cache_backend=RedisIntentCache(client),  # type: ignore[arg-type]
+        )
+        await verifier.verify_plan(_plan())
+        await verifier.clear_shared_cache()
+        assert client.data == {}
+        assert (await verifier.verify_plan(_plan())).cached is False
@@ -240,3 +240,86 @@ class TestPermissionStore:
             assert await store.is_granted("filesystem.write", "filesystem") is True
         finally:
             await store.close()
+
+
+@pytest.mark.unit
+class TestPermissionStoreMirror:
+    """The in-memory grant mirror and its write-through behaviour."""
+
+    @pytest.fixture
+    async def store(self, tmp_path: Path):
+        s = PermissionStore(tmp_path / "permissions.db")
+        await s.init()
+        yield s
+        await s.close()
+
+    @staticmethod
+    async def _db_rows(store: PermissionStore) -> list[tuple]:
+        assert store._conn is not None
+        async with store._conn.execute(
+            "SELECT permission, module_id, app_id FROM permission_grants ORDER BY permission"
+        ) as cur:
+            return list(await cur.fetchall())
+
+    async def test_reads_do_no_io(self, store: PermissionStore, monkeypatch) -> None:
+        await store.grant(_grant("filesystem.write", "filesystem"))
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("unexpected SQL on the read path")
+
+        monkeypatch.setattr(store._conn, "execute", _fail)
+        assert await store.is_granted("filesystem.write", "filesystem") is True
+        assert await store.is_granted("filesystem.read", "filesystem") is False
+        assert (await store.get_grant("filesystem.write", "filesystem")) is not None
+
+    async def test_app_scoped_grants(self, store: PermissionStore) -> None:
+        await store.grant(_grant("filesystem.write", "filesystem"), app_id="app-1")
+        assert await store.is_granted("filesystem.write", "filesystem", app_id="app-1") is True
+        assert await store.is_granted("filesystem.write", "filesystem") is False
+        grant = await store.get_grant("filesystem.write", "filesystem", app_id="app-1")
+        assert grant is not None and grant.app_id == "app-1"
+        assert await self._db_rows(store) == [("filesystem.write", "filesystem", "app-1")]
+
+    async def test_expiry_writes_through(self, store: PermissionStore) -> None:
+        await store.grant(_grant("filesystem.write", "filesystem", expires_at=time.time() + 0.05))
+        await store.grant(_grant("filesystem.read", "filesystem"))
+        assert await store.is_granted("filesystem.write", "filesystem") is True
+        time.sleep(0.1)
+        assert await store.is_granted("filesystem.write", "filesystem") is False
+        assert await self._db_rows(store) == [("filesystem.read", "filesystem", "default")]
+
+    async def test_regrant_supersedes_old_expiry(self, store: PermissionStore) -> None:
+        await store.grant(_grant("filesystem.write", "filesystem", expires_at=time.time() + 0.05))
+        await store.grant(_grant("filesystem.write", "filesystem", expires_at=time.time() + 60))
+        time.sleep(0.1)
+        assert await store.is_granted("filesystem.write", "filesystem") is True
+
+    async def test_clear_session_updates_mirror(self, store: PermissionStore) -> None:
+        await store.grant(_grant("filesystem.read", "filesystem", scope=PermissionScope.SESSION))
+        await store.grant(_grant("filesystem.write", "filesystem", scope=PermissionScope.PERMANENT))
+        assert await store.clear_session() == 1
+        assert await store.is_granted("filesystem.read", "filesystem") is False
+        assert await store.is_granted("filesystem.write", "filesystem") is True
+
+    async def test_expired_rows_dropped_on_load(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "permissions.db"
+        first = PermissionStore(db_path)
+        await first.init()
+        await first.grant(_grant(
+            "filesystem.write", "filesystem",
+            scope=PermissionScope.PERMANENT, expires_at=time.time() - 1,
+        ))
+        await first.close()
+
+        second = PermissionStore(db_path)
+        await second.init()
+        try:
+            assert await self._db_rows(second) == []
+        finally:
+            await second.close()
+
+    async def test_heap_compaction_keeps_live_entries(self, store: PermissionStore) -> None:
+        for i in range(200):
+            await store.grant(_grant("filesystem.write", "filesystem", expires_at=time.time() + 60 + i))
+        assert len(store._expiry_heap) <= 2 * len(store._grants) + 64
+        assert await store.is_granted("filesystem.write", "filesystem") is True
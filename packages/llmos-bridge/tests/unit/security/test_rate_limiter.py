@@ -9,10 +9,12 @@ Tests cover:
   - get_counts accuracy
   - timestamp pruning via time patching
   - independent action keys
+  - bucketed windows vs. exact sliding-window semantics (randomised)
 """
 
 from __future__ import annotations
 
+import random
 from unittest.mock import patch
 
 import pytest
@@ -85,15 +87,14 @@ class TestActionRateLimiter:
         assert counts["hour"] == 4
 
     def test_old_timestamps_are_pruned(self) -> None:
-        """Timestamps older than 1 hour are pruned on check."""
+        """Timestamps older than 1 hour (plus one 60s bucket) are pruned on check."""
         limiter = ActionRateLimiter()
         old_time = 1000.0
-        recent_time = old_time + 3601.0  # 1 hour + 1 second later
-
-        # Inject an old timestamp directly
-        limiter._timestamps["fs.write"] = [old_time]
+        recent_time = old_time + 3661.0  # 1 hour + 1 bucket + 1 second later
 
         with patch("llmos_bridge.security.rate_limiter.time") as mock_time:
+            mock_time.time.return_value = old_time
+            limiter.record("fs.write")
             mock_time.time.return_value = recent_time
             counts = limiter.get_counts("fs.write")
 
@@ -109,3 +110,98 @@ class TestActionRateLimiter:
 
         assert limiter.check("module_a.action", calls_per_minute=5) is False
         assert limiter.check("module_b.action", calls_per_minute=5) is True
+
+
+# ---------------------------------------------------------------------------
+# Bucketed counters vs. the exact sliding window
+# ---------------------------------------------------------------------------
+
+
+class _ExactLimiter:
+    """Reference: the original list-of-timestamps limiter."""
+
+    def __init__(self) -> None:
+        self.timestamps: list[float] = []
+
+    def count(self, now: float, window: float) -> int:
+        return sum(1 for t in self.timestamps if now - window < t <= now)
+
+    def allowed(self, now: float, per_minute: int | None, per_hour: int | None) -> bool:
+        if per_minute is not None and self.count(now, 60.0) >= per_minute:
+            return False
+        if per_hour is not None and self.count(now, 3600.0) >= per_hour:
+            return False
+        return True
+
+
+class TestBucketedWindowsProperty:
+    """Counts are bracketed by the exact window and the window plus one bucket.
+
+    That makes the limiter conservative: it never admits a call the exact
+    sliding window would refuse, and it only refuses early when the calls
+    in the extra bucket-width push the count to the limit.
+    """
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_exact_semantics_within_one_bucket(self, seed: int) -> None:
+        rng = random.Random(seed)
+        limiter = ActionRateLimiter()
+        exact = _ExactLimiter()
+        now = 1_700_000_000.0 + rng.random() * 1000
+        with patch("llmos_bridge.security.rate_limiter.time") as mock_time:
+            for _ in range(600):
+                now += rng.choice([0.0, rng.random(), rng.random() * 10, rng.random() * 300])
+                mock_time.time.return_value = now
+                per_minute = rng.choice([None, 1, 5, 20])
+                per_hour = rng.choice([None, 10, 50, 200])
+
+                counts = limiter.get_counts("k")
+                assert exact.count(now, 60.0) <= counts["minute"] <= exact.count(now, 61.0)
+                assert exact.count(now, 3600.0) <= counts["hour"] <= exact.count(now, 3660.0)
+
+                allowed = limiter.check("k", calls_per_minute=per_minute, calls_per_hour=per_hour)
+                if allowed:
+                    assert exact.allowed(now, per_minute, per_hour)
+                elif exact.allowed(now, per_minute, per_hour):
+                    # Refused early: only by calls within one bucket past the window.
+                    assert not (
+                        (per_minute is None or exact.count(now, 61.0) < per_minute)
+                        and (per_hour is None or exact.count(now, 3660.0) < per_hour)
+                    )
+
+                if rng.random() < 0.7:
+                    try:
+                        limiter.check_or_raise(
+                            "k", calls_per_minute=per_minute, calls_per_hour=per_hour
+                        )
+                    except RateLimitExceededError:
+                        assert not allowed
+                    else:
+                        assert allowed
+                        exact.timestamps.append(now)
+                else:
+                    limiter.record("k")
+                    exact.timestamps.append(now)
+
+    def test_clock_step_back_counts_into_newest_bucket(self) -> None:
+        limiter = ActionRateLimiter()
+        with patch("llmos_bridge.security.rate_limiter.time") as mock_time:
+            mock_time.time.return_value = 5000.0
+            limiter.record("k")
+            mock_time.time.return_value = 4990.0
+            limiter.record("k")
+            mock_time.time.return_value = 5000.0
+            assert limiter.get_counts("k") == {"minute": 2, "hour": 2}
+
+    def test_memory_is_bounded(self) -> None:
+        limiter = ActionRateLimiter()
+        with patch("llmos_bridge.security.rate_limiter.time") as mock_time:
+            for i in range(10_000):
+                mock_time.time.return_value = 1000.0 + i * 0.1
+                limiter.record("k")
+            counters = limiter._counters["k"]
+            assert len(counters.minute._counts) == 61
+            assert len(counters.hour._counts) == 61
+            counts = limiter.get_counts("k")
+            assert 600 <= counts["minute"] <= 610
+            assert counts["hour"] == 10_000
@@ -0,0 +1,105 @@
+"""Benchmark — OutputSanitizer on large database / excel results.
+
+Compares the identity-preserving :meth:`OutputSanitizer.sanitize` with the
+previous implementation that copied every container and ran NFKC plus each
+injection regex on every string.  Run with ``pytest -m slow -s`` to see the
+timings; only the results are asserted, never the speed-up.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+import unicodedata
+
+import pytest
+
+from llmos_bridge.security.sanitizer import _INJECTION_PATTERNS, OutputSanitizer
+
+_ROWS = 10_000
+_ROUNDS = 3
+_NAMES = ["alice", "bob", "carol", "dave", "Zoë", "erin", "frank"]
+_CITIES = ["Paris", "Berlin", "Lagos", "Tokyo", "São Paulo", "Austin"]
+
+
+def _database_result(rng: random.Random) -> dict[str, Any]:
+    columns = ["id", "name", "city", "amount", "created_at", "active", "notes"]
+    rows = [
+        {
+            "id": i,
+            "name": rng.choice(_NAMES),
+            "city": rng.choice(_CITIES),
+            "amount": str(round(rng.uniform(0, 10_000), 2)),
+            "created_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "active": rng.random() < 0.5,
+            "notes": None if rng.random() < 0.7 else "follow up next quarter",
+        }
+        for i in range(_ROWS)
+    ]
+    return {
+        "columns": columns,
+        "rows": rows,
+        "row_count": len(rows),
+        "truncated": False,
+        "elapsed_ms": 12.5,
+        "connection_id": "bench",
+    }
+
+
+def _excel_result(rng: random.Random) -> dict[str, Any]:
+    data = [
+        [f"SKU-{i:05d}", rng.choice(_CITIES), rng.randint(0, 500), str(rng.random()), "=B2*C2"]
+        for i in range(_ROWS)
+    ]
+    return {"sheet": "Inventory", "range": f"A1:E{_ROWS}", "data": data, "row_count": _ROWS, "col_count": 5}
+
+
+class _LegacySanitizer(OutputSanitizer):
+    """Reference implementation: copy every container, scan every string."""
+
+    def _clean(self, value: Any, depth: int, module: str, action: str) -> Any:
+        if depth > self._max_depth:
+            return "[TRUNCATED: max depth exceeded]"
+        if isinstance(value, str):
+            value = unicodedata.normalize("NFKC", value)
+            for pattern in _INJECTION_PATTERNS:
+                if pattern.search(value):
+                    value = pattern.sub("[REDACTED:injection-pattern]", value)
+            if len(value) > self._max_str_len:
+                value = value[: self._max_str_len]
+            return value
+        if isinstance(value, dict):
+            return {
+                k: (v if k in self._BINARY_KEYS and isinstance(v, str)
+                    else self._clean(v, depth + 1, module, action))
+                for k, v in value.items()
+            }
+        if isinstance(value, list):
+            return [self._clean(item, depth + 1, module, action) for item in value[: self._max_list_items]]
+        return value
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("make", [_database_result, _excel_result], ids=["database", "excel"])
+def test_sanitize_large_results(make) -> None:
+    result = make(random.Random(7))
+    legacy = _LegacySanitizer(max_list_items=_ROWS)
+    fast = OutputSanitizer(max_list_items=_ROWS)
+
+    t0 = time.perf_counter()
+    for _ in range(_ROUNDS):
+        expected = legacy.sanitize(result)
+    legacy_ms = (time.perf_counter() - t0) * 1000 / _ROUNDS
+
+    t0 = time.perf_counter()
+    for _ in range(_ROUNDS):
+        cleaned = fast.sanitize(result)
+    fast_ms = (time.perf_counter() - t0) * 1000 / _ROUNDS
+
+    print(
+        f"\n{make.__name__:<18} rows={_ROWS} legacy={legacy_ms:>8.2f} ms  "
+        f"fast={fast_ms:>7.2f} ms  ({legacy_ms / fast_ms:.1f}x)"
+    )
+    assert cleaned == expected
+    assert cleaned is result